@@ -15,6 +15,7 @@
 # limitations under the License.
 """Checks needed to determine integrity of datasets."""
 
+import concurrent.futures
 import os
 from collections import defaultdict
 
@@ -68,16 +69,24 @@ def check_missing_files(dataset_gateway: IDatasetGateway, **_):
         Tuple of whether all dataset files are there, if an automated fix is available and string of found problems.
     """
     missing = defaultdict(list)
+    files = []
 
     for dataset in dataset_gateway.get_all_active_datasets():
         # NOTE: Datasets with storage backend don't have local copies of files
         if dataset.storage:
             continue
         for file_ in dataset.files:
-            path = project_context.path / file_.entity.path
-            file_exists = path.exists() or (file_.is_external and os.path.lexists(path))
-            if not file_exists:
-                missing[dataset.slug].append(file_.entity.path)
+            files.append((dataset.slug, file_.entity.path, project_context.path / file_.entity.path, file_.is_external))
+
+    def is_missing(file_) -> bool:
+        _, _, path, is_external = file_
+        return not path.exists() and not (is_external and os.path.lexists(path))
+
+    # NOTE: Stat files in parallel since it's I/O bound, e.g. on network file systems
+    with concurrent.futures.ThreadPoolExecutor() as executor:
+        for (slug, entity_path, _, _), is_missing_ in zip(files, executor.map(is_missing, files)):
+            if is_missing_:
+                missing[slug].append(entity_path)
 
     if not missing:
         return True, False, None
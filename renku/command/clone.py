@@ -16,7 +16,7 @@
 """Clone a Renku repo along with all Renku-specific initializations."""
 
 from pathlib import Path
-from typing import Any, Dict, Optional, Union
+from typing import Any, Dict, List, Optional, Union
 
 from git.remote import RemoteProgress
 from pydantic import ConfigDict, validate_call
@@ -39,6 +39,7 @@ def _project_clone(
     raise_git_except: bool = False,
     checkout_revision: Optional[str] = None,
     use_renku_credentials: bool = False,
+    clone_options: Optional[List[str]] = None,
 ):
     """Clone Renku project repo, install Git hooks and LFS.
 
@@ -55,6 +56,7 @@ def _project_clone(
         raise_git_except(bool): Whether to raise Git exceptions or not (Default value = False).
         checkout_revision(Optional[str]): Specific revision to check out (Default value = None).
         use_renku_credentials(bool): Whether to use credentials stored in renku (Default value = False).
+        clone_options(Optional[List[str]]): Additional clone options (Default value = None).
 
     Returns:
         Tuple of cloned ``Repository`` and whether it's a Renku project or not.
@@ -78,6 +80,7 @@ def _project_clone(
         raise_git_except=raise_git_except,
         checkout_revision=checkout_revision,
         use_renku_credentials=use_renku_credentials,
+        clone_options=clone_options,
     )
 
     with project_context.with_path(repository.path):
@@ -18,7 +18,7 @@
 
 import json
 import os
-from typing import Optional
+from typing import Optional, Tuple
 
 from packaging.version import Version
 
@@ -31,6 +31,8 @@ from renku.core.interface.plan_gateway import IPlanGateway
 from renku.core.interface.project_gateway import IProjectGateway
 from renku.core.interface.storage import IStorageFactory
 from renku.domain_model.project_context import project_context
+from renku.infrastructure.database import Database
+from renku.infrastructure.database_pool import DatabaseKey, database_pool
 from renku.infrastructure.gateway.activity_gateway import ActivityGateway
 from renku.infrastructure.gateway.database_gateway import DatabaseGateway
 from renku.infrastructure.gateway.dataset_gateway import DatasetGateway
@@ -51,6 +53,7 @@ class DatabaseCommand(Command):
         self._path = path
         self._create = create
         self.project_found: bool = False
+        self._pooled_database: Optional[Tuple[Optional[DatabaseKey], Database]] = None
 
     def _injection_pre_hook(self, builder: Command, context: dict, *args, **kwargs) -> None:
         """Create a Database singleton."""
@@ -61,6 +64,9 @@ class DatabaseCommand(Command):
 
         project_context.push_path(path=self._path or project_context.path, save_changes=self._write)
 
+        if database_pool.enabled and not self._write and not self._create:
+            self._lease_database()
+
         project_gateway = ProjectGateway()
 
         context["constructor_bindings"][IPlanGateway] = lambda: PlanGateway()
@@ -107,8 +113,27 @@ class DatabaseCommand(Command):
                 # NOTE: update minimum renku version on write as migrations might happen on the fly
                 project.minimum_renku_version = Project.minimum_renku_version
 
+        if self._pooled_database is not None:
+            key, database = self._pooled_database
+            self._pooled_database = None
+            database_pool.release(key, database, project_context.database_path)
+        elif self._write:
+            database_pool.invalidate(project_context.path)
+
         project_context.pop_context()
 
+    def _lease_database(self) -> None:
+        """Use a database from the pool of read-only databases for the current project."""
+        try:
+            commit_sha = project_context.repository.head.commit.hexsha
+        except (ValueError, errors.GitError):
+            return
+
+        self._pooled_database = database_pool.acquire(
+            path=project_context.path, database_path=project_context.database_path, commit_sha=commit_sha
+        )
+        project_context.database = self._pooled_database[1]
+
     @check_finalized
     def build(self) -> Command:
         """Build the command."""
@@ -15,7 +15,9 @@
 # limitations under the License.
 """Check your system and repository for potential problems."""
 
+import time
 import traceback
+from typing import Dict, Tuple
 
 from pydantic import ConfigDict, validate_call
 
@@ -38,30 +40,56 @@ def _doctor_check(fix: bool, force: bool):
         force(bool): Whether to force-fix some actions.
 
     Returns:
-        Tuple of whether the project is ok or not and list of problems found.
+        Tuple of whether the project is ok or not, whether fixes are available, list of problems found and durations
+        of checks in seconds.
     """
     from renku.command import checks
 
     is_ok = True
     fixes_available = False
     problems = []
+    durations = {}
 
     for check in checks.__all__:
-        try:
-            ok, has_fix, problems_ = getattr(checks, check)(fix=fix, force=force)
-        except Exception:
-            ok = False
-            has_fix = False
-            tb = "\n\t".join(traceback.format_exc().split("\n"))
-            problems_ = f"{ERROR}Exception raised when running {check}\n\t{tb}"
+        ok, has_fix, problems_, duration = _run_check(check, fix=fix, force=force)
 
         is_ok &= ok
         fixes_available |= has_fix
+        durations[check] = duration
 
         if problems_:
             problems.append(problems_)
 
-    return is_ok, fixes_available, "\n".join(problems)
+    return is_ok, fixes_available, "\n".join(problems), durations
+
+
+def _run_check(check: str, fix: bool, force: bool) -> Tuple[bool, bool, str, float]:
+    """Run a check and return its result and duration."""
+    from renku.command import checks
+
+    started = time.monotonic()
+
+    try:
+        ok, has_fix, problems = getattr(checks, check)(fix=fix, force=force)
+    except Exception:
+        ok = False
+        has_fix = False
+        tb = "\n\t".join(traceback.format_exc().split("\n"))
+        problems = f"{ERROR}Exception raised when running {check}\n\t{tb}"
+
+    return ok, has_fix, problems, time.monotonic() - started
+
+
+def format_durations(durations: Dict[str, float]) -> str:
+    """Format durations of checks, slowest first.
+
+    Args:
+        durations(Dict[str, float]): Durations of checks in seconds.
+
+    Returns:
+        str: One line per check.
+    """
+    return "\n".join(f"{duration:8.2f}s  {check}" for check, duration in sorted(durations.items(), key=lambda d: -d[1]))
 
 
 def doctor_check_command(with_fix):
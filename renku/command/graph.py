@@ -16,12 +16,14 @@
 """Knowledge graph building."""
 
 import json
-from typing import Dict, List, Optional, Set, Union
+import threading
+from typing import Dict, List, Optional, Set, Type, Union
 
 from pydantic import ConfigDict, validate_call
 
 from renku.command.command_builder.command import Command, inject
 from renku.command.schema.activity import ActivitySchema, WorkflowFileActivityCollectionSchema
+from renku.command.schema.calamus import JsonLDSchema
 from renku.command.schema.composite_plan import CompositePlanSchema
 from renku.command.schema.dataset import DatasetSchema, DatasetTagSchema
 from renku.command.schema.plan import PlanSchema
@@ -29,6 +31,7 @@ from renku.command.schema.project import ProjectSchema
 from renku.command.schema.workflow_file import WorkflowFileCompositePlanSchema, WorkflowFilePlanSchema
 from renku.command.view_model.graph import GraphViewModel
 from renku.core import errors
+from renku.core.constant import DATABASE_METADATA_PATH
 from renku.core.interface.activity_gateway import IActivityGateway
 from renku.core.interface.database_gateway import IDatabaseGateway
 from renku.core.interface.dataset_gateway import IDatasetGateway
@@ -49,14 +52,43 @@ except ImportError:
     import importlib.resources as importlib_resources  # type: ignore
 
 
+TOMBSTONE_TYPE = "https://swissdatasciencecenter.github.io/renku-ontology#Tombstone"
+
+# NOTE: Order matters, subclasses must come before their base classes
+SCHEMAS = {
+    Project: ProjectSchema,
+    Dataset: DatasetSchema,
+    DatasetTag: DatasetTagSchema,
+    Activity: ActivitySchema,
+    WorkflowFilePlan: WorkflowFilePlanSchema,
+    Plan: PlanSchema,
+    WorkflowFileCompositePlan: WorkflowFileCompositePlanSchema,
+    CompositePlan: CompositePlanSchema,
+    WorkflowFileActivityCollection: WorkflowFileActivityCollectionSchema,
+}
+
+_schemas = threading.local()
+
+
 def export_graph_command():
     """Return a command for exporting graph data."""
     return Command().command(export_graph).with_database(write=False).require_migration()
 
 
+def compact_journal_command():
+    """Return a command for compacting the journal of metadata changes."""
+    return (
+        Command()
+        .command(compact_journal)
+        .with_database(write=False)
+        .require_migration()
+        .with_commit(commit_if_empty=False, commit_only=DATABASE_METADATA_PATH)
+    )
+
+
 @validate_call(config=ConfigDict(arbitrary_types_allowed=True))
 def export_graph(
-    format: str = "json-ld", revision_or_range: Optional[str] = None, strict: bool = False
+    format: str = "json-ld", revision_or_range: Optional[str] = None, strict: bool = False, since: Optional[str] = None
 ) -> GraphViewModel:
     """Output graph in specific format.
 
@@ -64,6 +96,8 @@ def export_graph(
         format(str, optional): Output format (Default value = "json-ld").
         revision_or_range(str, optional): Revision or range of revisions to export for (Default value = None).
         strict(bool, optional): Whether to check generated JSON-LD against the SHACL schema (Default value = False).
+        since(str, optional): Commit of a previous export; only export changes made after it, including tombstones
+            for removed entities (Default value = None).
 
     Returns:
         Renku metadata as string.
@@ -71,7 +105,9 @@ def export_graph(
 
     format = format.lower()
 
-    if revision_or_range:
+    if since:
+        graph = get_graph_for_changes_since(revision=since)
+    elif revision_or_range:
         graph = get_graph_for_revision(revision_or_range=revision_or_range)
     else:
         graph = get_graph_for_all_objects()
@@ -88,6 +124,19 @@ def export_graph(
     return GraphViewModel(graph)
 
 
+@inject.autoparams()
+def compact_journal(database_gateway: IDatabaseGateway) -> int:
+    """Remove all files of the journal of metadata changes.
+
+    Args:
+        database_gateway(IDatabaseGateway): Injected database gateway.
+
+    Returns:
+        int: The number of removed journal files.
+    """
+    return database_gateway.compact_journal()
+
+
 def update_nested_node_host(node: Dict, host: str) -> None:
     """Update all @id in a node to include host if necessary.
 
@@ -138,6 +187,37 @@ def get_graph_for_revision(
     return _convert_entities_to_graph(changed_objects, project)
 
 
+@inject.autoparams()
+def get_graph_for_changes_since(
+    revision: str,
+    database_gateway: IDatabaseGateway,
+    project_gateway: IProjectGateway,
+) -> List[Dict]:
+    """Get the graph for changes made after a revision, e.g. the commit of a previous export.
+
+    Args:
+        revision(str): Revision to export changes since.
+        database_gateway(IDatabaseGateway): Injected database gateway.
+        project_gateway(IProjectGateway): Injected project gateway.
+
+    Returns:
+        List of JSON-LD metadata; removed entities are represented by tombstone nodes.
+    """
+    changes = database_gateway.get_changes_since(revision=revision)
+    if changes is None:
+        # NOTE: Changes made before the project had a change journal can only be found from the repository's history
+        return get_graph_for_revision(revision_or_range=f"{revision}..HEAD")
+
+    modified, removed = changes
+    change_types = (Project, Dataset, DatasetTag, Activity, Plan, CompositePlan)
+    changed_objects = [o for o in modified if isinstance(o, change_types)]
+
+    graph = _convert_entities_to_graph(changed_objects, project_gateway.get_project())
+    graph.extend({"@id": id, "@type": [TOMBSTONE_TYPE]} for id in removed)
+
+    return graph
+
+
 @inject.autoparams()
 def get_graph_for_all_objects(
     project_gateway: IProjectGateway,
@@ -207,18 +287,6 @@ def _convert_entities_to_graph(
         List of JSON-LD metadata.
     """
     graph = []
-    schemas = {
-        Project: ProjectSchema,
-        Dataset: DatasetSchema,
-        DatasetTag: DatasetTagSchema,
-        Activity: ActivitySchema,
-        WorkflowFilePlan: WorkflowFilePlanSchema,
-        Plan: PlanSchema,
-        WorkflowFileCompositePlan: WorkflowFileCompositePlanSchema,
-        CompositePlan: CompositePlanSchema,
-        WorkflowFileActivityCollection: WorkflowFileActivityCollectionSchema,
-    }
-
     processed_plans = set()
     project_id = project.id
 
@@ -233,8 +301,8 @@ def _convert_entities_to_graph(
             if isinstance(entity, (Activity, WorkflowFileActivityCollection)):
                 entity.association.plan.unfreeze()
                 entity.association.plan.project_id = project_id
-        schema = next(s for t, s in schemas.items() if isinstance(entity, t))
-        graph.extend(schema(flattened=True).dump(entity))
+        schema = next(s for t, s in SCHEMAS.items() if isinstance(entity, t))
+        graph.extend(_get_schema(schema).dump(entity))
 
         if not isinstance(entity, (Activity, WorkflowFileActivityCollection)):
             continue
@@ -245,6 +313,28 @@ def _convert_entities_to_graph(
     return graph
 
 
+def _get_schema(schema_class: Type[JsonLDSchema]) -> JsonLDSchema:
+    """Return a schema for dumping flattened JSON-LD.
+
+    Creating a schema (and its nested schemas) takes longer than dumping most entities, so schemas are reused. Nested
+    schemas are created lazily and not in a thread-safe way, so each thread has its own schemas.
+
+    Args:
+        schema_class(Type[JsonLDSchema]): Type of the schema.
+
+    Returns:
+        JsonLDSchema: A schema instance.
+    """
+    if not hasattr(_schemas, "instances"):
+        _schemas.instances = {}
+
+    schema = _schemas.instances.get(schema_class)
+    if schema is None:
+        schema = _schemas.instances[schema_class] = schema_class(flattened=True)
+
+    return schema
+
+
 def get_activity_plan_ids(activity: Activity) -> Set[str]:
     """Get the ids of all plans associated with an activity.
 
@@ -15,7 +15,10 @@
 # limitations under the License.
 """Log of renku commands."""
 
-from typing import List
+import heapq
+import itertools
+from datetime import datetime
+from typing import List, Optional
 
 from pydantic import ConfigDict, validate_call
 
@@ -23,7 +26,6 @@ from renku.command.command_builder import Command, inject
 from renku.command.view_model.log import LogViewModel
 from renku.core.interface.activity_gateway import IActivityGateway
 from renku.core.interface.dataset_gateway import IDatasetGateway
-from renku.domain_model.dataset import Dataset
 
 
 def log_command():
@@ -38,52 +40,39 @@ def _log(
     dataset_gateway: IDatasetGateway,
     workflows_only: bool = False,
     datasets_only: bool = False,
+    limit: Optional[int] = None,
+    since: Optional[datetime] = None,
+    until: Optional[datetime] = None,
 ) -> List[LogViewModel]:
-    """Get a log of renku commands.
+    """Get a log of renku commands from newest to oldest.
+
+    Entries are read from date indexes, so only the activities and dataset versions that are returned are loaded.
 
     Args:
         activity_gateway(IActivityGateway): Injected activity gateway.
         dataset_gateway(IDatasetGateway): Injected dataset gateway.
         workflows_only(bool, optional): Whether to show logs for workflows only (Default value = False).
         datasets_only(bool, optional): Whether to show logs for datasets only (Default value = False).
+        limit(Optional[int], optional): Maximum number of entries to return (Default value = None).
+        since(Optional[datetime], optional): Only return entries from this date on (Default value = None).
+        until(Optional[datetime], optional): Only return entries up to this date (Default value = None).
 
     Returns:
         List of log entries.
     """
-
-    def _get_all_dataset_versions(dataset: Dataset):
-        """Get all datasets provenance for a dataset.
-
-        Args:
-            dataset(Dataset): Head dataset to get versions for.
-
-        Returns:
-            Iterator of all versions of a dataset.
-        """
-
-        current_dataset = dataset
-
-        while current_dataset:
-            yield current_dataset
-
-            if current_dataset.is_derivation():
-                assert current_dataset.derived_from is not None
-                current_dataset = dataset_gateway.get_by_id(current_dataset.derived_from.value)
-            else:
-                return
-
-    log_entries: List[LogViewModel] = []
+    log_entries = []
 
     if not datasets_only:
-        activities = activity_gateway.get_all_activities()
-        log_entries.extend(LogViewModel.from_activity(a) for a in activities)
+        activities = activity_gateway.get_activities_by_date(since=since, until=until)
+        log_entries.append(LogViewModel.from_activity(a) for a in activities)
 
     if not workflows_only:
-        datasets = [
-            d
-            for root_dataset in dataset_gateway.get_provenance_tails()
-            for d in _get_all_dataset_versions(root_dataset)
-        ]
-        log_entries.extend(LogViewModel.from_dataset(d) for d in datasets)
+        datasets = dataset_gateway.get_datasets_by_date(since=since, until=until)
+        log_entries.append(LogViewModel.from_dataset(d) for d in datasets)
+
+    if len(log_entries) == 1:
+        entries = log_entries[0]
+    else:
+        entries = heapq.merge(*log_entries, key=lambda e: e.date.timestamp(), reverse=True)
 
-    return log_entries
+    return list(itertools.islice(entries, limit))
@@ -41,6 +41,12 @@ DATA_DIR_CONFIG_KEY = "data_directory"
 DATABASE_PATH: str = "metadata"
 """Directory for metadata storage."""
 
+DATABASE_JOURNAL_PATH: str = "metadata-journal"
+"""Directory for the journal of metadata changes."""
+
+DATABASE_JOURNAL_COMPACTED: str = "compacted"
+"""File in the journal directory that is updated whenever the journal is compacted."""
+
 DATASET_IMAGES = "dataset_images"
 """Directory for dataset images."""
 
@@ -83,15 +89,18 @@ RENKU_PROTECTED_PATHS = [
 
 DATABASE_METADATA_PATH = [
     Path(RENKU_HOME) / DATABASE_PATH,
+    Path(RENKU_HOME) / DATABASE_JOURNAL_PATH,
 ]
 
 PROJECT_METADATA_PATH = [
     Path(RENKU_HOME) / DATABASE_PATH,
+    Path(RENKU_HOME) / DATABASE_JOURNAL_PATH,
     Path(RENKU_HOME) / IMAGES,
 ]
 
 DATASET_METADATA_PATHS = [
     Path(RENKU_HOME) / DATABASE_PATH,
+    Path(RENKU_HOME) / DATABASE_JOURNAL_PATH,
     Path(RENKU_HOME) / DATASET_IMAGES,
     Path(RENKU_HOME) / POINTERS,
     Path(RENKU_HOME) / REFS,
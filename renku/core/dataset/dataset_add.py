@@ -33,10 +33,24 @@ from renku.core.dataset.providers.local import LocalProvider
 from renku.core.dataset.providers.models import DatasetAddAction, DatasetAddMetadata
 from renku.core.interface.dataset_gateway import IDatasetGateway
 from renku.core.interface.storage import IStorage
-from renku.core.lfs import check_external_storage, track_paths_in_storage
+from renku.core.lfs import (
+    check_external_storage,
+    get_lfs_pointer,
+    get_minimum_lfs_file_size,
+    storage_installed_locally,
+    track_paths_in_storage,
+)
 from renku.core.util import communication, requests
 from renku.core.util.git import get_git_user
-from renku.core.util.os import get_absolute_path, get_file_size, get_files, get_relative_path, hash_file, is_subpath
+from renku.core.util.os import (
+    copy_file_with_hashes,
+    get_absolute_path,
+    get_file_size,
+    get_files,
+    get_relative_path,
+    hash_file_multiple,
+    is_subpath,
+)
 from renku.core.util.urls import check_url, is_uri_subfolder, resolve_uri
 from renku.core.util.util import parallel_execute
 from renku.domain_model.constant import NON_EXISTING_ENTITY_CHECKSUM
@@ -134,9 +148,26 @@ def get_files_metadata(
     revision: Optional[str],
     sources: List[Union[str, Path]],
     force: bool = False,
+    failed_urls: Optional[Dict[str, str]] = None,
     **kwargs,
 ) -> List[DatasetAddMetadata]:
-    """Process file URLs for adding to a dataset."""
+    """Process file URLs for adding to a dataset.
+
+    Args:
+        urls(List[str]): URLs or paths to add.
+        importer(Optional[ImporterApi]): Importer to download files from (Default value = None).
+        dataset(Dataset): The dataset that files are added to.
+        destination(Path): Destination directory of files within the dataset.
+        extract(bool): Whether to extract archives.
+        revision(Optional[str]): Revision to add files from for git URLs.
+        sources(List[Union[str, Path]]): Paths to add from a git URL.
+        force(bool): Whether to add ignored files (Default value = False).
+        failed_urls(Optional[Dict[str, str]]): If passed, remote URLs that can't be retrieved are recorded in it with
+            their error instead of failing the whole operation (Default value = None).
+
+    Returns:
+        List[DatasetAddMetadata]: Metadata of files to add.
+    """
     if importer:
         return importer.download_files(destination=destination, extract=extract)
 
@@ -145,7 +176,10 @@ def get_files_metadata(
     if sources and len(urls) > 1:
         raise errors.ParameterError("Cannot use '--source' with multiple URLs.")
 
+    from renku.core.dataset.providers.web import WebProvider
+
     files = []
+    web_urls = []
 
     for url in urls:
         is_remote, is_git = check_url(url)
@@ -157,6 +191,10 @@ def get_files_metadata(
 
         if is_remote:
             provider = ProviderFactory.get_add_provider(uri=url)
+            if len(urls) > 1 and isinstance(provider, WebProvider):
+                # NOTE: Downloads don't depend on each other; do them concurrently below
+                web_urls.append(url)
+                continue
         else:
             # NOTE: If URI is in the local file system, check to see if it's part of a mounted dataset/provider
             cloud_dataset, remote_url = get_cloud_dataset_from_path(path=url)
@@ -169,23 +207,57 @@ def get_files_metadata(
             else:
                 provider = LocalProvider(uri=url)
 
-        new_files = provider.get_metadata(
-            uri=url,
-            destination=destination,
-            revision=revision,
-            sources=sources,
-            dataset=dataset,
-            extract=extract,
-            force=force,
-            dataset_add_action=dataset_add_action,
-            **kwargs,
-        )
+        try:
+            new_files = provider.get_metadata(
+                uri=url,
+                destination=destination,
+                revision=revision,
+                sources=sources,
+                dataset=dataset,
+                extract=extract,
+                force=force,
+                dataset_add_action=dataset_add_action,
+                **kwargs,
+            )
+        except Exception as e:
+            if failed_urls is None or not is_remote:
+                raise
+            failed_urls[url] = str(e)
+            continue
 
         files.extend(new_files)
 
+    if web_urls:
+        files.extend(
+            parallel_execute(
+                _get_web_metadata,
+                web_urls,
+                rate=5,
+                destination=destination,
+                dataset=dataset,
+                extract=extract,
+                force=force,
+                failed_urls=failed_urls,
+                **kwargs,
+            )
+        )
+
     return files
 
 
+def _get_web_metadata(url: str, failed_urls: Optional[Dict[str, str]], **kwargs) -> List[DatasetAddMetadata]:
+    """Download a web URL and return its metadata."""
+    from renku.core.dataset.providers.web import WebProvider
+
+    try:
+        return WebProvider(uri=url).get_metadata(uri=url, **kwargs)
+    except Exception as e:
+        if failed_urls is None:
+            raise
+        failed_urls[url] = str(e)
+        return []
+
+
 @inject.autoparams("dataset_gateway")
 def has_cloud_storage(dataset_gateway: IDatasetGateway) -> bool:
     """Return if a project has any dataset with cloud storage with its data directory mounted or pulled."""
@@ -366,8 +438,35 @@ def get_upload_uri(dataset: Dataset, entity_path: Union[Path, str]) -> str:
     return f"{base}/{path_within_dataset}"
 
 
-def copy_file(file: DatasetAddMetadata, dataset: Dataset, storage: Optional[IStorage]) -> List[Optional[Path]]:
-    """Copy/move/link a file to dataset's data directory."""
+def _get_hash_types(path: Union[Path, str], storage: Optional[IStorage], lfs_threshold: Optional[int]) -> List[str]:
+    """Return hashes that must be calculated for a file that is added to a dataset.
+
+    Datasets with a cloud storage use MD5. Otherwise, the git hash is needed and the SHA-256 is only needed for files
+    that will be tracked in LFS to build their pointer file.
+    """
+    if storage:
+        return ["md5"]
+    elif lfs_threshold is not None and (get_file_size(path) or 0) >= lfs_threshold:
+        return ["git", "sha256"]
+
+    return ["git"]
+
+
+def copy_file(
+    file: DatasetAddMetadata, dataset: Dataset, storage: Optional[IStorage], lfs_threshold: Optional[int] = None
+) -> List[Optional[Path]]:
+    """Copy/move/link a file to dataset's data directory.
+
+    Args:
+        file(DatasetAddMetadata): The file to add.
+        dataset(Dataset): The dataset that the file is added to.
+        storage(Optional[IStorage]): The cloud storage of the dataset if any.
+        lfs_threshold(Optional[int]): Minimum size of files that are tracked in LFS or ``None`` if no file is tracked
+            (Default value = None).
+
+    Returns:
+        List[Optional[Path]]: Paths that should be tracked in LFS.
+    """
     if not file.has_action:
         return []
 
@@ -393,6 +492,7 @@ def copy_file(file: DatasetAddMetadata, dataset: Dataset, storage: Optional[ISto
     delete_source = False
     track_in_lfs = True
 
+    # NOTE: Calculate checksums while copying to avoid re-reading the data
     try:
         if file.action == DatasetAddAction.DOWNLOAD:
             # NOTE: Download to a temporary location if dataset has a cloud storage because it's usually mounted as
@@ -408,14 +508,24 @@ def copy_file(file: DatasetAddMetadata, dataset: Dataset, storage: Optional[ISto
             download_storage = file.provider.get_storage()
             download_storage.download(file.url, dst)
             file_to_upload = dst
+            file.content_hashes = hash_file_multiple(dst, _get_hash_types(dst, storage, lfs_threshold))
         elif file.action == DatasetAddAction.COPY:
-            shutil.copy(file.source, file.destination)
+            hash_types = _get_hash_types(file.source, storage, lfs_threshold)
+            file.content_hashes = copy_file_with_hashes(file.source, file.destination, hash_types)
         elif file.action == DatasetAddAction.MOVE:
             # NOTE: Set ``delete_source`` in case move fails due to a dataset's read-only mounted data directory
             delete_source = True
-            shutil.move(file.source, file.destination, copy_function=shutil.copy)  # type: ignore
+            hash_types = _get_hash_types(file.source, storage, lfs_threshold)
+
+            def copy_function(source, destination):
+                file.content_hashes = copy_file_with_hashes(source, destination, hash_types)
+
+            shutil.move(file.source, file.destination, copy_function=copy_function)  # type: ignore
             delete_source = False
             file_to_upload = file.destination
+            if not file.content_hashes:
+                # NOTE: File was renamed without being copied
+                file.content_hashes = hash_file_multiple(file.destination, hash_types)
         elif file.action == DatasetAddAction.SYMLINK:
             create_external_file(target=file.source, path=file.destination)
             # NOTE: Don't track symlinks to external files in LFS
@@ -446,7 +556,7 @@ def copy_file(file: DatasetAddMetadata, dataset: Dataset, storage: Optional[ISto
             md5_hash: Optional[str] = file.based_on.checksum
         else:
             file_uri = get_upload_uri(dataset=dataset, entity_path=file.entity_path)
-            md5_hash = hash_file(file_to_upload, hash_type="md5")
+            md5_hash = file.content_hashes.get("md5") or hash_file_multiple(file_to_upload, ["md5"])["md5"]
 
             # NOTE: If dataset has a storage backend, upload the file to the remote storage.
             storage.upload(source=file_to_upload, uri=file_uri)
@@ -467,7 +577,13 @@ def copy_files_to_dataset(dataset: Dataset, files: List[DatasetAddMetadata]):
         provider = ProviderFactory.get_storage_provider(uri=dataset.storage)
         dataset_storage = provider.get_storage()
 
-    lfs_files = parallel_execute(copy_file, files, rate=5, dataset=dataset, storage=dataset_storage)
+    lfs_threshold = None
+    if not dataset.storage and project_context.external_storage_requested:
+        lfs_threshold = get_minimum_lfs_file_size()
+
+    lfs_files = parallel_execute(
+        copy_file, files, rate=5, dataset=dataset, storage=dataset_storage, lfs_threshold=lfs_threshold
+    )
 
     if lfs_files and not dataset.storage:
         track_paths_in_storage(*lfs_files)
@@ -493,6 +609,50 @@ def add_files_to_repository(dataset: Dataset, files: List[DatasetAddMetadata]):
         communication.warn("No new file was added to project")
 
 
+def _get_checksums_from_content_hashes(files: List[DatasetAddMetadata]) -> Dict[Union[Path, str], Optional[str]]:
+    """Derive git hashes of files from the hashes that were calculated while copying them.
+
+    NOTE: The git hash of a file that is tracked in LFS is the hash of its pointer file. Files with attributes that
+    make git transform the content (e.g. line-ending conversion or filters other than LFS) and LFS files without a
+    SHA-256 are skipped and must be hashed by git itself.
+    """
+    files = [f for f in files if "git" in f.content_hashes]
+    if not files:
+        return {}
+
+    repository = project_context.repository
+    autocrlf = str(repository.get_configuration().get_value("core", "autocrlf", "false")).lower()
+    if autocrlf in ("true", "input"):
+        return {}
+
+    lfs_installed = storage_installed_locally()
+    attributes = repository.get_attributes(*[str(f.entity_path) for f in files])
+
+    checksums: Dict[Union[Path, str], Optional[str]] = {}
+
+    for file in files:
+        file_attributes = attributes.get(str(file.entity_path), {})
+        if any(
+            file_attributes.get(name, "unset") not in ("unset", "unspecified")
+            for name in ("text", "eol", "ident", "working-tree-encoding")
+        ):
+            continue
+
+        filter_attribute = file_attributes.get("filter")
+        if filter_attribute is None:
+            checksums[file.entity_path] = file.content_hashes["git"]
+        elif filter_attribute == "lfs" and lfs_installed:
+            size = os.path.getsize(project_context.path / file.entity_path)
+            # NOTE: Git LFS doesn't create pointers for empty files
+            if size == 0:
+                checksums[file.entity_path] = file.content_hashes["git"]
+            elif "sha256" in file.content_hashes:
+                pointer = get_lfs_pointer(oid=file.content_hashes["sha256"], size=size)
+                checksums[file.entity_path] = repository.hash_string(pointer)
+
+    return checksums
+
+
 def update_dataset_metadata(dataset: Dataset, files: List[DatasetAddMetadata], clear_files_before: bool):
     """Add newly-added files to the dataset's metadata."""
     # NOTE: For datasets with cloud storage backend, we use MD5 hash as checksum instead of git hash.
@@ -501,10 +661,14 @@ def update_dataset_metadata(dataset: Dataset, files: List[DatasetAddMetadata], c
             f.entity_path: f.based_on.checksum for f in files if f.based_on
         }
     else:
+        checksums = _get_checksums_from_content_hashes(files)
         repo_paths: List[Union[Path, str]] = [
-            file.entity_path for file in files if (project_context.path / file.entity_path).exists()
+            file.entity_path
+            for file in files
+            if file.entity_path not in checksums and (project_context.path / file.entity_path).exists()
         ]
-        checksums = project_context.repository.get_object_hashes(repo_paths)
+        if repo_paths:
+            checksums.update(project_context.repository.get_object_hashes(repo_paths))
 
     dataset_files = []
 
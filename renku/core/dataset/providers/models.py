@@ -19,7 +19,7 @@ import dataclasses
 import os
 from enum import Enum, auto
 from pathlib import Path
-from typing import TYPE_CHECKING, Any, List, NamedTuple, Optional, Type
+from typing import TYPE_CHECKING, Any, Dict, List, NamedTuple, Optional, Type
 
 from humanize import naturalsize
 from marshmallow import EXCLUDE
@@ -64,6 +64,7 @@ class DatasetAddMetadata:
     provider: Optional["StorageProviderInterface"] = None
     based_on: Optional["RemoteEntity"] = None
     size: Optional[int] = None
+    content_hashes: Dict[str, str] = dataclasses.field(default_factory=dict)  # Hashes calculated while copying
 
     @property
     def has_action(self) -> bool:
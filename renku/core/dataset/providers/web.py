@@ -180,6 +180,7 @@ def _provider_check(url):
 def download_file(
     uri: str,
     filename: Optional[str] = None,
+    checksum: Optional[str] = None,
     *,
     project_path: Path,
     destination: Path,
@@ -190,14 +191,18 @@ def download_file(
     from renku.core.dataset.providers.models import DatasetAddAction, DatasetAddMetadata
     from renku.core.util import requests
 
-    uri = requests.get_redirect_url(uri)  # TODO: Check that this is not duplicate
+    # NOTE: ``_provider_check`` resolves redirects as well
     uri = _provider_check(uri)
 
     with project_context.with_path(project_path):
         try:
             # NOTE: If execution time was less than the delay, block the request until delay seconds are passed
             tmp_root, paths = requests.download_file(
-                base_directory=project_context.metadata_path / CACHE, url=uri, filename=filename, extract=extract
+                base_directory=project_context.metadata_path / CACHE,
+                url=uri,
+                filename=filename,
+                extract=extract,
+                checksum=checksum,
             )
         except errors.RequestError as e:  # pragma nocover
             raise errors.OperationError(f"Cannot download from {uri}") from e
@@ -226,11 +231,17 @@ def download_file(
 
 
 def download_files(
-    urls: Tuple[str, ...], destination: Path, names: Tuple[str, ...], extract: bool
+    urls: Tuple[str, ...],
+    destination: Path,
+    names: Tuple[str, ...],
+    extract: bool,
+    checksums: Optional[Tuple[Optional[str], ...]] = None,
 ) -> List["DatasetAddMetadata"]:
     """Download multiple files and return their metadata."""
     assert len(urls) == len(names), f"Number of URL and names don't match {len(urls)} != {len(names)}"
 
+    checksums = checksums or (None,) * len(urls)
+
     if destination.exists() and not destination.is_dir():
         raise errors.ParameterError(f"Destination is not a directory: '{destination}'")
 
@@ -240,6 +251,7 @@ def download_files(
         download_file,
         urls,
         names,
+        checksums,
         project_path=project_context.path,
         destination=destination,
         extract=extract,
@@ -16,8 +16,9 @@
 """Renku activity gateway interface."""
 
 from abc import ABC
+from datetime import datetime
 from pathlib import Path
-from typing import List, Optional, Set, Tuple, Union
+from typing import Iterator, List, Optional, Set, Tuple, Union
 
 from renku.domain_model.provenance.activity import Activity, ActivityCollection
 
@@ -65,6 +66,12 @@ class IActivityGateway(ABC):
         """Get all activities in the project."""
         raise NotImplementedError
 
+    def get_activities_by_date(
+        self, since: Optional[datetime] = None, until: Optional[datetime] = None
+    ) -> Iterator[Activity]:
+        """Return activities that ended in a time range from newest to oldest."""
+        raise NotImplementedError
+
     def add(self, activity: Activity) -> None:
         """Add an ``Activity`` to storage."""
         raise NotImplementedError
@@ -16,7 +16,7 @@
 """Renku database gateway interface."""
 
 from abc import ABC
-from typing import TYPE_CHECKING, Generator
+from typing import TYPE_CHECKING, Generator, List, Optional, Tuple
 
 if TYPE_CHECKING:
     from persistent import Persistent
@@ -36,3 +36,11 @@ class IDatabaseGateway(ABC):
     def get_modified_objects_from_revision(self, revision_or_range: str) -> Generator["Persistent", None, None]:
         """Get all database objects modified in a revision."""
         raise NotImplementedError
+
+    def get_changes_since(self, revision: str) -> Optional[Tuple[List["Persistent"], List[str]]]:
+        """Get objects that were added or modified and ids of objects that were removed since a revision."""
+        raise NotImplementedError
+
+    def compact_journal(self) -> int:
+        """Remove all files of the journal of metadata changes."""
+        raise NotImplementedError
@@ -16,7 +16,8 @@
 """Renku dataset gateway interface."""
 
 from abc import ABC
-from typing import TYPE_CHECKING, List, Optional
+from datetime import datetime
+from typing import TYPE_CHECKING, Iterator, List, Optional
 
 if TYPE_CHECKING:
     from renku.domain_model.dataset import Dataset, DatasetTag
@@ -41,6 +42,12 @@ class IDatasetGateway(ABC):
         """Return the provenance for all datasets."""
         raise NotImplementedError
 
+    def get_datasets_by_date(
+        self, since: Optional[datetime] = None, until: Optional[datetime] = None
+    ) -> Iterator["Dataset"]:
+        """Return versions of all datasets that were changed in a time range from newest to oldest."""
+        raise NotImplementedError
+
     def get_all_tags(self, dataset: "Dataset") -> List["DatasetTag"]:
         """Return the list of all tags for a dataset."""
         raise NotImplementedError
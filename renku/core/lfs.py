@@ -22,10 +22,11 @@ import re
 import shlex
 import tempfile
 from collections import defaultdict
+from dataclasses import dataclass, field
 from pathlib import Path
 from shutil import move, which
 from subprocess import PIPE, STDOUT, check_output, run
-from typing import TYPE_CHECKING, Dict, List, Optional, Tuple, Union
+from typing import TYPE_CHECKING, Dict, List, Optional, Set, Tuple, Union
 
 import pathspec
 
@@ -51,7 +52,7 @@ _CMD_STORAGE_CLEAN = ["git", "lfs", "clean"]
 
 _CMD_STORAGE_CHECKOUT = ["git", "lfs", "checkout"]
 
-_CMD_STORAGE_PULL = ["git", "lfs", "pull", "-I"]
+_CMD_STORAGE_PULL = ["lfs", "pull", "-I"]
 
 _CMD_STORAGE_MIGRATE_IMPORT = ["git", "lfs", "migrate", "import"]
 
@@ -63,6 +64,45 @@ _CMD_STORAGE_STATUS = ["git", "lfs", "status"]
 
 _LFS_HEADER = "version https://git-lfs.github.com/spec/"
 
+_LFS_POINTER_MAX_SIZE = 1024
+
+
+@dataclass
+class LFSCache:
+    """Git LFS state that stays valid during a single command invocation."""
+
+    pulled_paths: Set[str] = field(default_factory=set)
+    """Absolute paths that are already pulled from LFS."""
+
+    tracked_paths: Set[str] = field(default_factory=set)
+    """Paths that are already tracked in LFS."""
+
+
+def get_lfs_pointer_size(path: Union[Path, str]) -> Optional[int]:
+    """Return size of the object that an LFS pointer file points to or None if the file is not an LFS pointer.
+
+    NOTE: This only reads the beginning of the file and doesn't call ``git lfs``.
+    """
+    try:
+        if os.path.getsize(path) >= _LFS_POINTER_MAX_SIZE:
+            return None
+
+        with open(path, "rb") as file:
+            content = file.read(_LFS_POINTER_MAX_SIZE)
+    except OSError:
+        return None
+
+    if not content.startswith(_LFS_HEADER.encode()):
+        return None
+
+    match = re.search(rb"^size (\d+)$", content, re.MULTILINE)
+    return int(match.group(1)) if match else 0
+
+
+def get_lfs_pointer(oid: str, size: int) -> str:
+    """Return content of an LFS pointer file for a file with the given sha256 checksum and size."""
+    return f"{_LFS_HEADER}v1\noid sha256:{oid}\nsize {size}\n"
+
 
 class RenkuGitWildMatchPattern(pathspec.patterns.GitWildMatchPattern):
     """Custom GitWildMatchPattern matcher."""
@@ -169,12 +209,21 @@ def track_paths_in_storage(*paths: Union[Path, str]) -> Optional[List[str]]:
     if not project_context.external_storage_requested or not check_external_storage():
         return None
 
+    lfs_cache = project_context.lfs_cache
+    paths = tuple(p for p in paths if str(p) not in lfs_cache.tracked_paths)
+    if not paths:
+        return []
+
     # Calculate which paths can be tracked in lfs
     track_paths: List[str] = []
     attrs = project_context.repository.get_attributes(*paths)
+    lfs_ignore = renku_lfs_ignore()
+    minimum_lfs_file_size = get_minimum_lfs_file_size()
 
-    for path in paths:
-        path = Path(path)
+    tracked_inputs: List[str] = []
+
+    for input_path in paths:
+        path = Path(input_path)
 
         # Do not track symlinks in LFS
         if path.is_symlink():
@@ -188,14 +237,16 @@ def track_paths_in_storage(*paths: Union[Path, str]) -> Optional[List[str]]:
 
         if (
             path.is_dir()
-            and not renku_lfs_ignore().match_file(relative_path)
-            and not any(renku_lfs_ignore().match_tree(str(relative_path)))
+            and not lfs_ignore.match_file(relative_path)
+            and not any(lfs_ignore.match_tree(str(relative_path)))
         ):
             track_paths.append(str(path / "**"))
-        elif not renku_lfs_ignore().match_file(str(relative_path)):
+            tracked_inputs.append(str(input_path))
+        elif not lfs_ignore.match_file(str(relative_path)):
             file_size = os.path.getsize(str(os.path.relpath(project_context.path / path, os.getcwd())))
-            if file_size >= get_minimum_lfs_file_size():
+            if file_size >= minimum_lfs_file_size:
                 track_paths.append(str(relative_path))
+                tracked_inputs.append(str(input_path))
 
     if track_paths:
         try:
@@ -213,6 +264,8 @@ def track_paths_in_storage(*paths: Union[Path, str]) -> Optional[List[str]]:
         except (KeyboardInterrupt, OSError) as e:
             raise errors.ParameterError(f"Couldn't run 'git lfs':\n{e}")
 
+        lfs_cache.tracked_paths.update(tracked_inputs)
+
     show_message = get_value("renku", "show_lfs_message")
     if track_paths and (show_message is None or show_message.lower() == "true"):
         files_list = "\n\t".join(track_paths)
@@ -242,6 +295,8 @@ def untrack_paths_from_storage(*paths: Union[Path, str]) -> None:
     except (KeyboardInterrupt, OSError) as e:
         raise errors.ParameterError(f"Couldn't run 'git lfs':\n{e}")
 
+    project_context.lfs_cache.tracked_paths.difference_update(str(p) for p in paths)
+
 
 @check_external_storage_wrapper
 def list_tracked_paths() -> List[Path]:
@@ -276,10 +331,31 @@ def list_unpushed_lfs_paths(repository: "Repository") -> List[Path]:
     return [project_context.path / f.rsplit("(", 1)[0].strip() for f in files if f.strip()]
 
 
+def get_lfs_concurrent_transfers() -> Optional[int]:
+    """Number of concurrent transfers when pulling from LFS; ``None`` means Git LFS's default."""
+    value = get_value("renku", "lfs_concurrent_transfers")
+    if not value:
+        return None
+
+    try:
+        concurrent_transfers = int(value)
+    except ValueError:
+        raise errors.ParameterError(f"Invalid value for 'lfs_concurrent_transfers': {value}")
+
+    if concurrent_transfers < 1:
+        raise errors.ParameterError(f"Invalid value for 'lfs_concurrent_transfers': {value}")
+
+    return concurrent_transfers
+
+
 @check_external_storage_wrapper
 def pull_paths_from_storage(repository: "Repository", *paths: Union[Path, str]):
-    """Pull paths from LFS."""
-    project_dict = defaultdict(list)
+    """Pull paths from LFS.
+
+    NOTE: Only LFS pointer files are pulled; files that are already pulled (or aren't in LFS) are skipped.
+    """
+    lfs_cache = project_context.lfs_cache
+    project_dict: Dict[Path, List[Tuple[str, str]]] = defaultdict(list)
 
     for path in expand_directories(paths):
         sub_repository, _, path = get_in_submodules(repository, repository.head.commit, path)
@@ -289,12 +365,25 @@ def pull_paths_from_storage(repository: "Repository", *paths: Union[Path, str]):
         except ValueError:  # An external file
             continue
 
-        project_dict[sub_repository.path].append(shlex.quote(str(relative_path)))
+        if str(absolute_path) in lfs_cache.pulled_paths:
+            continue
+
+        if get_lfs_pointer_size(absolute_path) is None:  # Already pulled or not an LFS file
+            lfs_cache.pulled_paths.add(str(absolute_path))
+            continue
+
+        project_dict[sub_repository.path].append((shlex.quote(str(relative_path)), str(absolute_path)))
+
+    concurrent_transfers = get_lfs_concurrent_transfers()
+    command = ["git"]
+    if concurrent_transfers:
+        command += ["-c", f"lfs.concurrenttransfers={concurrent_transfers}"]
+    command += _CMD_STORAGE_PULL
 
     for project_path, file_paths in project_dict.items():
         result = run_command(
-            _CMD_STORAGE_PULL,
-            *file_paths,
+            command,
+            *[p[0] for p in file_paths],
             separator=",",
             cwd=project_path,
             stdout=PIPE,
@@ -305,14 +394,52 @@ def pull_paths_from_storage(repository: "Repository", *paths: Union[Path, str]):
         if result and result.returncode != 0:
             raise errors.GitLFSError(f"Cannot pull LFS objects from server:\n {result.stdout}")
 
+        lfs_cache.pulled_paths.update(p[1] for p in file_paths)
+
+
+def _get_lfs_oids(repository: "Repository", paths: List[str], revision: str = "HEAD") -> Dict[str, Optional[str]]:
+    """Return LFS object ids of pointer files in a revision using a single ``git cat-file --batch`` call."""
+    if not paths:
+        return {}
+
+    result = run(
+        ["git", "cat-file", "--batch"],
+        input=b"".join(f"{revision}:{path}\n".encode("utf-8") for path in paths),
+        stdout=PIPE,
+        cwd=repository.path,
+        check=False,
+    )
+    output = result.stdout
+
+    oids: Dict[str, Optional[str]] = {}
+    position = 0
+
+    for path in paths:
+        header_end = output.index(b"\n", position)
+        header = output[position:header_end].split()
+        position = header_end + 1
+
+        if len(header) != 3 or header[2] == b"missing":
+            oids[path] = None
+            continue
+
+        size = int(header[2])
+        content = output[position : position + size]
+        position += size + 1
+
+        match = re.search(rb"^oid sha256:([0-9a-f]{64})$", content, re.MULTILINE)
+        oids[path] = match.group(1).decode() if match else None
+
+    return oids
+
 
 @check_external_storage_wrapper
 def clean_storage_cache(*check_paths: Union[Path, str]) -> Tuple[List[str], List[str]]:
     """Remove paths from lfs cache."""
     project_dict = defaultdict(list)
     repositories: Dict[Path, "Repository"] = {}
-    tracked_paths: Dict[Path, List[Path]] = {}
-    unpushed_paths: Dict[Path, List[Path]] = {}
+    tracked_paths: Optional[Set[Path]] = None
+    unpushed_paths: Optional[Set[Path]] = None
     untracked_paths: List[str] = []
     local_only_paths: List[str] = []
 
@@ -326,34 +453,26 @@ def clean_storage_cache(*check_paths: Union[Path, str]) -> Tuple[List[str], List
         except ValueError:  # An external file
             continue
 
-        if project_context.path not in tracked_paths:
-            tracked_paths[project_context.path] = list_tracked_paths()
+        if tracked_paths is None:
+            tracked_paths = set(list_tracked_paths())
 
-        if project_context.path not in unpushed_paths:
-            u_paths = list_unpushed_lfs_paths(current_repository)
-            unpushed_paths[project_context.path] = u_paths
+        if unpushed_paths is None:
+            unpushed_paths = set(list_unpushed_lfs_paths(current_repository))
 
-        if absolute_path in unpushed_paths[project_context.path]:
+        if absolute_path in unpushed_paths:
             local_only_paths.append(str(relative_path))
-        elif absolute_path not in tracked_paths[project_context.path]:
+        elif absolute_path not in tracked_paths:
             untracked_paths.append(str(relative_path))
-        else:
+        elif get_lfs_pointer_size(absolute_path) is None:
+            # NOTE: Files that are still pointers are not pulled and there is nothing to clean
             project_dict[project_context.path].append(str(relative_path))
             repositories[project_context.path] = current_repository
 
     for project_path, paths in project_dict.items():
         current_repository = repositories[project_path]
+        old_oids = _get_lfs_oids(current_repository, paths)
 
         for path in paths:
-            with open(path) as tracked_file:
-                try:
-                    header = tracked_file.read(len(_LFS_HEADER))
-                    if header == _LFS_HEADER:
-                        # file is not pulled
-                        continue
-                except UnicodeDecodeError:
-                    # likely a binary file, not lfs pointer file
-                    pass
             with tempfile.NamedTemporaryFile(mode="w+t", encoding="utf-8", delete=False) as tmp, open(
                 path, "r+t"
             ) as input_file:
@@ -365,16 +484,13 @@ def clean_storage_cache(*check_paths: Union[Path, str]) -> Tuple[List[str], List
                 tmp_path = tmp.name
             move(tmp_path, path)
 
-            # get lfs sha hash
-            old_pointer = current_repository.get_raw_content(path=path, revision="HEAD")
-            old_pointer = old_pointer.splitlines()[1]
-            old_pointer = old_pointer.split(" ")[1].split(":")[1]
-
-            prefix1 = old_pointer[:2]
-            prefix2 = old_pointer[2:4]
+            old_oid = old_oids.get(path)
+            if not old_oid:
+                communication.warn(f"Cannot remove '{path}' from LFS cache: It's not an LFS pointer in HEAD")
+                continue
 
             # remove from lfs cache
-            object_path = project_context.path / ".git" / "lfs" / "objects" / prefix1 / prefix2 / old_pointer
+            object_path = project_context.path / ".git" / "lfs" / "objects" / old_oid[:2] / old_oid[2:4] / old_oid
             object_path.unlink()
 
         # add paths so they don't show as modified
@@ -15,15 +15,21 @@
 # limitations under the License.
 """Template management."""
 
+import copy
+import hashlib
 import json
 import os
 import re
 import shutil
 import tempfile
+import threading
+import time
+from collections import OrderedDict
 from enum import Enum, IntEnum, auto
 from pathlib import Path
-from typing import Any, Dict, List, Optional, Tuple
+from typing import Any, Callable, Dict, List, Optional, Tuple
 
+import portalocker
 from packaging.version import Version
 
 from renku.core import errors
@@ -54,6 +60,13 @@ from renku.domain_model.project import Project, ProjectTemplateMetadata
 TEMPLATE_KEEP_FILES = ["readme.md", "readme.rst", "readme.txt", "readme"]
 TEMPLATE_INIT_APPEND_FILES = [".gitignore"]
 
+TEMPLATES_CACHE_MAX_AGE = int(os.environ.get("RENKU_TEMPLATES_CACHE_MAX_AGE", 3600))
+TEMPLATES_CACHE_LOCK_TIMEOUT = int(os.environ.get("RENKU_TEMPLATES_CACHE_LOCK_TIMEOUT", 300))
+MANIFESTS_CACHE_SIZE = 128
+
+_manifests_cache: "OrderedDict[str, List[Dict]]" = OrderedDict()
+_manifests_cache_lock = threading.Lock()
+
 
 class TemplateAction(Enum):
     """Types of template rendering."""
@@ -434,31 +447,60 @@ class RepositoryTemplates(TemplatesSource):
     passed) and ``version`` is set to the commit SHA of the reference commit.
     """
 
-    def __init__(self, path, source, reference, version, repository: Repository, skip_validation: bool = False):
+    def __init__(
+        self,
+        path,
+        source,
+        reference,
+        version,
+        repository: Repository,
+        skip_validation: bool = False,
+        manifest: Optional[TemplatesManifest] = None,
+    ):
         super().__init__(
-            path=path, source=source, reference=reference, version=version, skip_validation=skip_validation
+            path=path,
+            source=source,
+            reference=reference,
+            version=version,
+            skip_validation=skip_validation,
+            manifest=manifest,
         )
         self.repository: Repository = repository
 
     @classmethod
     def fetch(cls, source: Optional[str], reference: Optional[str]) -> "RepositoryTemplates":
-        """Fetch a template repository."""
+        """Fetch a template repository.
+
+        Remote repositories are fetched into a shared cache and checked out in a new worktree; local repositories are
+        cloned directly.
+        """
         ref_str = f"@{reference}" if reference else ""
         communication.echo(f"Fetching template from {source}{ref_str}... ")
         path = Path(tempfile.mkdtemp())
 
-        try:
-            repository = clone_repository(url=source, path=path, checkout_revision=reference, install_lfs=False)
-        except errors.GitError as e:
-            if "Cannot checkout reference" in str(e):
-                raise errors.TemplateMissingReferenceError(
-                    f"Cannot find the reference '{reference}' in the template repository from {source}"
-                ) from e
-            raise errors.InvalidTemplateError(f"Cannot clone template repository from {source}") from e
+        repository = None
+        if source and not os.path.exists(source):
+            try:
+                repository = _checkout_from_templates_cache(source=source, reference=reference, path=path)
+            except (OSError, portalocker.LockException) as e:
+                communication.warn(f"Cannot use templates cache, fetching template repository directly: {e}")
+
+        if repository is None:
+            try:
+                repository = clone_repository(url=source, path=path, checkout_revision=reference, install_lfs=False)
+            except errors.GitError as e:
+                if "Cannot checkout reference" in str(e):
+                    raise errors.TemplateMissingReferenceError(
+                        f"Cannot find the reference '{reference}' in the template repository from {source}"
+                    ) from e
+                raise errors.InvalidTemplateError(f"Cannot clone template repository from {source}") from e
 
         version = repository.head.commit.hexsha
+        manifest = _get_cached_manifest(version, lambda: TemplatesManifest.from_path(path / TEMPLATE_MANIFEST))
 
-        return cls(path=path, source=source, reference=reference, version=version, repository=repository)
+        return cls(
+            path=path, source=source, reference=reference, version=version, repository=repository, manifest=manifest
+        )
 
     def get_all_references(self, id) -> List[str]:
         """Return a list of git tags that are valid SemVer and include a template id."""
@@ -497,9 +539,11 @@ class RepositoryTemplates(TemplatesSource):
     def _has_template_at(self, id: str, reference: str) -> bool:
         """Return if template id is available at a reference."""
         try:
-            content = self.repository.get_content(TEMPLATE_MANIFEST, revision=reference)
-            manifest = TemplatesManifest.from_string(content)
-        except (errors.FileNotFound, errors.InvalidTemplateError):
+            sha = self.repository.get_commit(reference).hexsha
+            manifest = _get_cached_manifest(
+                sha, lambda: TemplatesManifest.from_string(self.repository.get_content(TEMPLATE_MANIFEST, revision=sha))
+            )
+        except (errors.FileNotFound, errors.InvalidTemplateError, errors.GitCommitNotFoundError):
             return False
         else:
             return any(id == t.id or id in t.aliases for t in manifest.templates)
@@ -507,8 +551,9 @@ class RepositoryTemplates(TemplatesSource):
     def get_template(self, id, reference: Optional[str]) -> "Template":
         """Return a template at a specific reference."""
         if reference is not None and reference != self.reference:
+            # NOTE: Always detach HEAD since a branch cannot be checked out in more than one worktree of the cache
             try:
-                self.repository.checkout(reference=reference)
+                self.repository.run_git_command("checkout", "--detach", reference)
             except errors.GitError as e:
                 raise errors.InvalidTemplateError(f"Cannot find reference '{reference}'") from e
             else:
@@ -516,7 +561,9 @@ class RepositoryTemplates(TemplatesSource):
                 self.version = self.repository.head.commit.hexsha
 
             try:
-                manifest = TemplatesManifest.from_path(self.path / TEMPLATE_MANIFEST)
+                manifest = _get_cached_manifest(
+                    self.version, lambda: TemplatesManifest.from_path(self.path / TEMPLATE_MANIFEST)
+                )
             except errors.InvalidTemplateError as e:
                 raise errors.InvalidTemplateError(f"Cannot load template's manifest file at '{reference}'.") from e
             else:
@@ -528,3 +575,94 @@ class RepositoryTemplates(TemplatesSource):
             raise errors.TemplateNotFoundError(f"The template with id '{id}' is not available at '{reference}'.")
 
         return template
+
+
+def get_templates_cache_dir() -> Path:
+    """Return the directory where template repositories are cached."""
+    cache_dir = os.environ.get("RENKU_TEMPLATES_CACHE_DIR")
+    if cache_dir:
+        return Path(cache_dir)
+
+    return Path(os.environ.get("XDG_CACHE_HOME") or Path.home() / ".cache") / "renku" / "templates"
+
+
+def _checkout_from_templates_cache(source: str, reference: Optional[str], path: Path) -> Repository:
+    """Check out a template repository from the templates cache into ``path``.
+
+    The cache keeps a mirror of each template repository which is refreshed with ``git fetch`` when it's older than
+    ``RENKU_TEMPLATES_CACHE_MAX_AGE`` seconds or when ``reference`` cannot be found. ``path`` becomes a detached
+    worktree of the mirror.
+    """
+    entry = get_templates_cache_dir() / hashlib.sha256(source.encode("utf-8")).hexdigest()
+    entry.mkdir(parents=True, exist_ok=True)
+    mirror_path = entry / "repository"
+    last_fetch = entry / "last_fetch"
+
+    def fetch_mirror(mirror: Repository):
+        try:
+            mirror.run_git_command("fetch", "--prune", "origin")
+        except errors.GitCommandError as e:
+            communication.warn(f"Cannot update cached template repository from {source}: {e}")
+        else:
+            last_fetch.touch()
+
+    with portalocker.Lock(f"{entry}.lock", timeout=TEMPLATES_CACHE_LOCK_TIMEOUT):
+        fetched = False
+
+        if not (mirror_path / "HEAD").exists():
+            shutil.rmtree(mirror_path, ignore_errors=True)
+            try:
+                Repository.clone_from(url=source, path=mirror_path, clone_options=["--mirror"])
+            except errors.GitError as e:
+                shutil.rmtree(mirror_path, ignore_errors=True)
+                raise errors.InvalidTemplateError(f"Cannot clone template repository from {source}") from e
+            last_fetch.touch()
+            fetched = True
+
+        mirror = Repository(mirror_path)
+
+        if not fetched and (
+            not last_fetch.exists() or time.time() - last_fetch.stat().st_mtime >= TEMPLATES_CACHE_MAX_AGE
+        ):
+            fetch_mirror(mirror)
+            fetched = True
+
+        # NOTE: Remove metadata of worktrees whose temporary directories were deleted
+        mirror.run_git_command("worktree", "prune")
+
+        while True:
+            try:
+                mirror.create_worktree(path=path, reference=reference or "HEAD", detach=True)
+            except errors.GitCommandError as e:
+                if fetched:
+                    raise errors.TemplateMissingReferenceError(
+                        f"Cannot find the reference '{reference}' in the template repository from {source}"
+                    ) from e
+                # NOTE: The reference might have been created after the last fetch
+                fetch_mirror(mirror)
+                fetched = True
+            else:
+                return Repository(path)
+
+
+def _get_cached_manifest(sha: str, load: Callable[[], TemplatesManifest]) -> TemplatesManifest:
+    """Return a templates manifest at a commit from the manifests cache or load and cache it.
+
+    Manifests are validated once when loaded; every call returns a new instance since templates of a manifest are bound
+    to their templates source.
+    """
+    with _manifests_cache_lock:
+        content = _manifests_cache.get(sha)
+        if content is not None:
+            _manifests_cache.move_to_end(sha)
+
+    if content is None:
+        manifest = load()
+        content = manifest.get_raw_content()
+
+        with _manifests_cache_lock:
+            _manifests_cache[sha] = content
+            while len(_manifests_cache) > MANIFESTS_CACHE_SIZE:
+                _manifests_cache.popitem(last=False)
+
+    return TemplatesManifest(copy.deepcopy(content), skip_validation=True)
@@ -392,7 +392,9 @@ def get_entity_from_revision(
     from renku.domain_model.constant import NON_EXISTING_ENTITY_CHECKSUM
     from renku.domain_model.entity import Collection, Entity
 
-    def get_directory_members(absolute_path: Path) -> List[Entity]:
+    resolved_revision = repository.head.commit.hexsha if revision == "HEAD" else revision
+
+    def get_directory_members(absolute_path: Path, checksums: Dict[str, str], has_submodules: bool) -> List[Entity]:
         """Return first-level files/directories in a directory."""
         members: List[Entity] = []
 
@@ -401,42 +403,48 @@ def get_entity_from_revision(
                 continue
 
             member_path = member.relative_to(repository.path)
+            member_checksum = checksums.get(str(member_path))
+            # NOTE: Paths missing from a revision's tree didn't exist at that revision; don't look them up one by one
+            if member_checksum is None and revision and not has_submodules:
+                member_checksum = resolved_revision
 
-            assert all(member_path != m.path for m in members)
-
-            entity = get_entity_from_revision(repository, member_path, revision, bypass_cache=bypass_cache)
-            # NOTE: If a path is not found at a revision we assume that it didn't exist at that revision
-            if entity:
-                members.append(entity)
+            members.append(get_entity(member_path, member_checksum, checksums, has_submodules))
 
         return members
 
-    global _entity_cache
-    key = (revision, str(path))
-    cached_entry = _entity_cache.get(key)
-    if cached_entry and not bypass_cache:
-        return cached_entry
-
-    # NOTE: For untracked directory the hash is None; make sure to stage them first before calling this function.
-    if not checksum:
-        checksum = repository.get_object_hash(revision=revision, path=path)
-    # NOTE: If object was not found at a revision it's either removed or exists in a different revision; keep the
-    # entity and use revision as checksum
-    if isinstance(revision, str) and revision == "HEAD":
-        revision = repository.head.commit.hexsha
-    checksum = checksum or revision or NON_EXISTING_ENTITY_CHECKSUM
-    id = Entity.generate_id(checksum=checksum, path=path)
-
-    absolute_path = repository.path / path
-    if str(path) != "." and absolute_path.is_dir():
-        members = get_directory_members(absolute_path)
-        entity: Union[Entity, Collection] = Collection(id=id, checksum=checksum, path=path, members=members)
-    else:
-        entity = Entity(id=id, checksum=checksum, path=path)
+    def get_entity(
+        path: Union[Path, str], checksum: Optional[str], checksums: Optional[Dict[str, str]], has_submodules: bool
+    ) -> Entity:
+        key = (revision, str(path))
+        cached_entry = _entity_cache.get(key)
+        if cached_entry and not bypass_cache:
+            return cached_entry
+
+        # NOTE: For untracked directory the hash is None; make sure to stage them first before calling this function.
+        if not checksum:
+            checksum = repository.get_object_hash(revision=revision, path=path)
+        # NOTE: If object was not found at a revision it's either removed or exists in a different revision; keep the
+        # entity and use revision as checksum
+        checksum = checksum or resolved_revision or NON_EXISTING_ENTITY_CHECKSUM
+        id = Entity.generate_id(checksum=checksum, path=path)
+
+        absolute_path = repository.path / path
+        if str(path) != "." and absolute_path.is_dir():
+            # NOTE: Hash all files and sub-directories of the top-level directory at once instead of one at a time
+            if checksums is None:
+                checksums = repository.get_directory_object_hashes(path=path, revision=resolved_revision)
+                # NOTE: Paths in submodules are not in the tree of the repository and must be looked up one by one
+                has_submodules = len(repository.submodules) > 0  # type: ignore
+            members = get_directory_members(absolute_path, checksums, has_submodules)
+            entity: Union[Entity, Collection] = Collection(id=id, checksum=checksum, path=path, members=members)
+        else:
+            entity = Entity(id=id, checksum=checksum, path=path)
+
+        _entity_cache[key] = entity
 
-    _entity_cache[key] = entity
+        return entity
 
-    return entity
+    return get_entity(path, checksum, checksums=None, has_submodules=False)
 
 
 def get_git_path(path: Union[Path, str] = ".") -> Path:
@@ -634,6 +642,7 @@ def clone_renku_repository(
     checkout_revision=None,
     use_renku_credentials: bool = False,
     reuse_existing_repository: bool = False,
+    clone_options: Optional[List[str]] = None,
 ) -> "Repository":
     """Clone a Renku Repository.
 
@@ -653,6 +662,7 @@ def clone_renku_repository(
         checkout_revision: The revision to check out after clone (Default value = None).
         use_renku_credentials(bool, optional): Whether to use Renku provided credentials (Default value = False).
         reuse_existing_repository(bool, optional): Whether to clone over an existing repository (Default value = False).
+        clone_options(List[str], optional): Additional clone options (Default value = None).
 
     Returns:
         The cloned repository.
@@ -661,7 +671,7 @@ def clone_renku_repository(
 
     parsed_url = parse_git_url(url)
 
-    clone_options = None
+    clone_options = list(clone_options or [])
     create_backup = False
 
     if parsed_url.hostname == "localhost":
@@ -674,7 +684,7 @@ def clone_renku_repository(
         and use_renku_credentials
         and has_credentials_for_hostname(parsed_url.hostname)  # NOTE: Don't change remote URL if no credentials exist
     ):
-        clone_options = [f"--config credential.helper='!renku credentials --hostname {parsed_url.hostname}'"]
+        clone_options.append(f"--config credential.helper='!renku credentials --hostname {parsed_url.hostname}'")
         deployment_hostname = deployment_hostname or parsed_url.hostname
         git_url = get_renku_repo_url(url, deployment_hostname=deployment_hostname, access_token=None)
         create_backup = True
@@ -694,7 +704,7 @@ def clone_renku_repository(
         config=config,
         raise_git_except=raise_git_except,
         checkout_revision=checkout_revision,
-        clone_options=clone_options,
+        clone_options=clone_options or None,
     )
 
     if create_backup:
@@ -1043,21 +1053,21 @@ def with_commit(
 def prepare_commit(*, repository: "Repository", commit_only=None, skip_dirty_checks=False, skip_staging: bool = False):
     """Gather information about repo needed for committing later on."""
 
-    def ensure_not_untracked(path):
+    def ensure_not_untracked(path, untracked_files: List[str]):
         """Ensure that path is not part of git untracked files."""
-        for file_path in repository.untracked_files:
+        for file_path in untracked_files:
             is_parent = (repository.path / file_path).parent == (repository.path / path)
             is_equal = str(path) == file_path
 
             if is_parent or is_equal:
                 raise errors.DirtyRenkuDirectory(repository)
 
-    def ensure_not_staged(path):
+    def ensure_not_staged(path, staged_files: List[str]):
         """Ensure that path is not part of git staged files."""
         path = str(path)
-        for file_path in repository.staged_changes:
-            is_parent = str(file_path.a_path).startswith(path)
-            is_equal = path == file_path.a_path
+        for file_path in staged_files:
+            is_parent = file_path.startswith(path)
+            is_equal = path == file_path
 
             if is_parent or is_equal:
                 raise errors.DirtyRenkuDirectory(repository)
@@ -1077,14 +1087,43 @@ def prepare_commit(*, repository: "Repository", commit_only=None, skip_dirty_che
             file for file in repository.untracked_files if STARTED_AT - int(Path(file).stat().st_ctime * 1e3) >= 1e3
         }
 
-    if isinstance(commit_only, list) and not skip_dirty_checks:
+    if isinstance(commit_only, list) and not skip_dirty_checks and commit_only:
+        # NOTE: Take a single snapshot of the repository status instead of querying it for each path
+        untracked_files = repository.untracked_files
+        staged_files = [str(d.a_path) for d in repository.staged_changes]
+
         for path in commit_only:
-            ensure_not_untracked(path)
-            ensure_not_staged(path)
+            ensure_not_untracked(path, untracked_files)
+            ensure_not_staged(path, staged_files)
 
     return diff_before
 
 
+def _get_paths_to_stage(
+    repository: "Repository", paths: List[Union[Path, str]], change_types: Dict[str, DiffChangeType]
+) -> Tuple[List[str], List[str]]:
+    """Split paths into existing paths that must be added and deleted paths that must be removed from the index.
+
+    Args:
+        repository("Repository"): The current repository.
+        paths(List[Union[Path, str]]): Paths to stage.
+        change_types(Dict[str, DiffChangeType]): Change types of paths from a snapshot of the repository status.
+
+    Returns:
+        Tuple[List[str], List[str]]: A tuple of existing paths and deleted paths.
+    """
+    paths_to_add = []
+    deleted_paths = []
+
+    for path in dict.fromkeys(str(p) for p in paths):
+        if (repository.path / path).exists():
+            paths_to_add.append(path)
+        elif change_types.get(path) == DiffChangeType.DELETED:
+            deleted_paths.append(path)
+
+    return paths_to_add, deleted_paths
+
+
 def finalize_commit(
     *,
     diff_before,
@@ -1122,23 +1161,26 @@ def finalize_commit(
         commit_only = list(diff_after - diff_before)
 
     if isinstance(commit_only, list):
-        for path_ in commit_only:
-            p = repository.path / path_
-            if p.exists() or change_types.get(str(path_)) == DiffChangeType.DELETED:
-                repository.add(path_)
+        paths_to_add, deleted_paths = _get_paths_to_stage(
+            repository=repository, paths=commit_only, change_types=change_types
+        )
+        # NOTE: Stage all paths in bulk instead of spawning a git process for each path
+        repository.add(*paths_to_add)
+        repository.remove(*deleted_paths, index=True, not_exists_ok=True)
 
     if not commit_only:
         repository.add(all=True)
 
-    try:
-        diffs = [d.a_path for d in repository.staged_changes]
-    except errors.GitError:
-        diffs = []
+    if not commit_empty:
+        try:
+            diffs = [d.a_path for d in repository.staged_changes]
+        except errors.GitError:
+            diffs = []
 
-    if not commit_empty and not diffs:
-        if raise_if_empty:
-            raise errors.NothingToCommit()
-        return
+        if not diffs:
+            if raise_if_empty:
+                raise errors.NothingToCommit()
+            return
 
     if commit_message and not isinstance(commit_message, str):
         raise errors.CommitMessageEmpty()
@@ -29,6 +29,7 @@ from typing import Any, BinaryIO, Dict, Generator, List, Optional, Sequence, Uni
 from renku.core import errors
 
 BLOCK_SIZE = 4096
+COPY_BUFFER_SIZE = 1024 * 1024
 
 
 def get_relative_path_to_cwd(path: Union[Path, str]) -> str:
@@ -296,6 +297,102 @@ def hash_file_descriptor(file: BinaryIO, hash_type: str = "sha256") -> str:
     return hash_value.hexdigest()
 
 
+class GitBlobHash:
+    """Calculate a git blob object hash (``git hash-object`` without filters) incrementally.
+
+    NOTE: The blob header contains the content size so it must be known beforehand.
+    """
+
+    def __init__(self, size: int):
+        self._hash = hashlib.sha1(f"blob {size}\0".encode())  # nosec
+
+    def update(self, data: bytes) -> None:
+        """Feed more content into the hash."""
+        self._hash.update(data)
+
+    def hexdigest(self) -> str:
+        """Return the git hash of the content."""
+        return self._hash.hexdigest()
+
+
+def _get_hashers(hash_types: Sequence[str], size: int) -> Dict[str, Any]:
+    """Create a hasher for each hash type; ``git`` means git blob hash."""
+    hashers: Dict[str, Any] = {}
+
+    for hash_type in hash_types:
+        hash_type = hash_type.lower()
+        if hash_type == "git":
+            hashers[hash_type] = GitBlobHash(size=size)
+        elif hash_type in ("sha256", "md5"):
+            hashers[hash_type] = hashlib.sha256() if hash_type == "sha256" else hashlib.md5()  # nosec
+        else:
+            raise errors.ParameterError(f"Invalid hash type: {hash_type}")
+
+    return hashers
+
+
+def hash_file_multiple(path: Union[Path, str], hash_types: Sequence[str]) -> Dict[str, str]:
+    """Calculate multiple hashes of a file by reading it only once.
+
+    Args:
+        path(Union[Path, str]): Path of the file.
+        hash_types(Sequence[str]): Hash types to calculate (``md5``, ``sha256``, or ``git``).
+
+    Returns:
+        Dict[str, str]: A mapping from hash type to its hex digest.
+    """
+    with open(path, "rb") as file:
+        hashers = _get_hashers(hash_types, size=os.fstat(file.fileno()).st_size)
+        if not hashers:
+            return {}
+
+        for block in iter(lambda: file.read(COPY_BUFFER_SIZE), b""):
+            for hasher in hashers.values():
+                hasher.update(block)
+
+    return {hash_type: hasher.hexdigest() for hash_type, hasher in hashers.items()}
+
+
+def copy_file_with_hashes(
+    source: Union[Path, str], destination: Union[Path, str], hash_types: Sequence[str]
+) -> Dict[str, str]:
+    """Copy a file and calculate its hashes in the same pass.
+
+    When no hash is requested, the copy is delegated to ``shutil.copyfile`` which uses in-kernel copies
+    (``sendfile``/``copy_file_range``) where the platform supports them.
+
+    Args:
+        source(Union[Path, str]): Source file.
+        destination(Union[Path, str]): Destination file; it is overwritten if it exists.
+        hash_types(Sequence[str]): Hash types to calculate (``md5``, ``sha256``, or ``git``).
+
+    Returns:
+        Dict[str, str]: A mapping from hash type to its hex digest.
+    """
+    if not hash_types:
+        shutil.copyfile(source, destination)
+        shutil.copymode(source, destination)
+        return {}
+
+    with open(source, "rb") as source_file, open(destination, "wb") as destination_file:
+        hashers = _get_hashers(hash_types, size=os.fstat(source_file.fileno()).st_size)
+        buffer = bytearray(COPY_BUFFER_SIZE)
+        view = memoryview(buffer)
+
+        while True:
+            length = source_file.readinto(buffer)
+            if not length:
+                break
+            block = view[:length]
+            for hasher in hashers.values():
+                hasher.update(block)
+            destination_file.write(block)
+
+    shutil.copymode(source, destination)
+
+    return {hash_type: hasher.hexdigest() for hash_type, hasher in hashers.items()}
+
+
 def safe_read_yaml(path: Union[Path, str]) -> Dict[str, Any]:
     """Parse a YAML file.
 
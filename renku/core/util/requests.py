@@ -19,12 +19,19 @@ This module provides some wrapper functions around ``requests`` library. It sets
 whenever needed. Use this module instead of ``requests``.
 """
 
+import concurrent.futures
+import hashlib
+import itertools
 import os
+import re
+import shutil
 import tempfile
+import threading
+import time
 import urllib
-from contextlib import contextmanager
+import uuid
 from pathlib import Path
-from typing import Union
+from typing import Callable, Dict, Optional, Set, Tuple, Union
 
 import patoolib
 import requests
@@ -34,6 +41,13 @@ from urllib3.util.retry import Retry
 from renku.core import errors
 
 _RENKU_REQUESTS_TIMEOUT_SECONDS = float(os.getenv("RENKU_REQUESTS_TIMEOUT_SECONDS", 1200))
+_RENKU_REQUESTS_POOL_CONNECTIONS = int(os.getenv("RENKU_REQUESTS_POOL_CONNECTIONS", 10))
+_RENKU_REQUESTS_POOL_MAXSIZE = int(os.getenv("RENKU_REQUESTS_POOL_MAXSIZE", 10))
+_RENKU_DOWNLOAD_SEGMENTS = int(os.getenv("RENKU_DOWNLOAD_SEGMENTS", 1))
+_RENKU_PARTIAL_DOWNLOAD_MAX_AGE = float(os.getenv("RENKU_PARTIAL_DOWNLOAD_MAX_AGE", 7 * 24 * 60 * 60))
+_SEGMENTED_DOWNLOAD_MIN_SIZE = 64 * 1024 * 1024
+_DOWNLOAD_ATTEMPTS = 3
+_CONTENT_RANGE_PATTERN = re.compile(r"bytes (\d+)-\d+/(\d+|\*)")
 
 
 class _CustomTimeout(TimeoutSauce):
@@ -84,19 +98,22 @@ def patch(url, *, json=None, files=None, headers=None, params=None):
 
 
 def _request(verb: str, url: str, *, allow_redirects=True, data=None, files=None, headers=None, json=None, params=None):
+    session = get_session()
     try:
-        with _retry() as session:
-            return getattr(session, verb)(
-                url=url,
-                allow_redirects=allow_redirects,
-                data=data,
-                files=files,
-                headers=headers,
-                json=json,
-                params=params,
-            )
+        return getattr(session, verb)(
+            url=url,
+            allow_redirects=allow_redirects,
+            data=data,
+            files=files,
+            headers=headers,
+            json=json,
+            params=params,
+        )
     except (ConnectionError, requests.RequestException, urllib.error.HTTPError) as e:
         raise errors.RequestError(f"{verb.upper()} request failed for {url}") from e
+    finally:
+        # NOTE: Don't leak cookies between unrelated requests
+        session.cookies.clear()
 
 
 def get_redirect_url(url) -> str:
@@ -120,9 +137,35 @@ def check_response(response):
         raise errors.RequestError(message)
 
 
-def download_file(base_directory: Union[Path, str], url: str, filename, extract, chunk_size=16384):
-    """Download a URL to a given location."""
-    from renku.core.util import communication
+def download_file(
+    base_directory: Union[Path, str],
+    url: str,
+    filename,
+    extract,
+    chunk_size=16384,
+    checksum: Optional[str] = None,
+    segments: int = _RENKU_DOWNLOAD_SEGMENTS,
+):
+    """Download a URL to a given location.
+
+    Downloads are written to a partial file in ``base_directory`` which is kept if the download fails, so that a later
+    download of the same URL continues from where it stopped if the server supports range requests. Partial files that
+    weren't touched for ``RENKU_PARTIAL_DOWNLOAD_MAX_AGE`` seconds (default is a week) are removed.
+
+    Args:
+        base_directory(Union[Path, str]): Directory to store partial and downloaded files in.
+        url(str): URL to download.
+        filename: Name of the downloaded file; it's taken from response headers or the URL if not set.
+        extract: Whether to extract the downloaded file if it's an archive.
+        chunk_size: Size of chunks to read from the response (Default value = 16384).
+        checksum(Optional[str]): Expected checksum of the file in ``<algorithm>:<hex digest>`` format; ``md5`` and
+            ``sha256`` are supported (Default value = None).
+        segments(int): Number of concurrent range requests to use for large files (Default value =
+            ``RENKU_DOWNLOAD_SEGMENTS`` environment variable or 1).
+
+    Returns:
+        Tuple[Path, List[Path]]: Directory of the downloaded files and list of downloaded files.
+    """
 
     def extract_dataset(filepath):
         """Extract downloaded file."""
@@ -137,41 +180,325 @@ def download_file(base_directory: Union[Path, str], url: str, filename, extract,
 
     tmp_root = Path(base_directory)
     tmp_root.mkdir(parents=True, exist_ok=True)
-    tmp = tempfile.mkdtemp(dir=tmp_root)
+    _remove_stale_partial_downloads(tmp_root)
 
-    try:
-        with requests.get(url, stream=True, allow_redirects=True) as response:
-            response.raise_for_status()
+    with _PartialDownload(base_directory=tmp_root, url=url, checksum=checksum) as partial_file:
+        filename = _download(url, partial_file, filename, chunk_size, segments)
+
+        if not partial_file.has_checksum():
+            partial_file.delete()
+            raise errors.RequestError(f"Checksum of the file downloaded from {url} doesn't match '{checksum}'")
 
-            if not filename:
-                filename = get_filename_from_headers(response)
+        download_to = Path(tempfile.mkdtemp(dir=tmp_root)) / filename
+        partial_file.finish(download_to)
 
-            if not filename:
-                u = urllib.parse.urlparse(url)
-                filename = Path(u.path).name
-                if not filename:
-                    raise errors.ParameterError(f"URL Cannot find a file to download from {url}")
+    if extract:
+        return extract_dataset(download_to)
 
-            download_to = Path(tmp) / filename
-            with open(str(download_to), "wb") as file_:
-                total_size = int(response.headers.get("content-length", 0))
+    return download_to.parent, [download_to]
 
-                communication.start_progress(name=filename, total=total_size)
-                try:
-                    for chunk in response.iter_content(chunk_size=chunk_size):
-                        if chunk:  # ignore keep-alive chunks
-                            file_.write(chunk)
-                            communication.update_progress(name=filename, amount=len(chunk))
-                finally:
-                    communication.finalize_progress(name=filename)
 
+def _download(url: str, partial_file: "_PartialDownload", filename, chunk_size: int, segments: int) -> str:
+    """Download a URL into a partial file, resuming it if possible, and return the file's name.
+
+    NOTE: Progress is started and finalized once for all attempts since progress callbacks (e.g. in the service) may
+    store the progress in a job.
+    """
+    from renku.core.util import communication
+
+    session = get_session()
+    progress_name: Optional[str] = None
+    reported = 0
+
+    def report_progress(position: int):
+        nonlocal reported
+        # NOTE: Don't report data that was already reported in a previous attempt
+        if position > reported:
+            communication.update_progress(name=progress_name, amount=position - reported)
+            reported = position
+
+    try:
+        for attempt in range(_DOWNLOAD_ATTEMPTS):
+            try:
+                with session.get(
+                    url, stream=True, allow_redirects=True, headers=partial_file.get_range_headers()
+                ) as response:
+                    if response.status_code == 416:  # NOTE: Range not satisfiable; the partial file isn't valid
+                        partial_file.delete()
+                        continue
+
+                    response.raise_for_status()
+
+                    if not filename:
+                        filename = get_filename_from_headers(response)
+
+                    if not filename:
+                        u = urllib.parse.urlparse(url)
+                        filename = Path(u.path).name
+                        if not filename:
+                            raise errors.ParameterError(f"URL Cannot find a file to download from {url}")
+
+                    offset = partial_file.start(response)
+                    if offset is None:  # NOTE: The response doesn't continue the partial file; download it again
+                        continue
+
+                    total_size = offset + int(response.headers.get("content-length", 0))
+
+                    if progress_name is None:
+                        progress_name = filename
+                        communication.start_progress(name=progress_name, total=total_size)
+                    report_progress(offset)
+
+                    if offset == 0 and segments > 1 and _supports_segments(response, partial_file, total_size):
+                        response.close()
+                        _download_segments(url, partial_file, total_size, segments, report_progress)
+                    else:
+                        position = offset
+                        with open(partial_file.path, "ab") as file_:
+                            for chunk in response.iter_content(chunk_size=chunk_size):
+                                if chunk:  # ignore keep-alive chunks
+                                    partial_file.write(file_, chunk)
+                                    position += len(chunk)
+                                    report_progress(position)
+
+                        # NOTE: The server closed the connection before sending the whole content; the length of
+                        # encoded content isn't comparable with the decoded content that is written to the file
+                        if (
+                            "content-length" in response.headers
+                            and "content-encoding" not in response.headers
+                            and position < total_size
+                        ):
+                            raise requests.exceptions.ConnectionError(
+                                f"Connection closed after {position} of {total_size} bytes"
+                            )
+            except (requests.exceptions.ConnectionError, requests.exceptions.ChunkedEncodingError) as e:
+                # NOTE: Resume the download if connection dropped
+                if attempt == _DOWNLOAD_ATTEMPTS - 1:
+                    raise errors.RequestError(f"Cannot download from {url}") from e
+                continue
+
+            break
+        else:
+            raise errors.RequestError(f"Cannot download from {url}")
     except (requests.exceptions.HTTPError, urllib.error.HTTPError) as e:  # pragma nocover
         raise errors.RequestError(f"Cannot download from {url}") from e
+    finally:
+        session.cookies.clear()
+        if progress_name is not None:
+            communication.finalize_progress(name=progress_name)
 
-    if extract:
-        return extract_dataset(download_to)
+    return filename
 
-    return download_to.parent, [download_to]
+
+class _PartialDownload:
+    """A file that is being downloaded along with the validator of its content on the server.
+
+    If a checksum is passed, the file is hashed while it's being written.
+    """
+
+    def __init__(self, base_directory: Path, url: str, checksum: Optional[str] = None):
+        name = hashlib.sha256(url.encode("utf-8")).hexdigest()
+
+        with _partial_downloads_lock:
+            # NOTE: Don't share the partial file if the same URL is being downloaded concurrently
+            if base_directory / f"{name}.part" in _partial_downloads:
+                name = f"{name}-{uuid.uuid4().hex}"
+            self.path = base_directory / f"{name}.part"
+            _partial_downloads.add(self.path)
+
+        self._validator_path = base_directory / f"{name}.part.validator"
+
+        hash_type, _, value = (checksum or "").partition(":")
+        # NOTE: Unsupported hash types are ignored
+        self._checksum: Optional[Tuple[str, str]] = (
+            (hash_type.lower(), value.lower()) if value and hash_type.lower() in ("md5", "sha256") else None
+        )
+        self._hasher = None
+        self._hashed_size = 0
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *_):
+        with _partial_downloads_lock:
+            _partial_downloads.discard(self.path)
+
+    @property
+    def validator(self) -> Optional[str]:
+        """ETag or Last-Modified value of the file on the server if it supports range requests."""
+        return self._validator_path.read_text() if self._validator_path.exists() else None
+
+    def get_range_headers(self) -> Dict[str, str]:
+        """Return headers to continue an existing partial download."""
+        size = self.path.stat().st_size if self.path.exists() else 0
+        validator = self.validator
+
+        if not size or not validator:
+            return {}
+
+        # NOTE: ``If-Range`` makes the server send the whole file if it changed since the partial download
+        return {"Range": f"bytes={size}-", "If-Range": validator}
+
+    def start(self, response) -> Optional[int]:
+        """Prepare the partial file for a response and return the offset to write the response content at.
+
+        Returns ``None`` and deletes the partial file if the response is a range that doesn't start at its end.
+        """
+        if response.status_code == 206:
+            offset = self.path.stat().st_size if self.path.exists() else 0
+            match = _CONTENT_RANGE_PATTERN.fullmatch(response.headers.get("content-range", "").strip())
+            if not offset or not match or int(match.group(1)) != offset:
+                self.delete()
+                return None
+
+            self._resume_hash(offset)
+            return offset
+
+        self.path.write_bytes(b"")
+        self._reset_hash()
+
+        validator = response.headers.get("etag") or response.headers.get("last-modified")
+        # NOTE: Weak ETags can't be used in ``If-Range``
+        if validator and not validator.startswith("W/") and response.headers.get("accept-ranges") == "bytes":
+            self._validator_path.write_text(validator)
+        else:
+            self._validator_path.unlink(missing_ok=True)
+
+        return 0
+
+    def write(self, file_, chunk: bytes):
+        """Write a chunk at the end of the partial file and hash it."""
+        file_.write(chunk)
+        if self._hasher is not None:
+            self._hasher.update(chunk)
+            self._hashed_size += len(chunk)
+
+    def discard_hash(self):
+        """Stop hashing while writing; used when the file isn't written sequentially."""
+        self._hasher = None
+
+    def _reset_hash(self):
+        self._hasher = hashlib.new(self._checksum[0]) if self._checksum else None
+        self._hashed_size = 0
+
+    def _resume_hash(self, offset: int):
+        if not self._checksum or (self._hasher is not None and self._hashed_size == offset):
+            return
+
+        # NOTE: The partial file is from an earlier download; hash what's already downloaded
+        self._hash_existing_content()
+
+    def _hash_existing_content(self):
+        self._reset_hash()
+        with open(self.path, "rb") as file_:
+            for block in iter(lambda: file_.read(1024 * 1024), b""):
+                self._hasher.update(block)  # type: ignore[union-attr]
+                self._hashed_size += len(block)
+
+    def has_checksum(self) -> bool:
+        """Check if the downloaded file has the expected checksum; it's always True if no checksum is passed."""
+        if not self._checksum:
+            return True
+
+        if self._hasher is None or self._hashed_size != self.path.stat().st_size:
+            self._hash_existing_content()
+
+        return self._hasher.hexdigest() == self._checksum[1]  # type: ignore[union-attr]
+
+    def finish(self, destination: Path):
+        """Move the downloaded file to its destination."""
+        shutil.move(self.path, destination)
+        self._validator_path.unlink(missing_ok=True)
+
+    def delete(self):
+        """Delete the partial file."""
+        self.path.unlink(missing_ok=True)
+        self._validator_path.unlink(missing_ok=True)
+        self._reset_hash()
+
+
+def _remove_stale_partial_downloads(base_directory: Path):
+    """Remove partial downloads that weren't modified for ``RENKU_PARTIAL_DOWNLOAD_MAX_AGE`` seconds."""
+    expiration = time.time() - _RENKU_PARTIAL_DOWNLOAD_MAX_AGE
+
+    for path in itertools.chain(base_directory.glob("*.part"), base_directory.glob("*.part.validator")):
+        with _partial_downloads_lock:
+            if path in _partial_downloads or path.with_suffix("") in _partial_downloads:
+                continue
+        try:
+            if path.stat().st_mtime < expiration:
+                path.unlink()
+        except OSError:  # NOTE: The file was removed by another process
+            pass
+
+
+def _supports_segments(response, partial_file: _PartialDownload, total_size: int) -> bool:
+    """Whether a file is large enough to be downloaded in segments and the server supports range requests.
+
+    A validator is required so that segments of different versions of a file are never mixed.
+    """
+    return (
+        response.headers.get("accept-ranges") == "bytes"
+        and partial_file.validator is not None
+        and total_size >= _SEGMENTED_DOWNLOAD_MIN_SIZE
+    )
+
+
+def _download_segments(
+    url: str, partial_file: _PartialDownload, total_size: int, segments: int, report_progress: Callable[[int], None]
+):
+    """Download a file with multiple concurrent range requests.
+
+    Each request sends the validator of the first response in ``If-Range``; a server sends the whole file instead of
+    the range if the file changed, in which case the download fails.
+    """
+    validator = partial_file.validator
+    assert validator, f"Cannot download {url} in segments without a validator"
+
+    with open(partial_file.path, "wb") as file_:
+        file_.truncate(total_size)
+
+    # NOTE: Segments are written out of order; the file is hashed after the download
+    partial_file.discard_hash()
+
+    segment_size = -(-total_size // segments)
+    downloaded = [0] * segments
+
+    def download_segment(index: int):
+        start = index * segment_size
+        end = min(start + segment_size, total_size) - 1
+
+        headers = {"Range": f"bytes={start}-{end}", "If-Range": validator}
+        with get_session().get(url, stream=True, headers=headers) as response:
+            response.raise_for_status()
+            if response.status_code != 206:
+                raise errors.RequestError(f"File changed on the server while downloading {url}")
+
+            current_validator = response.headers.get("etag") or response.headers.get("last-modified")
+            if current_validator and current_validator != validator:
+                raise errors.RequestError(f"File changed on the server while downloading {url}")
+
+            with open(partial_file.path, "r+b") as file_:
+                file_.seek(start)
+                for chunk in response.iter_content(chunk_size=1024 * 1024):
+                    file_.write(chunk)
+                    downloaded[index] += len(chunk)
+
+    with concurrent.futures.ThreadPoolExecutor(segments) as executor:
+        futures = {executor.submit(download_segment, i) for i in range(segments)}
+        pending = futures
+        while pending:
+            _, pending = concurrent.futures.wait(pending, timeout=0.5)
+            # NOTE: Progress must be reported from this thread since communication listeners are thread-local
+            report_progress(sum(downloaded))
+
+        for future in futures:
+            try:
+                future.result()
+            except BaseException:
+                # NOTE: Segments cannot be resumed individually
+                partial_file.delete()
+                raise
 
 
 def get_filename_from_headers(response):
@@ -201,17 +528,47 @@ def get_filename_from_headers(response):
     return filename
 
 
-@contextmanager
-def _retry(total_requests=5, backoff_factor=0.2, statuses=(500, 502, 503, 504, 429)):
-    """Default HTTP session for requests."""
-    _session = requests.Session()
+_partial_downloads_lock = threading.Lock()
+_partial_downloads: Set[Path] = set()
+_adapter_lock = threading.Lock()
+_adapter: Optional[Tuple[int, HTTPAdapter]] = None
+_thread_local = threading.local()
 
-    retries = Retry(total=total_requests, backoff_factor=backoff_factor, status_forcelist=list(statuses))
 
-    _session.mount("http://", HTTPAdapter(max_retries=retries))
-    _session.mount("https://", HTTPAdapter(max_retries=retries))
+def _get_adapter() -> HTTPAdapter:
+    """Return the process-wide HTTP adapter.
 
-    try:
-        yield _session
-    except requests.RequestException as e:
-        raise errors.RequestError("renku operation failed due to network connection failure") from e
+    The adapter holds a connection pool per host that is shared by all threads; connections are kept alive and reused
+    between requests. A forked process creates its own adapter since sockets cannot be shared between processes.
+    """
+    global _adapter
+
+    with _adapter_lock:
+        if _adapter is None or _adapter[0] != os.getpid():
+            retries = Retry(total=5, backoff_factor=0.2, status_forcelist=[500, 502, 503, 504, 429])
+            adapter = HTTPAdapter(
+                max_retries=retries,
+                pool_connections=_RENKU_REQUESTS_POOL_CONNECTIONS,
+                pool_maxsize=_RENKU_REQUESTS_POOL_MAXSIZE,
+            )
+            _adapter = (os.getpid(), adapter)
+
+        return _adapter[1]
+
+
+def get_session() -> requests.Session:
+    """Return an HTTP session for the current thread that uses the shared connection pools.
+
+    ``requests.Session`` objects aren't thread-safe, so each thread gets its own; use this for code running in
+    ``parallel_execute`` threads instead of creating a new session.
+    """
+    adapter = _get_adapter()
+    session = getattr(_thread_local, "session", None)
+
+    if session is None or session.get_adapter("https://") is not adapter:
+        session = requests.Session()
+        session.mount("http://", adapter)
+        session.mount("https://", adapter)
+        _thread_local.session = session
+
+    return session
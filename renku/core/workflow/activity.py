@@ -19,7 +19,7 @@ import itertools
 import os
 from collections import defaultdict
 from pathlib import Path
-from typing import Dict, FrozenSet, Iterable, List, NamedTuple, Optional, Set, Tuple
+from typing import Any, Callable, Dict, FrozenSet, Iterable, List, NamedTuple, Optional, Set, Tuple
 
 import networkx
 from pydantic import ConfigDict, validate_call
@@ -33,6 +33,8 @@ from renku.domain_model.entity import Entity
 from renku.domain_model.project_context import project_context
 from renku.domain_model.provenance.activity import Activity, Usage
 
+MAX_REPORTED_CYCLES = 10
+
 
 def get_activities_until_paths(
     paths: List[str], sources: List[str], activity_gateway: IActivityGateway, revision: Optional[str] = None
@@ -67,23 +69,19 @@ def get_activities_until_paths(
 
         latest_activity = max(activities, key=lambda a: a.ended_at_time)
 
-        upstream_chains = activity_gateway.get_upstream_activity_chains(latest_activity)
+        upstream_activities = activity_gateway.get_upstream_activities(latest_activity)
+        upstream_activities.add(latest_activity)
 
         if sources:
-            # NOTE: Add the activity to check if it also matches the condition
-            upstream_chains.append((latest_activity,))
-            # NOTE: Only include paths that is using at least one of the sources
-            upstream_chains = [c for c in upstream_chains if any(u.entity.path in sources for u in c[-1].usages)]
-
-            # NOTE: Include activity only if any of its upstream match the condition
-            if upstream_chains:
-                include_newest_activity(latest_activity)
-        else:
-            include_newest_activity(latest_activity)
+            # NOTE: Only include activities that use at least one of the sources or are downstream of one that does
+            source_activities = {a for a in upstream_activities if any(u.entity.path in sources for u in a.usages)}
+            included_activities = set(source_activities)
+            for activity in source_activities:
+                included_activities.update(activity_gateway.get_downstream_activities(activity))
+            upstream_activities &= included_activities
 
-        for chain in upstream_chains:
-            for activity in chain:
-                include_newest_activity(activity)
+        for activity in upstream_activities:
+            include_newest_activity(activity)
 
     return {a for activities in all_activities.values() for a in activities}
 
@@ -165,25 +163,20 @@ def create_activity_graph(
             create_order_among_activities(values, path)
 
     def create_order_among_activities(activities: Set[Activity], path):
-        for a, b in itertools.combinations(activities, 2):
-            if (networkx.has_path(graph, a, b) and path in overridden_activities[a]) or (
-                networkx.has_path(graph, b, a) and path in overridden_activities[b]
-            ):
-                continue
+        # NOTE: Chaining activities chronologically is enough to order all of them; all but the latest are overridden
+        activities_by_date = sorted(activities, key=lambda a: (a.ended_at_time, a.started_at_time))
 
-            # NOTE: More recent activity should be executed after the other one
-            # NOTE: This won't introduce a cycle in the graph because there is no other path between the two nodes
-            comparison = a.compare_to(b)
-            if comparison < 0:
-                if not networkx.has_path(graph, a, b):
-                    graph.add_edge(a, b)
-                overridden_activities[a].add(path)
-            elif comparison > 0:
-                if not networkx.has_path(graph, b, a):
-                    graph.add_edge(b, a)
-                overridden_activities[b].add(path)
-            else:
-                raise ValueError(f"Cannot create an order between activities that generate '{path}': {a} and {b}")
+        for earlier, later in zip(activities_by_date, activities_by_date[1:]):
+            if earlier.compare_to(later) == 0:
+                raise ValueError(
+                    f"Cannot create an order between activities that generate '{path}': {earlier} and {later}"
+                )
+
+            overridden_activities[earlier].add(path)
+
+            # NOTE: Don't add redundant edges or edges that create a cycle
+            if not path_search.has_path(earlier, later) and not path_search.has_path(later, earlier):
+                path_search.add_edge(earlier, later)
 
     def remove_overridden_activities():
         to_be_removed = set()
@@ -211,23 +204,123 @@ def create_activity_graph(
                     overridden_activities[parent].add(data["path"])
                     to_be_processed.add(parent)
 
+        def is_ordering_edge(parent, child) -> bool:
+            return isinstance(parent, Activity) and isinstance(child, Activity) and "path" not in graph[parent][child]
+
         for activity in to_be_removed:
+            # NOTE: Activities that generate a common path are chained; keep the order when removing one in the middle
+            predecessors = [p for p in graph.predecessors(activity) if is_ordering_edge(p, activity)]
+            successors = [s for s in graph.successors(activity) if is_ordering_edge(activity, s)]
+            for predecessor, successor in itertools.product(predecessors, successors):
+                graph.add_edge(predecessor, successor)
+
             graph.remove_node(activity)
 
     connect_nodes_based_on_dependencies()
 
-    cycles = list(networkx.algorithms.cycles.simple_cycles(graph))
-
-    if cycles:
-        cycles = [map(lambda x: getattr(x, "id", x), cycle) for cycle in cycles]
+    if not networkx.is_directed_acyclic_graph(graph):
+        cycles = [[getattr(n, "id", n) for n in cycle] for cycle in get_cycles_sample(graph)]
         raise errors.GraphCycleError(cycles)
 
+    path_search = _OrderedPathSearch(graph)
+
     connect_nodes_by_execution_order()
     remove_overridden_activities()
 
     return graph
 
 
+def get_cycles_sample(graph: networkx.DiGraph, max_cycles: int = MAX_REPORTED_CYCLES) -> List[List]:
+    """Return at most ``max_cycles`` cycles of a graph, one from each strongly connected component.
+
+    Enumerating all simple cycles of a graph is exponential; a few of them are enough to report an error.
+
+    Args:
+        graph(networkx.DiGraph): The graph to check.
+        max_cycles(int): Maximum number of cycles to return (Default value = MAX_REPORTED_CYCLES).
+
+    Returns:
+        List[List]: List of cycles where each cycle is a list of nodes.
+    """
+    cycles = []
+
+    for component in networkx.strongly_connected_components(graph):
+        if len(cycles) >= max_cycles:
+            break
+
+        node = next(iter(component))
+        if len(component) == 1 and not graph.has_edge(node, node):
+            continue
+
+        edges = networkx.find_cycle(graph.subgraph(component), source=node)
+        cycles.append([source for source, _ in edges])
+
+    return cycles
+
+
+class _OrderedPathSearch:
+    """Search paths in a DAG using a topological order to prune the search.
+
+    A node can only reach nodes that come after it in a topological order, so a search never needs to visit nodes
+    that are sorted after the target and a query for a target that comes before the source is answered immediately.
+
+    NOTE: This isn't an index; nothing is precomputed except the order. A query is a depth-first search that visits
+    at most the nodes between the source and the target in the order, and adding an edge against the order re-sorts
+    the whole graph on the next query. Q queries take O(Q·(V+E)) in the worst case, i.e. quadratic time if all
+    generators of a common path are ordered in a graph where most nodes lie between them. Unrelated nodes are sorted
+    chronologically, so ordering edges, which go from older to newer activities, follow the order and searches
+    stay short in practice; ``tests/benchmarks/activity_graph.py`` measures this. A transitive closure would answer
+    queries in constant time but needs O(V²) memory, e.g. 300 MB of bitsets for 50,000 activities.
+    """
+
+    def __init__(self, graph: networkx.DiGraph):
+        self._graph = graph
+        self._positions: Dict[Any, int] = {}
+
+    def _get_positions(self) -> Dict[Any, int]:
+        if not self._positions:
+            # NOTE: Sort unrelated activities chronologically so that ordering edges rarely invalidate the order
+            def key(node) -> Tuple[float, float]:
+                if isinstance(node, Activity):
+                    return node.ended_at_time.timestamp(), node.started_at_time.timestamp()
+                return 0.0, 0.0
+
+            order = networkx.lexicographical_topological_sort(self._graph, key=key)
+            self._positions = {node: position for position, node in enumerate(order)}
+
+        return self._positions
+
+    def has_path(self, source, target) -> bool:
+        """Return whether there is a path from ``source`` to ``target``."""
+        positions = self._get_positions()
+        target_position = positions[target]
+
+        if positions[source] > target_position:
+            return False
+
+        visited = {source}
+        stack = [source]
+        while stack:
+            node = stack.pop()
+            if node == target:
+                return True
+            for successor in self._graph.successors(node):
+                if successor not in visited and positions[successor] <= target_position:
+                    visited.add(successor)
+                    stack.append(successor)
+
+        return False
+
+    def add_edge(self, source, target):
+        """Add an edge that doesn't create a cycle to the graph."""
+        self._graph.add_edge(source, target)
+
+        positions = self._get_positions()
+        if positions[source] > positions[target]:
+            # NOTE: The topological order isn't valid anymore; re-create it when needed
+            self._positions = {}
+
+
 def sort_activities(activities: List[Activity], remove_overridden_parents=True) -> List[Activity]:
     """Return a sorted list of activities based on their dependencies and execution order."""
     graph = create_activity_graph(activities, remove_overridden_parents)
@@ -312,33 +405,58 @@ def get_downstream_generating_activities(
 
         return False
 
+    condition: Optional[Callable[[Activity], bool]]
+    if paths:
+        condition = does_activity_generate_any_paths
+    elif ignore_deleted:  # NOTE: Excluded deleted generations only if they are not passed in ``paths``
+        condition = has_an_existing_generation
+    else:
+        condition = None
+
+    # NOTE: Whether an activity or any of its downstream activities match the condition; shared between all starting
+    # activities since their downstream graphs usually overlap.
+    matches_condition: Dict[Activity, bool] = {}
+
+    def does_activity_chain_match(activity) -> bool:
+        stack = [(activity, False)]
+        current_path = set()
+        while stack:
+            current, expanded = stack.pop()
+            if expanded:
+                assert condition is not None
+                current_path.discard(current)
+                children = activity_gateway.get_downstream_activities(current, max_depth=1)
+                matches_condition[current] = condition(current) or any(matches_condition.get(c) for c in children)
+            elif current not in matches_condition:
+                current_path.add(current)
+                stack.append((current, True))
+                children = activity_gateway.get_downstream_activities(current, max_depth=1)
+                # NOTE: Skip activities on the current path to not loop forever on a corrupt (cyclic) catalog
+                stack.extend((c, False) for c in children if c not in matches_condition and c not in current_path)
+
+        return matches_condition[activity]
+
     for starting_activity in starting_activities:
-        downstream_chains = activity_gateway.get_downstream_activity_chains(starting_activity)
-
-        if paths:
-            # NOTE: Add the activity to check if it also matches the condition
-            downstream_chains.append((starting_activity,))
-            downstream_chains = [c for c in downstream_chains if does_activity_generate_any_paths(c[-1])]
-            # NOTE: Include activity only if any of its downstream matched the condition
-            include_starting_activity = len(downstream_chains) > 0
-        elif ignore_deleted:  # NOTE: Excluded deleted generations only if they are not passed in ``paths``
-            # NOTE: Add the activity to check if it also matches the condition
-            downstream_chains.append((starting_activity,))
-            downstream_chains = [c for c in downstream_chains if has_an_existing_generation(c[-1])]
-            # NOTE: Include activity only if any of its downstream matched the condition
-            include_starting_activity = len(downstream_chains) > 0
-        else:
-            include_starting_activity = True
+        if condition is not None and not does_activity_chain_match(starting_activity):
+            continue
 
-        if include_starting_activity:
-            include_newest_activity(starting_activity)
+        # NOTE: Include the activity only if any of its downstream matched the condition
+        include_newest_activity(starting_activity)
 
-        for chain in downstream_chains:
-            for activity in chain:
+        # NOTE: Walk downstream and don't process activities after an invalid one as the plan in question was deleted
+        visited = {starting_activity}
+        stack = [starting_activity]
+        while stack:
+            current = stack.pop()
+            for activity in activity_gateway.get_downstream_activities(current, max_depth=1):
+                if activity in visited:
+                    continue
+                visited.add(activity)
                 if not is_activity_valid(activity):
-                    # don't process further downstream activities as the plan in question was deleted
-                    break
-                include_newest_activity(activity)
+                    continue
+                if condition is None or does_activity_chain_match(activity):
+                    include_newest_activity(activity)
+                stack.append(activity)
 
     return list({a for activities in all_activities.values() for a in activities})
 
@@ -32,6 +32,7 @@ from renku.core.plugin.provider import execute
 from renku.core.util import communication
 from renku.core.util.datetime8601 import local_now
 from renku.core.util.os import is_subpath, safe_read_yaml
+from renku.core.workflow.execution_cache import is_execution_cache_enabled, restore_cached_steps
 from renku.core.workflow.model.concrete_execution_graph import ExecutionGraph
 from renku.core.workflow.plan import is_plan_removed
 from renku.core.workflow.plan_factory import delete_indirect_files_list
@@ -53,6 +54,7 @@ def execute_workflow_graph(
     provider="toil",
     config=None,
     workflow_file_plan: Optional[WorkflowFileCompositePlan] = None,
+    use_cache: Optional[bool] = None,
 ):
     """Execute a Run with/without subprocesses.
 
@@ -64,6 +66,8 @@ def execute_workflow_graph(
         config: Path to config for the workflow provider (Default value = None).
         workflow_file_plan (Optional[WorkflowFileCompositePlan): If passed, a workflow file is executed, so, store
             related metadata.
+        use_cache(Optional[bool]): Whether to restore outputs of steps that ran before with the same parameter values
+            and inputs instead of running them; defaults to the ``execution_cache`` setting (Default value = None).
     """
     inputs = {i.actual_value for p in dag.nodes for i in p.inputs}
     # NOTE: Pull inputs from Git LFS or other storage backends
@@ -84,7 +88,17 @@ def execute_workflow_graph(
 
     started_at_time = local_now()
 
-    execute(dag=dag, basedir=project_context.path, provider=provider, config=config)
+    if use_cache is None:
+        use_cache = is_execution_cache_enabled()
+
+    cached_steps = restore_cached_steps(dag) if use_cache else {}
+    if cached_steps:
+        communication.echo(f"Restored outputs of {len(cached_steps)} unchanged step(s) from earlier executions.")
+
+    remaining_dag = dag.copy()
+    remaining_dag.remove_nodes_from(cached_steps)
+    if remaining_dag.number_of_nodes() > 0:
+        execute(dag=remaining_dag, basedir=project_context.path, provider=provider, config=config)
 
     ended_at_time = local_now()
 
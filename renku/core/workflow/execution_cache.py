@@ -0,0 +1,144 @@
+# Copyright Swiss Data Science Center (SDSC). A partnership between
+# École Polytechnique Fédérale de Lausanne (EPFL) and
+# Eidgenössische Technische Hochschule Zürich (ETHZ).
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+"""Reuse outputs of workflow steps that ran before with the same plan, parameter values and inputs."""
+
+from typing import TYPE_CHECKING, Dict, List, Optional
+
+from renku.command.command_builder import inject
+from renku.core import errors
+from renku.core.interface.activity_gateway import IActivityGateway
+from renku.domain_model.entity import Collection
+from renku.domain_model.project_context import project_context
+from renku.domain_model.provenance.activity import Activity
+from renku.domain_model.workflow.plan import Plan
+
+if TYPE_CHECKING:
+    from networkx import DiGraph
+
+
+def is_execution_cache_enabled() -> bool:
+    """Return whether workflow steps may reuse outputs of earlier activities."""
+    from renku.core.config import get_value
+
+    return str(get_value("renku", "execution_cache")).lower() == "true"
+
+
+def restore_cached_steps(dag: "DiGraph") -> Dict[Plan, Activity]:
+    """Restore outputs of steps of a workflow graph that ran before with the same parameter values and inputs.
+
+    Steps are visited in topological order and a step is only restored if all of its upstream steps were restored, so
+    that checksums of its inputs are known before it runs.
+
+    Args:
+        dag(DiGraph): The workflow graph to execute.
+
+    Returns:
+        Dict[Plan, Activity]: Restored steps and the earlier activities whose outputs were restored.
+    """
+    import networkx as nx
+
+    restored: Dict[Plan, Activity] = {}
+
+    for plan in nx.topological_sort(dag):
+        if any(upstream not in restored for upstream in dag.predecessors(plan)):
+            continue
+
+        activity = find_cached_activity(plan)
+        if activity is None:
+            continue
+
+        _restore_generations(activity)
+        restored[plan] = activity
+
+    return restored
+
+
+@inject.autoparams("activity_gateway")
+def find_cached_activity(plan: Plan, activity_gateway: IActivityGateway) -> Optional[Activity]:
+    """Return an earlier activity of a plan with the same parameter values and input checksums.
+
+    NOTE: Only steps whose inputs and outputs are files are cached, since checksums of directories are taken from the
+    last commit and don't reflect uncommitted changes.
+
+    Args:
+        plan(Plan): The step to look up with its values resolved.
+        activity_gateway(IActivityGateway): The injected activity gateway.
+
+    Returns:
+        Optional[Activity]: An activity whose outputs can be restored or None.
+    """
+    if not plan.outputs:
+        return None
+
+    input_paths = [str(i.actual_value) for i in plan.inputs + plan.hidden_inputs]
+    output_paths = [str(o.actual_value) for o in plan.outputs]
+    if any((project_context.path / path).is_dir() for path in input_paths + output_paths):
+        return None
+
+    input_checksums = project_context.repository.get_object_hashes(input_paths)  # type: ignore
+    if any(checksum is None for checksum in input_checksums.values()):
+        return None
+
+    parameter_values = {(p.id, str(p.actual_value)) for p in plan.inputs + plan.outputs + plan.parameters}
+
+    for activity in activity_gateway.get_activities_by_generation(output_paths[0]):
+        if activity.association.plan.id != plan.id:
+            continue
+        elif {(v.parameter_id, str(v.value)) for v in activity.parameters} != parameter_values:
+            continue
+        elif {u.entity.path: u.entity.checksum for u in activity.usages + activity.hidden_usages} != input_checksums:
+            continue
+        elif not _can_restore(activity.generations):
+            continue
+
+        return activity
+
+    return None
+
+
+def _can_restore(generations: List) -> bool:
+    """Whether outputs of an activity are files that exist in the repository."""
+    repository = project_context.repository
+
+    for generation in generations:
+        if isinstance(generation.entity, Collection):
+            return False
+
+        try:
+            if repository.run_git_command("cat-file", "-t", generation.entity.checksum) != "blob":
+                return False
+        except errors.GitCommandError:
+            return False
+
+    return True
+
+
+def _restore_generations(activity: Activity):
+    """Write outputs of an activity to the working tree; smudge filters (e.g. git LFS) are applied."""
+    repository = project_context.repository
+
+    for generation in activity.generations:
+        path = project_context.path / generation.entity.path
+        path.parent.mkdir(parents=True, exist_ok=True)
+
+        with open(path, "wb") as output:
+            repository.run_git_command(
+                "cat-file",
+                "--filters",
+                f"--path={generation.entity.path}",
+                generation.entity.checksum,
+                output_stream=output,
+            )
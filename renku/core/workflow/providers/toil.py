@@ -23,7 +23,7 @@ import uuid
 from abc import abstractmethod
 from pathlib import Path
 from subprocess import call
-from typing import Any, Callable, Dict, List, Union, cast
+from typing import Any, Callable, Dict, List, Optional, Union, cast
 
 import networkx as nx
 from toil.common import Toil
@@ -45,11 +45,16 @@ from renku.domain_model.workflow.provider import IWorkflowProvider
 
 
 class AbstractToilJob(Job):
-    """Toil job implementation for a renku ``Plan``."""
+    """Toil job implementation for a renku ``Plan``.
 
-    def __init__(self, workflow: Plan, *args, **kwargs):
+    If ``basedir`` is set, the job runs in place in the project's working tree: it reads inputs and writes outputs there
+    instead of copying them from and to toil's job store.
+    """
+
+    def __init__(self, workflow: Plan, *args, basedir: Optional[Path] = None, **kwargs):
         super().__init__(unitName=workflow.name, displayName=workflow.name, *args, **kwargs)
         self.workflow: Plan = workflow
+        self.basedir: Optional[Path] = basedir
         self._input_files: Dict[str, FileID] = {}
         self._parents_promise: List[Promise] = []
         self._environment = os.environ.copy()
@@ -70,24 +75,33 @@ class AbstractToilJob(Job):
         """
         self._parents_promise.append(promise)
 
+    @property
+    def working_directory(self) -> Path:
+        """Directory that the command runs in."""
+        return self.basedir or Path.cwd()
+
     def run(self, storage):
         """Executing of a renku ``Plan``."""
+        working_directory = self.working_directory
         mapped_std = dict()
         parent_inputs = dict()
         for p in self._parents_promise:
             parent_inputs.update(p)
 
         def _read_input(input: str, file_metadata):
-            input_path = Path(input)
+            input_path = working_directory / input
 
-            if isinstance(file_metadata, dict):
+            if self.basedir:
+                # NOTE: Inputs are either in the project or were written in place by upstream jobs
+                return
+            elif isinstance(file_metadata, dict):
                 input_path.mkdir(parents=True, exist_ok=True)
                 for path, file_id in file_metadata.items():
                     _read_input(path, file_id)
             elif not input_path.exists():
                 if len(input_path.parts) > 1:
                     input_path.parent.mkdir(parents=True, exist_ok=True)
-                storage.readGlobalFile(file_metadata, userPath=input)
+                storage.readGlobalFile(file_metadata, userPath=str(input_path))
 
         for i in self.workflow.inputs:
             file_metadata = (
@@ -102,8 +116,8 @@ class AbstractToilJob(Job):
 
         for o in self.workflow.outputs:
             self._environment[f"{RENKU_ENV_PREFIX}{o.name}"] = str(o.actual_value)
-            output_path = Path(o.actual_value)
-            if len(output_path.parts) > 1:
+            output_path = working_directory / o.actual_value
+            if len(Path(o.actual_value).parts) > 1:
                 output_path.parent.mkdir(parents=True, exist_ok=True)
 
             if o.mapped_to:
@@ -136,9 +150,9 @@ class AbstractToilJob(Job):
         if return_code not in (self.workflow.success_codes or {0}):
             raise errors.InvalidSuccessCode(return_code, success_codes=self.workflow.success_codes)
 
-        return _upload_files(
-            storage.writeGlobalFile, cast(List[CommandParameterBase], self.workflow.outputs), Path.cwd()
-        )
+        import_function = _link_location if self.basedir else storage.writeGlobalFile
+        outputs = cast(List[CommandParameterBase], self.workflow.outputs)
+        return _upload_files(import_function, outputs, working_directory)
 
 
 class SubprocessToilJob(AbstractToilJob):
@@ -151,9 +165,9 @@ class SubprocessToilJob(AbstractToilJob):
         """Executes a given command line."""
         return call(
             command_line,
-            cwd=os.getcwd(),
+            cwd=self.working_directory,
             **{  # type: ignore
-                key: open(value, mode="r" if key == "stdin" else "w")
+                key: open(self.working_directory / value, mode="r" if key == "stdin" else "w")
                 for key, value in mapped_std.items()  # type: ignore
             },
             env=self._environment,
@@ -186,7 +200,7 @@ class DockerToilJob(AbstractToilJob):
 
         if "working_dir" not in self._docker_config:
             working_dir = "/renku"
-            volumes[os.getcwd()] = {"bind": working_dir, "mode": "rw"}
+            volumes[str(self.working_directory)] = {"bind": working_dir, "mode": "rw"}
         else:
             working_dir = self._docker_config.pop("working_dir")
 
@@ -231,6 +245,11 @@ def _upload_files(
     return file_locations
 
 
+def _link_location(file_path: str) -> Any:
+    """Keep a file where it is; used when jobs run in place and files aren't copied to the job store."""
+    return file_path
+
+
 def import_file_wrapper(storage: AbstractFileStore, file_path: str) -> FileID:
     """Wrap importFile accept file:// URIs."""
     file_uri = file_path if ":/" in file_path else f"file://{file_path}"
@@ -243,41 +262,48 @@ def process_children(
     jobs: Dict[int, AbstractToilJob],
     basedir: Path,
     storage: AbstractFileStore,
+    in_place: bool = False,
 ):
     """Recursively process children of a workflow."""
     outputs = list()
-    import_function = functools.partial(import_file_wrapper, storage)
+    import_function = _link_location if in_place else functools.partial(import_file_wrapper, storage)
     for child in nx.neighbors(dag, parent.workflow):
         child_job = jobs[id(child)]
         file_metadata = _upload_files(import_function, child.inputs, basedir)
         child_job.set_input_files(file_metadata)
         child_job.add_input_promise(parent.rv())
         outputs.append(parent.addFollowOn(child_job).rv())
-        outputs += process_children(child_job, dag, jobs, basedir, storage)
+        outputs += process_children(child_job, dag, jobs, basedir, storage, in_place)
     return outputs
 
 
-def initialize_jobs(job, basedir, dag, docker_config):
+def initialize_jobs(job, basedir, dag, docker_config, in_place=False):
     """Creates the Toil execution plan for the given workflow DAG."""
     job.fileStore.logToMaster("executing renku DAG")
     outputs = list()
+    job_basedir = Path(basedir).absolute() if in_place else None
     if docker_config:
         job.fileStore.logToMaster("executing with Docker")
-        jobs = {id(n): DockerToilJob(n, docker_config) for n in dag.nodes}
+        jobs = {id(n): DockerToilJob(n, docker_config, basedir=job_basedir) for n in dag.nodes}
     else:
-        jobs = {id(n): SubprocessToilJob(n) for n in dag.nodes}
-    import_function = functools.partial(import_file_wrapper, job.fileStore)
+        jobs = {id(n): SubprocessToilJob(n, basedir=job_basedir) for n in dag.nodes}
+    import_function = _link_location if in_place else functools.partial(import_file_wrapper, job.fileStore)
     children = next(nx.topological_generations(dag))
     for workflow in children:
         child_job = jobs[id(workflow)]
         file_metadata = _upload_files(import_function, workflow.inputs, basedir)
         child_job.set_input_files(file_metadata)
         outputs.append(job.addChild(child_job).rv())
-        outputs += process_children(child_job, dag, jobs, basedir, job.fileStore)
+        outputs += process_children(child_job, dag, jobs, basedir, job.fileStore, in_place)
 
     return outputs
 
 
+def _is_file_job_store(locator: str) -> bool:
+    """Whether a toil job store locator points to a job store on the (shared) file system."""
+    return ":" not in locator or locator.startswith("file:")
+
+
 class ToilProvider(IWorkflowProvider):
     """A workflow executor provider using toil."""
 
@@ -301,6 +327,11 @@ class ToilProvider(IWorkflowProvider):
         if docker_config and "image" not in docker_config:
             raise errors.ConfigurationError("Docker configuration must provide an 'image' property")
 
+        # NOTE: Run jobs in the project's working tree instead of copying inputs and outputs through the job store
+        in_place = bool(config.pop("in_place", False))
+        if in_place and not _is_file_job_store(config.get("jobStore", options.jobStore)):
+            raise errors.ConfigurationError("'in_place' can only be used with a job store on the file system")
+
         if config:
             for k, v in config.items():
                 setattr(options, k, v)
@@ -308,9 +339,16 @@ class ToilProvider(IWorkflowProvider):
         outputs = list()
         try:
             with Toil(options) as toil:
-                root_job = Job.wrapJobFn(initialize_jobs, basedir, dag, docker_config)
+                root_job = Job.wrapJobFn(initialize_jobs, basedir, dag, docker_config, in_place)
                 job_outputs = toil.start(root_job)
 
+                if in_place:
+                    for collection in job_outputs:
+                        for name, location in collection.items():
+                            outputs.extend(location.keys() if isinstance(location, dict) else [name])
+
+                    return outputs
+
                 num_outputs = sum(map(lambda x: len(x.values()), job_outputs))
                 with progressbar(length=num_outputs, label="Moving outputs") as bar:
                     for collection in job_outputs:
@@ -21,7 +21,7 @@ from collections import defaultdict
 from io import UnsupportedOperation
 from pathlib import Path
 from subprocess import call
-from typing import Dict, List, NamedTuple, Optional, Set, Union, cast
+from typing import Dict, List, NamedTuple, Optional, Set, Tuple, Union, cast
 
 import click
 from pydantic import ConfigDict, validate_call
@@ -88,12 +88,19 @@ def get_status(paths: Optional[List[Union[Path, str]]] = None, ignore_deleted: b
         # chain-generate at least one of the paths
         generation_paths = [] if not paths or entity.path in paths else paths
 
-        return get_downstream_generating_activities(
-            starting_activities={start_activity},
-            paths=generation_paths,
-            ignore_deleted=ignore_deleted,
-            project_path=project_context.path,
-        )
+        # NOTE: An activity is usually reported for each of its modified inputs, so don't walk its downstream twice
+        key = (start_activity, bool(generation_paths), ignore_deleted)
+        if key not in downstream_activities_cache:
+            downstream_activities_cache[key] = get_downstream_generating_activities(
+                starting_activities={start_activity},
+                paths=generation_paths,
+                ignore_deleted=ignore_deleted,
+                project_path=project_context.path,
+            )
+
+        return downstream_activities_cache[key]
+
+    downstream_activities_cache: Dict[Tuple[Activity, bool, bool], List[Activity]] = {}
 
     ignore_deleted = ignore_deleted or get_value("renku", "update_ignore_delete")
 
@@ -27,6 +27,7 @@ from renku.core.constant import (
     APP_NAME,
     CONFIG_NAME,
     DATA_DIR_CONFIG_KEY,
+    DATABASE_JOURNAL_PATH,
     DATABASE_PATH,
     DATASET_IMAGES,
     DEFAULT_DATA_DIR,
@@ -39,6 +40,7 @@ from renku.core.constant import (
 )
 
 if TYPE_CHECKING:
+    from renku.core.lfs import LFSCache
     from renku.domain_model.project import Project
     from renku.infrastructure.database import Database
     from renku.infrastructure.repository import Remote, Repository
@@ -62,15 +64,25 @@ class ProjectContext(threading.local):
         if not self._top.database:
             from renku.infrastructure.database import Database
 
-            self._top.database = Database.from_path(self.database_path)
+            self._top.database = Database.from_path(self.database_path, journal_path=self.database_journal_path)
 
         return self._top.database
 
+    @database.setter
+    def database(self, value: Optional["Database"]):
+        """Set the current database."""
+        self._top.database = value
+
     @property
     def database_path(self) -> Path:
         """Path to the metadata storage directory."""
         return self.metadata_path / DATABASE_PATH
 
+    @property
+    def database_journal_path(self) -> Path:
+        """Path to the journal of metadata changes."""
+        return self.metadata_path / DATABASE_JOURNAL_PATH
+
     @property
     def datadir(self) -> str:
         """Define a name of the folder for storing datasets."""
@@ -134,6 +146,16 @@ class ProjectContext(threading.local):
                 return None
             raise
 
+    @property
+    def lfs_cache(self) -> "LFSCache":
+        """Return current context's cache of Git LFS state."""
+        if not self._top.lfs_cache:
+            from renku.core.lfs import LFSCache
+
+            self._top.lfs_cache = LFSCache()
+
+        return self._top.lfs_cache
+
     @property
     def local_config_path(self) -> Path:
         """Renku local (project) config path."""
@@ -337,6 +359,7 @@ class ProjectProperties:
     path: Path
     database: Optional["Database"] = None
     datadir: Optional[str] = None
+    lfs_cache: Optional["LFSCache"] = None
     repository: Optional["Repository"] = None
     save_changes: bool = False
     transaction_id: Optional[str] = None
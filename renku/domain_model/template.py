@@ -41,12 +41,22 @@ TEMPLATE_MANIFEST = "manifest.yaml"
 class TemplatesSource:
     """Base class for Renku template sources."""
 
-    def __init__(self, path, source, reference, version, skip_validation: bool = False):
+    def __init__(
+        self,
+        path,
+        source,
+        reference,
+        version,
+        skip_validation: bool = False,
+        manifest: Optional["TemplatesManifest"] = None,
+    ):
         self.path: Path = Path(path)
         self.source: str = source
         self.reference: Optional[str] = reference
         self.version: str = version
-        self.manifest: TemplatesManifest = TemplatesManifest.from_path(path / TEMPLATE_MANIFEST, skip_validation)
+        self.manifest: TemplatesManifest = manifest or TemplatesManifest.from_path(
+            self.path / TEMPLATE_MANIFEST, skip_validation
+        )
 
     @classmethod
     @abstractmethod
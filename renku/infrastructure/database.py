@@ -20,6 +20,8 @@ import hashlib
 import importlib
 import io
 import json
+import os
+import time
 from enum import Enum
 from pathlib import Path
 from types import BuiltinFunctionType, FunctionType
@@ -158,12 +160,18 @@ class Database:
 
     This class is equivalent to a ``persistent.DataManager`` and implements
     the ``persistent.interfaces.IPersistentDataManager`` interface.
+
+    If a ``journal_path`` is set, each commit writes a journal file there that lists the oid, id and change type
+    (``added``, ``modified`` or ``removed``) of the objects that it stored or that were marked as removed.
     """
 
     ROOT_OID = "root"
 
-    def __init__(self, storage):
+    def __init__(self, storage, journal_path: Optional[Path] = None):
         self._storage: Storage = storage
+        self._journal_path: Optional[Path] = journal_path
+        # NOTE: Objects that were removed since the last commit; they're recorded in the journal
+        self._removed_objects: Dict[OID_TYPE, str] = {}
         self._cache = Cache()
         # The pre-cache is used by get to avoid infinite loops when objects load their state
         self._pre_cache: Dict[OID_TYPE, persistent.Persistent] = {}
@@ -176,17 +184,18 @@ class Database:
         self._initialize_root()
 
     @classmethod
-    def from_path(cls, path: Union[Path, str]) -> "Database":
+    def from_path(cls, path: Union[Path, str], journal_path: Optional[Path] = None) -> "Database":
         """Create a Storage and Database using the given path.
 
         Args:
             path(Union[pathlib.Path, str]): The path of the database.
+            journal_path(Optional[Path]): The path to write the change journal to (Default value = None).
 
         Returns:
             The database object.
         """
         storage = Storage(path)
-        return Database(storage=storage)
+        return Database(storage=storage, journal_path=journal_path)
 
     @staticmethod
     def generate_oid(object: persistent.Persistent) -> OID_TYPE:
@@ -233,11 +242,25 @@ class Database:
     def __getitem__(self, key) -> "Index":
         return self._root[key]
 
+    def __contains__(self, key) -> bool:
+        return key in self._root
+
+    @property
+    def is_dirty(self) -> bool:
+        """Whether there are objects that were added or changed but not committed."""
+        return bool(self._objects_to_commit) or bool(self._removed_objects)
+
+    @property
+    def loaded_bytes(self) -> int:
+        """Size of the storage files that were loaded into this database."""
+        return self._storage.loaded_bytes
+
     def clear(self):
         """Remove all objects and clear all caches. Objects won't be deleted in the storage."""
         self._cache.clear()
         self._pre_cache.clear()
         self._objects_to_commit.clear()
+        self._removed_objects.clear()
         # NOTE: Clear root at the end because it will be added to _objects_to_commit when `register` is called.
         self._root.clear()
 
@@ -450,13 +473,37 @@ class Database:
             object.freeze()
         deal.enable()
 
+    def mark_removed(self, object: persistent.Persistent):
+        """Record the removal of an object in the change journal on the next commit.
+
+        Args:
+            object(persistent.Persistent): The removed object.
+        """
+        id = getattr(object, "id", None)
+        if object._p_oid and isinstance(id, str):
+            self._removed_objects[object._p_oid] = id
+
     def commit(self):
         """Commit modified and new objects."""
+        changes = []
+
         while self._objects_to_commit:
-            _, object = self._objects_to_commit.popitem()
+            oid, object = self._objects_to_commit.popitem()
             if object._p_changed or object._p_serial == NEW:
+                id = getattr(object, "id", None)
+                if isinstance(id, str):
+                    changes.append({"oid": oid, "id": id, "change": "added" if object._p_serial == NEW else "modified"})
                 self._store_object(object)
 
+        changes.extend({"oid": oid, "id": id, "change": "removed"} for oid, id in self._removed_objects.items())
+        self._removed_objects.clear()
+
+        if changes and self._journal_path:
+            self._journal_path.mkdir(parents=True, exist_ok=True)
+            # NOTE: Journal files sort in the order they were written and their names are unique across branches
+            path = self._journal_path / f"{time.time_ns():020d}-{uuid4().hex}.json"
+            path.write_text(json.dumps(changes, ensure_ascii=False, sort_keys=True, indent=2))
+
     def _store_object(self, object: persistent.Persistent):
         data = self._writer.serialize(object)
         compress = False if isinstance(object, (Catalog, RenkuOOBTree, OOBucket, Project, Index)) else True
@@ -780,6 +827,8 @@ class Storage:
         self.path = Path(path)
         self.zstd_compressor = zstd.ZstdCompressor()
         self.zstd_decompressor = zstd.ZstdDecompressor()
+        # NOTE: Size of the files that were loaded; used as an estimate of the memory that loaded objects use
+        self.loaded_bytes = 0
 
     def store(self, filename: str, data: Union[Dict, List], compress=False, absolute: bool = False):
         """Store object.
@@ -835,6 +884,7 @@ class Storage:
             raise errors.ObjectNotFoundError(filename)
 
         with open(path, "rb") as file:
+            self.loaded_bytes += os.fstat(file.fileno()).st_size
             header = int.from_bytes(file.read(4), "little")
             file.seek(0)
             if header == zstd.MAGIC_NUMBER:
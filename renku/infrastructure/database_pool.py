@@ -0,0 +1,139 @@
+# Copyright Swiss Data Science Center (SDSC). A partnership between
+# École Polytechnique Fédérale de Lausanne (EPFL) and
+# Eidgenössische Technische Hochschule Zürich (ETHZ).
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+"""Pool of open read-only metadata databases that are reused by commands of a long-running process."""
+
+import threading
+from pathlib import Path
+from typing import List, NamedTuple, Optional, Tuple
+
+from renku.infrastructure.database import Database
+
+
+class DatabaseKey(NamedTuple):
+    """Identifies the state of a project's metadata that a pooled database was loaded from."""
+
+    path: str
+    commit_sha: str
+    mtime: int
+
+
+class DatabasePool:
+    """A bounded LRU pool of databases that read-only commands lease and return.
+
+    A leased database is used by one command at a time. Databases are reused only if the project is at the same commit
+    and its metadata wasn't modified since they were loaded; databases that have uncommitted changes are discarded.
+    """
+
+    def __init__(self, max_size: int = 0, max_bytes: int = 0):
+        self.max_size = max_size
+        self.max_bytes = max_bytes
+        self.hits = 0
+        self.misses = 0
+        self._idle: List[Tuple[DatabaseKey, Database]] = []
+        self._lock = threading.Lock()
+
+    @property
+    def enabled(self) -> bool:
+        """Whether databases are pooled."""
+        return self.max_size > 0
+
+    @property
+    def size_bytes(self) -> int:
+        """Estimated memory used by the idle databases of the pool."""
+        with self._lock:
+            return sum(database.loaded_bytes for _, database in self._idle)
+
+    def configure(self, max_size: int, max_bytes: int):
+        """Set the limits of the pool and evict databases that exceed them."""
+        with self._lock:
+            self.max_size = max_size
+            self.max_bytes = max_bytes
+            self._evict()
+
+    def acquire(self, path: Path, database_path: Path, commit_sha: str) -> Tuple[Optional[DatabaseKey], Database]:
+        """Lease a database for a project at a commit; load a new one if there is no up-to-date idle database.
+
+        Args:
+            path(Path): Path of the project.
+            database_path(Path): Path of the project's metadata database.
+            commit_sha(str): The commit the project is at.
+
+        Returns:
+            Tuple[Optional[DatabaseKey], Database]: The key to return the database with and the database. The key is
+                ``None`` if the database cannot be pooled.
+        """
+        key = _get_key(path, database_path, commit_sha)
+        if key is None:
+            return None, Database.from_path(database_path)
+
+        with self._lock:
+            for index in range(len(self._idle) - 1, -1, -1):
+                if self._idle[index][0] == key:
+                    self.hits += 1
+                    return key, self._idle.pop(index)[1]
+
+            # NOTE: Databases of older states of the project won't be used anymore
+            self._idle = [(k, d) for k, d in self._idle if k.path != key.path]
+            self.misses += 1
+
+        return key, Database.from_path(database_path)
+
+    def release(self, key: Optional[DatabaseKey], database: Database, database_path: Path):
+        """Return a leased database to the pool.
+
+        Args:
+            key(Optional[DatabaseKey]): The key that the database was leased with.
+            database(Database): The database.
+            database_path(Path): Path of the project's metadata database.
+        """
+        if key is None or database.is_dirty or _get_key(Path(key.path), database_path, key.commit_sha) != key:
+            return
+
+        with self._lock:
+            self._idle.append((key, database))
+            self._evict()
+
+    def invalidate(self, path: Path):
+        """Drop idle databases of a project, e.g. after its metadata was written."""
+        path_str = str(path)
+        with self._lock:
+            self._idle = [(k, d) for k, d in self._idle if k.path != path_str]
+
+    def clear(self):
+        """Drop all idle databases."""
+        with self._lock:
+            self._idle.clear()
+
+    def _evict(self):
+        """Drop least recently used databases until the pool is within its limits."""
+        size_bytes = sum(database.loaded_bytes for _, database in self._idle)
+        while self._idle and (len(self._idle) > self.max_size or (self.max_bytes and size_bytes > self.max_bytes)):
+            _, database = self._idle.pop(0)
+            size_bytes -= database.loaded_bytes
+
+
+def _get_key(path: Path, database_path: Path, commit_sha: str) -> Optional[DatabaseKey]:
+    """Return the key of the current state of a project's metadata or None if it has no metadata."""
+    try:
+        mtime = max(database_path.stat().st_mtime_ns, (database_path / Database.ROOT_OID).stat().st_mtime_ns)
+    except OSError:
+        return None
+
+    return DatabaseKey(path=str(path), commit_sha=commit_sha, mtime=mtime)
+
+
+# NOTE: Disabled unless an application configures it, e.g. the service with its ``DATABASE_POOL_*`` settings
+database_pool = DatabasePool()
@@ -16,8 +16,10 @@
 """Renku activity database gateway implementation."""
 
 import itertools
+from collections import defaultdict
+from datetime import datetime
 from pathlib import Path
-from typing import List, Optional, Set, Tuple, Union
+from typing import Dict, FrozenSet, Iterable, Iterator, List, Optional, Set, Tuple, Union
 
 import deal
 from persistent.list import PersistentList
@@ -31,13 +33,16 @@ from renku.core.workflow.activity import create_activity_graph
 from renku.domain_model.project_context import project_context
 from renku.domain_model.provenance.activity import Activity, ActivityCollection
 from renku.domain_model.workflow.plan import Plan
-from renku.infrastructure.database import Database
-from renku.infrastructure.gateway.database_gateway import ActivityDownstreamRelation
+from renku.infrastructure.database import Database, RenkuOOBTree
+from renku.infrastructure.gateway.database_gateway import ActivityDownstreamRelation, get_date_key, iterate_date_index
 
 
 class ActivityGateway(IActivityGateway):
     """Gateway for activity database operations."""
 
+    def __init__(self):
+        self._activity_graph: Optional[_ActivityGraph] = None
+
     def get_by_id(self, id: str) -> Optional[Activity]:
         """Get an activity by id."""
         return project_context.database["activities"].get(id)
@@ -94,52 +99,43 @@ class ActivityGateway(IActivityGateway):
 
     def get_downstream_activities(self, activity: Activity, max_depth=None) -> Set[Activity]:
         """Get downstream activities that depend on this activity."""
-        # NOTE: since indices are populated one way when adding an activity, we need to query two indices
-        database = project_context.database
-
-        activity_catalog = database["activity-catalog"]
-        tok = activity_catalog.tokenizeQuery
-        downstream = set(activity_catalog.findValues("downstream", tok(upstream=activity), maxDepth=max_depth))
-
-        return downstream
+        return self._get_activity_graph().get_reachable_activities(activity, downstream=True, max_depth=max_depth)
 
     def get_upstream_activities(self, activity: Activity, max_depth=None) -> Set[Activity]:
         """Get upstream activities that this activity depends on them."""
-        database = project_context.database
-
-        activity_catalog = database["activity-catalog"]
-        tok = activity_catalog.tokenizeQuery
-        upstream = set(activity_catalog.findValues("upstream", tok(downstream=activity), maxDepth=max_depth))
-
-        return upstream
+        return self._get_activity_graph().get_reachable_activities(activity, downstream=False, max_depth=max_depth)
 
     def get_downstream_activity_chains(self, activity: Activity) -> List[Tuple[Activity, ...]]:
         """Get a list of tuples of all downstream paths of this activity."""
-        database = project_context.database
-
-        activity_catalog = database["activity-catalog"]
-        tok = activity_catalog.tokenizeQuery
-        downstream_chains = activity_catalog.findRelationChains(tok(upstream=activity))
-        downstream_chains = [tuple(r.downstream for r in c) for c in downstream_chains]
-
-        return downstream_chains
+        return self._get_activity_graph().get_activity_chains(activity, downstream=True)
 
     def get_upstream_activity_chains(self, activity: Activity) -> List[Tuple[Activity, ...]]:
         """Get a list of tuples of all upstream paths of this activity."""
-        database = project_context.database
-
-        activity_catalog = database["activity-catalog"]
-        tok = activity_catalog.tokenizeQuery
-        upstream_chains = activity_catalog.findRelationChains(tok(downstream=activity))
-        upstream_chains = [tuple(r.upstream for r in c) for c in upstream_chains]
-
-        return upstream_chains
+        return self._get_activity_graph().get_activity_chains(activity, downstream=False)
 
     def get_all_activities(self, include_deleted: bool = False) -> List[Activity]:
         """Get all activities in the project."""
         database = project_context.database
         return [a for a in database["activities"].values() if not a.deleted or include_deleted]
 
+    def get_activities_by_date(
+        self, since: Optional[datetime] = None, until: Optional[datetime] = None
+    ) -> Iterator[Activity]:
+        """Return activities that ended in a time range from newest to oldest."""
+        database = project_context.database
+
+        if "activities-by-date" not in database:
+            # NOTE: The index is created by the first command that adds an activity to the project
+            activities = [(_get_date_key(a), a) for a in self.get_all_activities()]
+            activities = [(k, a) for k, a in activities if _is_in_range(a, since, until)]
+            yield from (a for _, a in sorted(activities, key=lambda e: e[0]))
+            return
+
+        for key, activity in iterate_date_index(database["activities-by-date"], since=since, until=until):
+            # NOTE: Skip entries of activities that were deleted or whose end time changed since they were indexed
+            if not activity.deleted and key == _get_date_key(activity):
+                yield activity
+
     @deal.pre(lambda _: _.activity.started_at_time is not None)
     @deal.pre(lambda _: _.activity.ended_at_time is not None)
     @deal.pre(lambda _: _.activity.started_at_time >= project_context.project.date_created)
@@ -155,15 +151,24 @@ class ActivityGateway(IActivityGateway):
         database["activities"].add(activity)
 
         _index_activity(activity=activity, database=database)
+        _get_date_index(database)[_get_date_key(activity)] = activity
+        self._activity_graph = None
 
         assert isinstance(activity.association.plan, Plan)
 
         plan_gateway = inject.instance(IPlanGateway)
         plan_gateway.add(activity.association.plan)
 
-        # NOTE: Check for a cycle if this activity
-        upstream_chains = self.get_upstream_activity_chains(activity)
-        downstream_chains = self.get_downstream_activity_chains(activity)
+        # NOTE: Check for a cycle if this activity. Query the catalog directly so that adding many activities in a row
+        # doesn't rebuild the in-memory graph each time.
+        activity_catalog = database["activity-catalog"]
+        tok = activity_catalog.tokenizeQuery
+        upstream_chains = [
+            tuple(r.upstream for r in c) for c in activity_catalog.findRelationChains(tok(downstream=activity))
+        ]
+        downstream_chains = [
+            tuple(r.downstream for r in c) for c in activity_catalog.findRelationChains(tok(upstream=activity))
+        ]
 
         all_activities = set()
 
@@ -203,8 +208,196 @@ class ActivityGateway(IActivityGateway):
 
         if not keep_reference:
             database["activities"].remove(activity)
+            database.mark_removed(activity)
 
         _unindex_activity(activity=activity, database=database)
+        self._activity_graph = None
+
+    def _get_activity_graph(self) -> "_ActivityGraph":
+        """Return an in-memory copy of the activity-catalog's relations; it's rebuilt if the catalog changed."""
+        activity_catalog = project_context.database["activity-catalog"]
+
+        if self._activity_graph is None or not self._activity_graph.is_valid(activity_catalog):
+            self._activity_graph = _ActivityGraph(activity_catalog)
+
+        return self._activity_graph
+
+
+class _ActivityGraph:
+    """Adjacency lists of the activity-catalog with memoized transitive closures.
+
+    Queries on the catalog walk its BTrees and load relations for each step; commands like ``renku status`` or
+    ``renku update`` query the same activities over and over, so we read the relations once per command and answer
+    the queries from memory.
+    """
+
+    def __init__(self, activity_catalog):
+        self._catalog_id = id(activity_catalog)
+        self._revision = _get_catalog_revision(activity_catalog)
+        self._size = len(activity_catalog)
+        self._downstream: Dict[str, Set[str]] = defaultdict(set)
+        self._upstream: Dict[str, Set[str]] = defaultdict(set)
+        self._downstream_closures: Dict[str, FrozenSet[str]] = {}
+        self._upstream_closures: Dict[str, FrozenSet[str]] = {}
+        self._downstream_chains: Dict[str, Tuple[Tuple[str, ...], ...]] = {}
+        self._upstream_chains: Dict[str, Tuple[Tuple[str, ...], ...]] = {}
+        self._activities: Dict[str, Optional[Activity]] = {}
+
+        for relation_token in activity_catalog.getRelationTokens():
+            upstreams = activity_catalog.getValueTokens("upstream", relation_token) or ()
+            downstreams = activity_catalog.getValueTokens("downstream", relation_token) or ()
+
+            for upstream, downstream in itertools.product(upstreams, downstreams):
+                self._downstream[upstream].add(downstream)
+                self._upstream[downstream].add(upstream)
+
+    def is_valid(self, activity_catalog) -> bool:
+        """Whether the graph still reflects the content of the activity-catalog."""
+        return (
+            self._catalog_id == id(activity_catalog)
+            and self._revision == _get_catalog_revision(activity_catalog)
+            and self._size == len(activity_catalog)
+        )
+
+    def _get_activity(self, id: str) -> Optional[Activity]:
+        if id not in self._activities:
+            self._activities[id] = project_context.database["activities"].get(id)
+
+        return self._activities[id]
+
+    def _get_activities(self, ids: Iterable[str]) -> Set[Activity]:
+        activities = (self._get_activity(id) for id in ids)
+        return {a for a in activities if a is not None}
+
+    def get_reachable_activities(self, activity: Activity, downstream: bool, max_depth=None) -> Set[Activity]:
+        """Return all activities that are reachable from ``activity`` in one direction.
+
+        Args:
+            activity(Activity): The activity to start from.
+            downstream(bool): Whether to follow downstream or upstream relations.
+            max_depth: Maximum number of relations to follow; ``None`` means no limit (Default value = None).
+
+        Returns:
+            Set[Activity]: Reachable activities.
+        """
+        edges = self._downstream if downstream else self._upstream
+
+        if max_depth is not None:
+            reachable: Set[str] = set()
+            frontier = {activity.id}
+            for _ in range(max_depth):
+                frontier = {n for id in frontier for n in edges.get(id, ()) if n not in reachable}
+                if not frontier:
+                    break
+                reachable.update(frontier)
+
+            return self._get_activities(reachable)
+
+        return self._get_activities(self._get_closure(activity.id, downstream=downstream))
+
+    def _get_closure(self, id: str, downstream: bool) -> FrozenSet[str]:
+        edges = self._downstream if downstream else self._upstream
+        closures = self._downstream_closures if downstream else self._upstream_closures
+
+        if id in closures:
+            return closures[id]
+
+        reachable: Set[str] = set()
+        stack = list(edges.get(id, ()))
+        while stack:
+            current = stack.pop()
+            if current in reachable:
+                continue
+            reachable.add(current)
+            # NOTE: Don't walk sub-graphs whose closure is already known
+            if current in closures:
+                reachable.update(closures[current])
+            else:
+                stack.extend(n for n in edges.get(current, ()) if n not in reachable)
+
+        closure = frozenset(reachable)
+        closures[id] = closure
+
+        return closure
+
+    def get_activity_chains(self, activity: Activity, downstream: bool) -> List[Tuple[Activity, ...]]:
+        """Return all paths (and their prefixes) that start from ``activity`` in one direction.
+
+        Chains that start from an activity are memoized and shared by all chains that pass through it. Sub-graphs that
+        contain a cycle can't be memoized and are walked path by path.
+
+        Args:
+            activity(Activity): The activity to start from; it's not included in the chains.
+            downstream(bool): Whether to follow downstream or upstream relations.
+
+        Returns:
+            List[Tuple[Activity, ...]]: All chains of activities.
+        """
+        closure = self._get_closure(activity.id, downstream=downstream)
+        if activity.id in closure or any(id in self._get_closure(id, downstream=downstream) for id in closure):
+            chains = self._get_activity_chains_with_cycles(activity.id, downstream=downstream)
+        else:
+            chains = self._get_memoized_activity_chains(activity.id, downstream=downstream)
+
+        return [tuple(self._get_activity(id) for id in chain) for chain in chains]  # type: ignore[misc]
+
+    def _get_memoized_activity_chains(self, id: str, downstream: bool) -> Tuple[Tuple[str, ...], ...]:
+        edges = self._downstream if downstream else self._upstream
+        memoized_chains = self._downstream_chains if downstream else self._upstream_chains
+
+        def get_next_ids(current: str) -> List[str]:
+            return [n for n in edges.get(current, ()) if self._get_activity(n) is not None]
+
+        # NOTE: Post-order walk so that chains of all next activities are known before an activity's chains are built
+        stack = [id]
+        while stack:
+            current = stack[-1]
+            if current in memoized_chains:
+                stack.pop()
+                continue
+
+            pending = [n for n in get_next_ids(current) if n not in memoized_chains]
+            if pending:
+                stack.extend(pending)
+                continue
+
+            stack.pop()
+            chains: List[Tuple[str, ...]] = []
+            for next_id in get_next_ids(current):
+                chains.append((next_id,))
+                chains.extend((next_id,) + chain for chain in memoized_chains[next_id])
+            memoized_chains[current] = tuple(chains)
+
+        return memoized_chains[id]
+
+    def _get_activity_chains_with_cycles(self, id: str, downstream: bool) -> List[Tuple[str, ...]]:
+        edges = self._downstream if downstream else self._upstream
+        chains: List[Tuple[str, ...]] = []
+
+        stack: List[Tuple[Tuple[str, ...], str]] = [((), n) for n in edges.get(id, ())]
+        while stack:
+            prefix, current = stack.pop()
+            if self._get_activity(current) is None:
+                continue
+            chain = prefix + (current,)
+            chains.append(chain)
+            # NOTE: Stop at cycles like the catalog does
+            stack.extend((chain, n) for n in edges.get(current, ()) if n not in chain and n != id)
+
+        return chains
+
+
+_catalog_revisions = itertools.count(1)
+
+
+def _get_catalog_revision(activity_catalog) -> int:
+    """Return the in-memory revision of the activity-catalog; it changes each time the catalog is modified."""
+    return getattr(activity_catalog, "_v_revision", 0)
+
+
+def _mark_catalog_changed(activity_catalog):
+    """Give the activity-catalog a new revision so that in-memory graphs built from it are rebuilt."""
+    activity_catalog._v_revision = next(_catalog_revisions)
 
 
 def reindex_catalog(database):
@@ -222,6 +415,36 @@ def reindex_catalog(database):
     for activity in database["activities"].values():
         _index_activity(activity=activity, database=database)
 
+    _get_date_index(database, rebuild=True)
+
+    _mark_catalog_changed(activity_catalog)
+
+
+def _get_date_key(activity: Activity) -> str:
+    """Return the key of an activity in the ``activities-by-date`` index."""
+    return get_date_key(activity.ended_at_time or activity.started_at_time, activity.id)
+
+
+def _is_in_range(activity: Activity, since: Optional[datetime], until: Optional[datetime]) -> bool:
+    """Whether an activity ended in a time range."""
+    key = _get_date_key(activity)
+    return (until is None or key >= get_date_key(until, "")) and (since is None or key <= get_date_key(since, "\uffff"))
+
+
+def _get_date_index(database: Database, rebuild: bool = False) -> RenkuOOBTree:
+    """Return the ``activities-by-date`` index; (re)build it from all activities if it doesn't exist."""
+    if "activities-by-date" not in database:
+        database.add_root_object(name="activities-by-date", obj=RenkuOOBTree())
+        rebuild = True
+
+    by_date = database["activities-by-date"]
+    if rebuild:
+        by_date.clear()
+        for activity in database["activities"].values():
+            by_date[_get_date_key(activity)] = activity
+
+    return by_date
+
 
 def _index_activity(activity: Activity, database: Database):
     """Add an activity to database indexes and create its up/downstream relations."""
@@ -268,6 +491,7 @@ def _index_activity(activity: Activity, database: Database):
 
     if upstreams or downstreams:
         activity_catalog._p_changed = True
+        _mark_catalog_changed(activity_catalog)
 
 
 def _unindex_activity(activity: Activity, database: Database):
@@ -321,3 +545,4 @@ def _unindex_activity(activity: Activity, database: Database):
 
     if upstreams or downstreams:
         activity_catalog._p_changed = True
+        _mark_catalog_changed(activity_catalog)
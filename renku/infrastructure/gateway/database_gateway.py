@@ -15,8 +15,10 @@
 # limitations under the License.
 """Renku generic database gateway implementation."""
 
+import json
+from datetime import datetime
 from pathlib import Path
-from typing import Generator, List, Union
+from typing import Dict, Generator, Iterator, List, Optional, Tuple, Union
 
 import BTrees
 from persistent import Persistent
@@ -25,6 +27,8 @@ from zc.relation.catalog import Catalog
 from zc.relation.queryfactory import TransposingTransitive
 from zope.interface import Attribute, Interface, implementer
 
+from renku.core import errors
+from renku.core.constant import DATABASE_JOURNAL_COMPACTED
 from renku.core.interface.database_gateway import IDatabaseGateway
 from renku.domain_model.dataset import Dataset
 from renku.domain_model.project_context import project_context
@@ -32,6 +36,10 @@ from renku.domain_model.provenance.activity import Activity, ActivityCollection
 from renku.domain_model.workflow.plan import AbstractPlan
 from renku.infrastructure.database import RenkuOOBTree
 
+# NOTE: Keys of date indexes start with the negated timestamp (in microseconds) so that iterating an index, which is
+# lazy and goes in ascending key order, returns the newest entries first
+_MAX_TIMESTAMP = 10**18
+
 
 class IActivityDownstreamRelation(Interface):
     """Interface for activity downstream relation."""
@@ -81,12 +89,40 @@ def load_downstream_relations(token, catalog, cache):
     return btree[token]
 
 
+def get_date_key(date: Optional[datetime], id: str) -> str:
+    """Return the key of an object in a date index."""
+    timestamp = int(date.timestamp() * 1_000_000) if date else 0
+    return f"{_MAX_TIMESTAMP - timestamp:019d}|{id}"
+
+
+def iterate_date_index(
+    index: RenkuOOBTree, since: Optional[datetime] = None, until: Optional[datetime] = None
+) -> Iterator[Tuple[str, Persistent]]:
+    """Iterate over keys and objects of a date index from newest to oldest, loading only the objects iterated over.
+
+    Args:
+        index(RenkuOOBTree): The date index.
+        since(Optional[datetime]): Only return objects from this date on (Default value = None).
+        until(Optional[datetime]): Only return objects up to this date (Default value = None).
+
+    Returns:
+        Iterator[Tuple[str, Persistent]]: Keys and objects in the index.
+    """
+    minimum = get_date_key(until, "") if until else None
+    maximum = get_date_key(since, "\uffff") if since else None
+    if minimum is not None and maximum is not None and minimum > maximum:
+        return iter(())
+
+    return iter(index.items(min=minimum, max=maximum))
+
+
 def initialize_database(database):
     """Initialize an empty database with all required metadata."""
     # NOTE: A list of existing and removed activities
     database.add_index(name="activities", object_type=Activity, attribute="id")
     database.add_root_object(name="activities-by-usage", obj=RenkuOOBTree())
     database.add_root_object(name="activities-by-generation", obj=RenkuOOBTree())
+    database.add_root_object(name="activities-by-date", obj=RenkuOOBTree())
 
     database.add_index(name="activity-collections", object_type=ActivityCollection, attribute="id")
 
@@ -116,6 +152,7 @@ def initialize_database(database):
 
     database.add_index(name="datasets", object_type=Dataset, attribute="name")
     database.add_index(name="datasets-provenance-tails", object_type=Dataset, attribute="id")
+    database.add_root_object(name="datasets-by-date", obj=RenkuOOBTree())
     database.add_index(name="datasets-tags", object_type=PersistentList)
 
 
@@ -153,3 +190,75 @@ class DatabaseGateway(IDatabaseGateway):
                 oid = Path(file.a_path).name
 
                 yield project_context.database.get(oid)
+
+    def get_changes_since(self, revision: str) -> Optional[Tuple[List[Persistent], List[str]]]:
+        """Get objects that were added or modified and ids of objects that were removed since a revision.
+
+        Changes are read from the journal files that were committed after the revision, so only objects that changed
+        are loaded. Returns ``None`` if the project had no change journal at the revision or if the journal was
+        compacted since then.
+        """
+        repository = project_context.repository
+        database = project_context.database
+        journal_path = project_context.database_journal_path.relative_to(project_context.path).as_posix()
+
+        repository.get_commit(revision)
+        if not repository.run_git_command("ls-tree", "--name-only", revision, "--", journal_path):
+            return None
+        elif repository.run_git_command(
+            "log", "-1", "--format=%H", f"{revision}..HEAD", "--", f"{journal_path}/{DATABASE_JOURNAL_COMPACTED}"
+        ):
+            return None
+
+        # NOTE: Clocks of different machines aren't ordered, so journal files are applied in the order of the commits
+        # that added them; files that were added by the same commit are ordered by the time in their names.
+        journal_files = repository.run_git_command(
+            "log",
+            "--reverse",
+            "--topo-order",
+            "--diff-filter=A",
+            "--name-only",
+            "--format=",
+            f"{revision}..HEAD",
+            "--",
+            f"{journal_path}/*.json",
+        )
+
+        # NOTE: Only the last change of an object matters
+        changes: Dict[str, Dict[str, str]] = {}
+        for journal_file in journal_files.splitlines():
+            if journal_file:
+                for change in json.loads((project_context.path / journal_file).read_text()):
+                    changes[change["oid"]] = change
+
+        modified, removed = [], []
+        for oid, change in changes.items():
+            if change["change"] == "removed":
+                removed.append(change["id"])
+                continue
+
+            try:
+                modified.append(database.get(oid))
+            except errors.ObjectNotFoundError:
+                removed.append(change["id"])
+
+        return modified, removed
+
+    def compact_journal(self) -> int:
+        """Remove all files of the journal of metadata changes.
+
+        The journal grows by one file with each metadata change. Compacting it updates a marker file, so that exports
+        of changes since a commit before the compaction export the full diff instead.
+
+        Returns:
+            int: The number of removed journal files.
+        """
+        journal_path = project_context.database_journal_path
+        journal_files = list(journal_path.glob("*.json"))
+        for journal_file in journal_files:
+            journal_file.unlink()
+
+        journal_path.mkdir(parents=True, exist_ok=True)
+        (journal_path / DATABASE_JOURNAL_COMPACTED).write_text(f"{datetime.utcnow().isoformat()}\n")
+
+        return len(journal_files)
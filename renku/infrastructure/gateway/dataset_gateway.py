@@ -15,7 +15,8 @@
 # limitations under the License.
 """Renku dataset gateway interface."""
 
-from typing import List, Optional
+from datetime import datetime
+from typing import Iterator, List, Optional
 
 import deal
 from persistent.list import PersistentList
@@ -23,6 +24,8 @@ from persistent.list import PersistentList
 from renku.core.interface.dataset_gateway import IDatasetGateway
 from renku.domain_model.dataset import Dataset, DatasetTag
 from renku.domain_model.project_context import project_context
+from renku.infrastructure.database import Database, RenkuOOBTree
+from renku.infrastructure.gateway.database_gateway import get_date_key, iterate_date_index
 
 
 class DatasetGateway(IDatasetGateway):
@@ -50,6 +53,25 @@ class DatasetGateway(IDatasetGateway):
         """Return the provenance for all datasets."""
         return list(project_context.database["datasets-provenance-tails"].values())
 
+    def get_datasets_by_date(
+        self, since: Optional[datetime] = None, until: Optional[datetime] = None
+    ) -> Iterator[Dataset]:
+        """Return versions of all datasets that were changed in a time range from newest to oldest."""
+        database = project_context.database
+
+        if "datasets-by-date" not in database:
+            # NOTE: The index is created by the first command that changes a dataset in the project
+            by_date = {_get_date_key(d): d for d in _get_all_dataset_versions(database)}
+            minimum = get_date_key(until, "") if until else ""
+            maximum = get_date_key(since, "\uffff") if since else "\uffff"
+            yield from (by_date[k] for k in sorted(by_date) if minimum <= k <= maximum)
+            return
+
+        for key, dataset in iterate_date_index(database["datasets-by-date"], since=since, until=until):
+            # NOTE: Skip entries of datasets whose dates changed after they were indexed
+            if key == _get_date_key(dataset):
+                yield dataset
+
     def get_all_tags(self, dataset: Dataset) -> List[DatasetTag]:
         """Return the list of all tags for a dataset."""
         return list(project_context.database["datasets-tags"].get(dataset.slug, []))
@@ -73,6 +95,7 @@ class DatasetGateway(IDatasetGateway):
             if t.name == tag.name:
                 tags.remove(t)
                 project_context.database.remove_from_cache(t)
+                project_context.database.mark_removed(t)
                 break
 
     # NOTE: Enable this again once we properly deal with `date_created` on imported Renku datasets
@@ -92,3 +115,31 @@ class DatasetGateway(IDatasetGateway):
         if dataset.derived_from:
             database["datasets-provenance-tails"].pop(dataset.derived_from.url_id, None)
         database["datasets-provenance-tails"].add(dataset)
+
+        _get_date_index(database)[_get_date_key(dataset)] = dataset
+
+
+def _get_date_key(dataset: Dataset) -> str:
+    """Return the key of a dataset version in the ``datasets-by-date`` index."""
+    date = dataset.date_removed or dataset.date_modified or dataset.date_created or dataset.date_published
+    return get_date_key(date, dataset.id)
+
+
+def _get_all_dataset_versions(database: Database) -> Iterator[Dataset]:
+    """Return all versions of all datasets."""
+    for dataset in database["datasets-provenance-tails"].values():
+        while dataset:
+            yield dataset
+            dataset = database.get_by_id(dataset.derived_from.value) if dataset.is_derivation() else None
+
+
+def _get_date_index(database: Database) -> RenkuOOBTree:
+    """Return the ``datasets-by-date`` index; build it from all dataset versions if it doesn't exist."""
+    if "datasets-by-date" not in database:
+        database.add_root_object(name="datasets-by-date", obj=RenkuOOBTree())
+
+        by_date = database["datasets-by-date"]
+        for dataset in _get_all_dataset_versions(database):
+            by_date[_get_date_key(dataset)] = dataset
+
+    return database["datasets-by-date"]
@@ -224,9 +224,8 @@ class BaseRepository:
         if all:
             assert len(paths) == 0, "Cannot pass both ``all`` and ``paths``."
             self.run_git_command("add", all=True, force=force)
-        else:
-            for batch in split_paths(*paths):
-                self.run_git_command("add", *batch, force=force)
+        elif len(paths) > 0:
+            self._run_git_command_with_pathspec_file("add", *paths, force=force)
 
     def add_ignored_pattern(self, pattern: str) -> None:
         """Add the pattern to the ``.gitignore`` file."""
@@ -342,7 +341,12 @@ class BaseRepository:
         force: bool = False,
     ):
         """Remove paths from repository or index."""
-        self.run_git_command("rm", "--", *paths, cached=index, ignore_unmatch=not_exists_ok, r=recursive, force=force)
+        if len(paths) == 0:
+            return
+
+        self._run_git_command_with_pathspec_file(
+            "rm", *paths, cached=index, ignore_unmatch=not_exists_ok, r=recursive, force=force
+        )
 
     def reset(self, reference: Optional[Union["Branch", "Commit", "Reference", str]] = None, hard: bool = False):
         """Reset a git repository to a given reference."""
@@ -406,6 +410,22 @@ class BaseRepository:
             raise errors.ParameterError("Repository not set.")
         return _run_git_command(self._repository, command, *args, **kwargs)
 
+    def _run_git_command_with_pathspec_file(self, command: str, *paths: Union[Path, str], **kwargs) -> str:
+        """Run a git command once for all paths by passing them in a NUL-separated pathspec file.
+
+        NOTE: This avoids spawning one git process per ``split_paths`` batch and is not limited by the maximum length of
+        the command line.
+        """
+        with tempfile.NamedTemporaryFile(mode="wb", delete=False) as pathspec_file:
+            pathspec_file.write(b"\0".join(os.fsencode(str(p)) for p in paths))
+
+        try:
+            return self.run_git_command(
+                command, pathspec_from_file=pathspec_file.name, pathspec_file_nul=True, **kwargs
+            )
+        finally:
+            os.unlink(pathspec_file.name)
+
     def get_attributes(self, *paths: Union[Path, str]) -> Dict[str, Dict[str, str]]:
         """Return a map from paths to its attributes.
 
@@ -778,6 +798,65 @@ class BaseRepository:
 
         return hashes
 
+    def get_directory_object_hashes(self, path: Union[Path, str], revision: Optional[str] = None) -> Dict[str, str]:
+        """Return git hashes of all files and sub-directories in a directory with a fixed number of git calls.
+
+        Without a revision, files are hashed as they are in the working tree (i.e. like ``get_object_hash``): clean
+        files use their hash from the index and only modified, untracked and symlinked files are hashed. Directories
+        are hashed as they are in ``HEAD``. Paths that cannot be hashed this way (e.g. directories that are not
+        committed or paths in submodules) are not included in the result.
+
+        NOTE: Keys are paths relative to the repo's root.
+        """
+        relative_path = os.path.relpath(get_absolute_path(path, self.path), start=self.path)
+
+        hashes: Dict[str, str] = {}
+
+        try:
+            tree = self.run_git_command("ls-tree", "-r", "-t", "-z", revision or "HEAD", "--", relative_path)
+        except errors.GitCommandError:
+            tree = ""
+        for entry in tree.split("\0"):
+            if not entry:
+                continue
+            info, entry_path = entry.split("\t", 1)
+            _, object_type, object_hash = info.split(" ")
+            if revision or object_type == "tree":
+                hashes[entry_path] = object_hash
+
+        if revision:
+            return hashes
+
+        dirty_files = set(
+            self.run_git_command("ls-files", "-z", "--modified", "--others", "--", relative_path).split("\0")
+        )
+        dirty_files.discard("")
+
+        for entry in self.run_git_command("ls-files", "-z", "--stage", "--", relative_path).split("\0"):
+            if not entry:
+                continue
+            info, entry_path = entry.split("\t", 1)
+            mode, object_hash, _ = info.split(" ")
+            if mode == "160000":
+                # NOTE: Submodules are hashed in their own repository
+                hashes.pop(entry_path, None)
+            elif mode == "120000":
+                # NOTE: ``hash-object`` follows symlinks and hashes the content of their targets
+                dirty_files.add(entry_path)
+            elif entry_path not in dirty_files:
+                hashes[entry_path] = object_hash
+
+        dirty_files = {f for f in dirty_files if os.path.isfile(os.path.join(self.path, f))}
+        if dirty_files:
+            dirty_files_list = sorted(dirty_files)
+            with tempfile.TemporaryFile() as paths_file:
+                paths_file.write("\n".join(dirty_files_list).encode("utf-8"))
+                paths_file.seek(0)
+                output = self.run_git_command("hash-object", "--stdin-paths", istream=paths_file)
+            hashes.update(zip(dirty_files_list, output.splitlines()))
+
+        return hashes
+
     def get_object_hash(self, path: Union[Path, str], revision: Optional[Union["Commit", str]] = None) -> Optional[str]:
         """Return git hash of an object in a Repo or its submodule.
 
@@ -96,9 +96,18 @@ the ``renku config`` command:
 |                                | datasets. Can be either ``copy`` or |           |
 |                                | ``move``.                           |           |
 +--------------------------------+-------------------------------------+-----------+
+| ``execution_cache``            | Restore outputs of workflow steps   | ``false`` |
+|                                | that ran before with the same       |           |
+|                                | parameters and inputs instead of    |           |
+|                                | running them again.                 |           |
++--------------------------------+-------------------------------------+-----------+
 | ``lfs_threshold``              | Threshold file size below which     | ``100kb`` |
 |                                | files are not added to git LFS      |           |
 +--------------------------------+-------------------------------------+-----------+
+| ``lfs_concurrent_transfers``   | Number of concurrent transfers when | ``None``  |
+|                                | pulling files from git LFS. Uses    |           |
+|                                | git LFS's default if not set.       |           |
++--------------------------------+-------------------------------------+-----------+
 | ``show_lfs_message``           | Whether to show messages about      | ``true``  |
 |                                | files being added to git LFS or not |           |
 +--------------------------------+-------------------------------------+-----------+
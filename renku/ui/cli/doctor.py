@@ -42,10 +42,11 @@ from renku.core import errors
 @click.pass_context
 @click.option("--fix", is_flag=True, help="Fix issues when possible.")
 @click.option("-f", "--force", is_flag=True, help="Do possible fixes even though no problem is reported.")
-def doctor(ctx, fix, force):
+@click.option("-v", "--verbose", is_flag=True, help="Show how long each check took.")
+def doctor(ctx, fix, force, verbose):
     """Check your system and repository for potential problems."""
     import renku.ui.cli.utils.color as color
-    from renku.command.doctor import DOCTOR_INFO, doctor_check_command
+    from renku.command.doctor import DOCTOR_INFO, doctor_check_command, format_durations
     from renku.ui.cli.utils.callback import ClickCallback
 
     if force and not fix:
@@ -57,7 +58,10 @@ def doctor(ctx, fix, force):
     command = doctor_check_command(with_fix=fix)
     if fix:
         command = command.with_communicator(communicator)
-    is_ok, fixes_available, problems = command.build().execute(fix=fix, force=force).output
+    is_ok, fixes_available, problems, durations = command.build().execute(fix=fix, force=force).output
+
+    if verbose:
+        click.echo(f"Check durations:\n{format_durations(durations)}\n")
 
     if is_ok:
         click.secho("Everything seems to be ok.", fg=color.GREEN)
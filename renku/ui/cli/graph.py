@@ -65,6 +65,20 @@ you can get data for a single commit by using ``renku graph export
 --revision <git commit sha>`` or by specifying a range of commits like
 ``renku graph export --revision sha1..sha2``.
 
+To incrementally update an existing copy of the graph, use ``renku graph
+export --since <git commit sha>`` with the commit of the previous export. It
+only exports entities that were added or changed after that commit and adds a
+node with type ``renku:Tombstone`` for each entity that was removed. Changes
+are read from a journal in ``.renku/metadata-journal`` that renku writes with
+each metadata change, so the export doesn't depend on the length of the
+project's history.
+
+The journal grows by one file with each metadata change. Use ``renku graph
+compact-journal`` to remove all of its files in a new commit, e.g. after the
+Knowledge Graph has exported the project. Exports with ``--since`` a commit
+before the compaction then export all changes from the project's history
+instead.
+
 ``renku graph export`` currently supports various formats for export, such as
 ``json-ld``, ``rdf``, ``nt`` (for triples) and ``dot`` (for GraphViz graphs),
 which can be specified using the ``--format`` option. For instance,
@@ -83,6 +97,7 @@ correct and that there isn't anything missing.
 
 import click
 
+import renku.ui.cli.utils.color as color
 from renku.ui.cli.utils.click import CaseInsensitiveChoice
 
 GRAPH_FORMATS = {
@@ -114,12 +129,20 @@ def graph():
     default=None,
     help="Limit graph to changes done in revision (or range of revisions like 'A..B').",
 )
-@click.option("-f", "--full", is_flag=True, help="Generate full graph for project (default). Overrides --revision.")
+@click.option(
+    "--since",
+    type=str,
+    default=None,
+    help="Only export changes made after a commit, e.g. the one of a previous export. Overrides --revision.",
+)
+@click.option(
+    "-f", "--full", is_flag=True, help="Generate full graph for project (default). Overrides --revision and --since."
+)
 @click.option("--strict", is_flag=True, default=False, help="Validate triples before output.")
 @click.option(
     "--no-indent", is_flag=True, default=False, help="Format without indentation/pretty-printing (only for JSON-LD)."
 )
-def export(format, revision, full, strict, no_indent):
+def export(format, revision, since, full, strict, no_indent):
     r"""Export Renku graph metadata for project."""
     from renku.command.graph import export_graph_command
     from renku.command.view_model.graph import DotFormat
@@ -127,13 +150,14 @@ def export(format, revision, full, strict, no_indent):
 
     if full:
         revision = None
+        since = None
 
     communicator = ClickCallback()
     result = (
         export_graph_command()
         .with_communicator(communicator)
         .build()
-        .execute(format=format, strict=strict, revision_or_range=revision)
+        .execute(format=format, strict=strict, revision_or_range=revision, since=since)
     )
     format = GRAPH_FORMATS[format]
 
@@ -153,3 +177,15 @@ def export(format, revision, full, strict, no_indent):
         raise NotImplementedError(f"Format {format} not supported for graph export.")
 
     click.echo(result)
+
+
+@graph.command("compact-journal")
+def compact_journal():
+    """Remove all files of the journal of metadata changes."""
+    from renku.command.graph import compact_journal_command
+    from renku.ui.cli.utils.callback import ClickCallback
+
+    communicator = ClickCallback()
+    result = compact_journal_command().with_communicator(communicator).build().execute()
+
+    click.secho(f"Removed {result.output} journal files.", fg=color.GREEN)
@@ -59,6 +59,10 @@ Examples
 
 To show only dataset entries, use ``-d``, to show only workflows, use ``-w``.
 
+Entries are shown from newest to oldest. Use ``--limit <n>`` to only show the
+``n`` most recent entries and ``--since <date>``/``--until <date>`` to only show
+entries in a time range, e.g. ``renku log --since 2022-02-01 --limit 10``.
+
 You can select a format using the ``--format <format>`` argument.
 
 .. cheatsheet::
@@ -222,16 +226,24 @@ def _print_dataset_log(log_entry: DatasetLogViewModel) -> str:
 )
 @click.option("-w", "--workflows", is_flag=True, default=False, help="Show only workflow executions.")
 @click.option("-d", "--datasets", is_flag=True, default=False, help="Show only dataset modifications.")
+@click.option("-n", "--limit", type=click.IntRange(min=0), default=None, help="Show only the most recent entries.")
+@click.option("--since", type=click.DateTime(), default=None, help="Show only entries from this date on.")
+@click.option("--until", type=click.DateTime(), default=None, help="Show only entries up to this date.")
 @click.option("--no-pager", is_flag=True, help="Don't use pager (less) for output.")
 @click.option("-c", "--no-color", is_flag=True, help="Do not colorize output.")
-def log(columns, format, workflows, datasets, no_pager, no_color):
+def log(columns, format, workflows, datasets, limit, since, until, no_pager, no_color):
     """Show a history of renku workflow and dataset commands."""
     from renku.command.log import log_command
 
-    result = log_command().with_database().build().execute(workflows_only=workflows, datasets_only=datasets).output
+    result = (
+        log_command()
+        .with_database()
+        .build()
+        .execute(workflows_only=workflows, datasets_only=datasets, limit=limit, since=since, until=until)
+        .output
+    )
     if format == "detailed":
-        entries = sorted(result, key=lambda e: e.date, reverse=True)
-        text = "\n\n".join([_print_log(e) for e in entries])
+        text = "\n\n".join([_print_log(e) for e in result])
 
         if no_color:
             text = strip_ansi_codes(text)
@@ -35,7 +35,7 @@ RENKU_DAEMON_ERR_FILE = "renku.err"
 SERVICE_COMPONENT_TAGS = ["api", "worker"]
 
 
-def run_api(addr="0.0.0.0", port=8080, timeout=600):
+def run_api(addr="0.0.0.0", port=8080, timeout=600, asgi=False):
     """Run service JSON-RPC API."""
     from gunicorn.app.wsgiapp import run
 
@@ -46,9 +46,23 @@ def run_api(addr="0.0.0.0", port=8080, timeout=600):
 
     loading_opt = "--preload"
 
+    if asgi or os.getenv("RENKU_SVC_ASGI", "false").lower() == "true":
+        try:
+            import uvicorn  # noqa: F401
+        except ImportError:
+            raise click.ClickException(
+                "Serving the API in ASGI mode requires 'uvicorn'; install renku with the 'service' extra."
+            )
+
+        app = "renku.ui.service.asgi:create_app()"
+        worker_options = ["--worker-class", "uvicorn.workers.UvicornWorker"]
+    else:
+        app = "renku.ui.service.entrypoint:app"
+        worker_options = ["--worker-class", "gthread", "--threads", svc_num_threads]
+
     sys.argv = [
         "gunicorn",
-        "renku.ui.service.entrypoint:app",
+        app,
         loading_opt,
         "-c",
         "gunicorn.conf.py",
@@ -58,10 +72,7 @@ def run_api(addr="0.0.0.0", port=8080, timeout=600):
         f"{svc_timeout}",
         "--workers",
         svc_num_workers,
-        "--worker-class",
-        "gthread",
-        "--threads",
-        svc_num_threads,
+        *worker_options,
         "--log-level",
         "debug",
     ]
@@ -231,9 +242,15 @@ def service(ctx, env):
     show_default=True,
     help="Request silent for more than this many seconds are dropped.",
 )
-def api_start(addr, port, timeout):
+@click.option(
+    "--asgi",
+    is_flag=True,
+    default=False,
+    help="Serve the API from an event loop and run requests in bounded worker pools (requires 'uvicorn').",
+)
+def api_start(addr, port, timeout, asgi):
     """Start service JSON-RPC API in active shell session."""
-    run_api(addr, port, timeout)
+    run_api(addr, port, timeout, asgi)
 
 
 @service.command(name="worker")
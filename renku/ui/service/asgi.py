@@ -0,0 +1,315 @@
+# Copyright Swiss Data Science Center (SDSC). A partnership between
+# École Polytechnique Fédérale de Lausanne (EPFL) and
+# Eidgenössische Technische Hochschule Zürich (ETHZ).
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+"""Renku service ASGI entry point.
+
+The Flask application is served from an event loop and each request runs in one of two bounded thread pools: one for
+endpoints that may block on repository operations (clones, fetches, commits) and one for lightweight endpoints that
+only read the cache. Lightweight requests never wait behind slow repository operations and requests are rejected with
+``503`` when too many of them are waiting for a worker.
+"""
+import asyncio
+import os
+import re
+import sys
+from concurrent.futures import ThreadPoolExecutor
+from io import BytesIO
+from tempfile import SpooledTemporaryFile
+from typing import Any, Callable, Dict, Iterable, Iterator, List, Optional, Tuple
+
+from prometheus_client import Counter, Gauge
+
+from renku.ui.service.config import (
+    LIGHTWEIGHT_ENDPOINTS,
+    LIGHTWEIGHT_MAX_QUEUE,
+    LIGHTWEIGHT_WORKERS,
+    MAX_CONTENT_LENGTH,
+    OFFLOAD_MAX_QUEUE,
+    OFFLOAD_WORKERS,
+    SERVICE_PREFIX,
+)
+
+RESPONSE_CHUNK_SIZE = 64 * 1024
+REQUEST_BODY_MEMORY_SIZE = 1024 * 1024
+
+_VERSION_PATTERN = re.compile(r"^\d+\.\d+$")
+
+POOL_IN_FLIGHT = Gauge("renku_svc_pool_in_flight", "Requests running in a pool.", ["pool"], multiprocess_mode="livesum")
+POOL_QUEUE_DEPTH = Gauge(
+    "renku_svc_pool_queue_depth", "Requests waiting for a worker of a pool.", ["pool"], multiprocess_mode="livesum"
+)
+POOL_SATURATION = Gauge(
+    "renku_svc_pool_saturation", "Ratio of a pool's queue that is in use.", ["pool"], multiprocess_mode="max"
+)
+POOL_REJECTED = Counter("renku_svc_pool_rejected", "Requests rejected because a pool was saturated.", ["pool"])
+
+
+class RequestPool:
+    """A bounded thread pool that tracks its in-flight requests and queue depth.
+
+    Counters are only updated from the event loop thread.
+    """
+
+    def __init__(self, name: str, max_workers: int, max_queue: int):
+        self.name = name
+        self.max_workers = max_workers
+        self.max_queue = max_queue
+        self._executor = ThreadPoolExecutor(max_workers=max_workers, thread_name_prefix=f"renku-svc-{name}")
+        self._pending = 0
+
+    @property
+    def in_flight(self) -> int:
+        """Number of calls that are being executed."""
+        return min(self._pending, self.max_workers)
+
+    @property
+    def queue_depth(self) -> int:
+        """Number of calls that wait for a worker."""
+        return max(0, self._pending - self.max_workers)
+
+    @property
+    def saturated(self) -> bool:
+        """Whether the pool's queue is full."""
+        return self.queue_depth >= self.max_queue
+
+    async def run(self, function: Callable, *args) -> Any:
+        """Run a blocking function in the pool."""
+        loop = asyncio.get_running_loop()
+
+        self._pending += 1
+        self._update_metrics()
+        try:
+            return await loop.run_in_executor(self._executor, function, *args)
+        finally:
+            self._pending -= 1
+            self._update_metrics()
+
+    def reject(self):
+        """Record a request that was rejected since the pool is saturated."""
+        POOL_REJECTED.labels(pool=self.name).inc()
+
+    def shutdown(self):
+        """Stop the pool's workers once they finish their current calls."""
+        self._executor.shutdown(wait=False, cancel_futures=True)
+
+    def _update_metrics(self):
+        POOL_IN_FLIGHT.labels(pool=self.name).set(self.in_flight)
+        POOL_QUEUE_DEPTH.labels(pool=self.name).set(self.queue_depth)
+        POOL_SATURATION.labels(pool=self.name).set(self.queue_depth / self.max_queue if self.max_queue else 1)
+
+
+class ServiceASGIApp:
+    """ASGI adapter that runs a WSGI application in bounded request pools."""
+
+    def __init__(
+        self,
+        wsgi_app,
+        offload_pool: Optional[RequestPool] = None,
+        lightweight_pool: Optional[RequestPool] = None,
+        lightweight_endpoints=LIGHTWEIGHT_ENDPOINTS,
+    ):
+        self.wsgi_app = wsgi_app
+        self.offload_pool = offload_pool or RequestPool("offload", OFFLOAD_WORKERS, OFFLOAD_MAX_QUEUE)
+        self.lightweight_pool = lightweight_pool or RequestPool(
+            "lightweight", LIGHTWEIGHT_WORKERS, LIGHTWEIGHT_MAX_QUEUE
+        )
+        self.lightweight_endpoints = lightweight_endpoints
+
+    async def __call__(self, scope, receive, send):
+        if scope["type"] == "lifespan":
+            await self._lifespan(receive, send)
+            return
+        elif scope["type"] != "http":
+            raise NotImplementedError(f"Unsupported ASGI scope type: '{scope['type']}'")
+
+        pool = self.get_pool(scope["path"])
+        if pool.saturated:
+            pool.reject()
+            await self._send_response(send, *self._busy_response(scope))
+            return
+
+        body = await self._read_body(receive)
+        if body is None:
+            await self._send_response(send, 413, [(b"content-length", b"0")], [])
+            return
+
+        environ = _build_environ(scope, body)
+        status, headers, iterable = await pool.run(self._call_wsgi_app, environ)
+        iterator = iter(iterable)
+        try:
+            await send({"type": "http.response.start", "status": status, "headers": headers})
+            while True:
+                chunk = await pool.run(_read_chunk, iterator)
+                if not chunk:
+                    break
+                await send({"type": "http.response.body", "body": chunk, "more_body": True})
+            await send({"type": "http.response.body", "body": b"", "more_body": False})
+        finally:
+            close = getattr(iterable, "close", None)
+            if close is not None:
+                await pool.run(close)
+            body.close()
+
+    def get_pool(self, path: str) -> RequestPool:
+        """Return the pool that serves requests to a path."""
+        prefix = SERVICE_PREFIX.rstrip("/")
+        if prefix and path.startswith(prefix):
+            path = path[len(prefix) :]
+
+        parts = path.strip("/").split("/")
+        if _VERSION_PATTERN.match(parts[0]):
+            parts = parts[1:] or [""]
+
+        return self.lightweight_pool if parts[0] in self.lightweight_endpoints else self.offload_pool
+
+    def _call_wsgi_app(self, environ: Dict[str, Any]) -> Tuple[int, List[Tuple[bytes, bytes]], Iterable[bytes]]:
+        """Call the WSGI application and return response's status, headers and body."""
+        response: Dict[str, Any] = {}
+
+        def start_response(status: str, headers: List[Tuple[str, str]], exc_info=None):
+            if exc_info and response:
+                raise exc_info[1].with_traceback(exc_info[2])
+
+            response["status"] = int(status.split(" ", 1)[0])
+            response["headers"] = [(k.lower().encode("latin-1"), v.encode("latin-1")) for k, v in headers]
+
+            def write(_):
+                raise NotImplementedError("WSGI write callable is not supported")
+
+            return write
+
+        iterable = self.wsgi_app(environ, start_response)
+
+        return response["status"], response["headers"], iterable
+
+    def _busy_response(self, scope) -> Tuple[int, List[Tuple[bytes, bytes]], List[bytes]]:
+        """Return a response for requests that cannot be served since the service is saturated."""
+        from renku.ui.service.errors import IntermittentServiceBusyError
+        from renku.ui.service.views import error_response
+
+        with self.wsgi_app.request_context(_build_environ(scope, BytesIO())):
+            response = error_response(IntermittentServiceBusyError())
+
+        headers = [(k.lower().encode("latin-1"), v.encode("latin-1")) for k, v in response.headers.items()]
+        headers.append((b"retry-after", b"1"))
+
+        return 503, headers, [response.get_data()]
+
+    async def _read_body(self, receive):
+        """Read request's body into a temporary file; return None if it's larger than the allowed size."""
+        body = SpooledTemporaryFile(max_size=REQUEST_BODY_MEMORY_SIZE)
+        size = 0
+        more_body = True
+
+        while more_body:
+            message = await receive()
+            if message["type"] == "http.disconnect":
+                break
+
+            chunk = message.get("body", b"")
+            size += len(chunk)
+            if size > MAX_CONTENT_LENGTH:
+                body.close()
+                return None
+
+            body.write(chunk)
+            more_body = message.get("more_body", False)
+
+        body.seek(0)
+        return body
+
+    async def _lifespan(self, receive, send):
+        """Handle ASGI lifespan events."""
+        while True:
+            message = await receive()
+            if message["type"] == "lifespan.startup":
+                await send({"type": "lifespan.startup.complete"})
+            elif message["type"] == "lifespan.shutdown":
+                self.offload_pool.shutdown()
+                self.lightweight_pool.shutdown()
+                await send({"type": "lifespan.shutdown.complete"})
+                return
+
+    @staticmethod
+    async def _send_response(send, status: int, headers: List[Tuple[bytes, bytes]], body: List[bytes]):
+        await send({"type": "http.response.start", "status": status, "headers": headers})
+        await send({"type": "http.response.body", "body": b"".join(body), "more_body": False})
+
+
+def _build_environ(scope, body) -> Dict[str, Any]:
+    """Create a WSGI environment from an ASGI HTTP scope."""
+    root_path = scope.get("root_path", "")
+    path = scope["path"]
+    if root_path and path.startswith(root_path):
+        path = path[len(root_path) :]
+
+    server = scope.get("server") or ("localhost", 80)
+    client = scope.get("client") or ("", 0)
+
+    environ = {
+        "REQUEST_METHOD": scope["method"],
+        "SCRIPT_NAME": root_path.encode("utf-8").decode("latin-1"),
+        "PATH_INFO": path.encode("utf-8").decode("latin-1"),
+        "QUERY_STRING": scope.get("query_string", b"").decode("latin-1"),
+        "SERVER_NAME": server[0],
+        "SERVER_PORT": str(server[1]),
+        "SERVER_PROTOCOL": f"HTTP/{scope.get('http_version', '1.1')}",
+        "REMOTE_ADDR": client[0],
+        "wsgi.version": (1, 0),
+        "wsgi.url_scheme": scope.get("scheme", "http"),
+        "wsgi.input": body,
+        "wsgi.errors": sys.stderr,
+        "wsgi.multithread": True,
+        "wsgi.multiprocess": True,
+        "wsgi.run_once": False,
+    }
+
+    for name, value in scope.get("headers", []):
+        name = name.decode("latin-1").upper().replace("-", "_")
+        value = value.decode("latin-1")
+        if name == "CONTENT_TYPE" or name == "CONTENT_LENGTH":
+            key = name
+        else:
+            key = f"HTTP_{name}"
+
+        environ[key] = f"{environ[key]},{value}" if key in environ else value
+
+    if "CONTENT_LENGTH" not in environ:
+        # NOTE: The whole body is already received, so its length is known even for chunked requests
+        environ["CONTENT_LENGTH"] = str(body.seek(0, os.SEEK_END))
+        body.seek(0)
+
+    return environ
+
+
+def _read_chunk(iterator: Iterator[bytes]) -> bytes:
+    """Read up to ``RESPONSE_CHUNK_SIZE`` bytes from a WSGI response; return an empty bytes at the end."""
+    chunks = []
+    size = 0
+    for chunk in iterator:
+        chunks.append(chunk)
+        size += len(chunk)
+        if size >= RESPONSE_CHUNK_SIZE:
+            break
+
+    return b"".join(chunks)
+
+
+def create_app(wsgi_app=None) -> ServiceASGIApp:
+    """Create the ASGI application of the service."""
+    if wsgi_app is None:
+        from renku.ui.service.entrypoint import app as wsgi_app
+
+    return ServiceASGIApp(wsgi_app)
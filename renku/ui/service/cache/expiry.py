@@ -0,0 +1,110 @@
+# Copyright Swiss Data Science Center (SDSC). A partnership between
+# École Polytechnique Fédérale de Lausanne (EPFL) and
+# Eidgenössische Technische Hochschule Zürich (ETHZ).
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+"""Indexes of cached records by the time they were last used.
+
+Each index is a sorted set of record ids scored by the time a record was created or last accessed, so that cleanup
+jobs only visit records that expired instead of scanning all users and their records. Cleanup pops expired ids in
+bounded batches and adds back the records it keeps.
+"""
+import os
+from datetime import datetime
+from typing import Callable, Iterable, Iterator, List, Optional, Tuple
+
+from renku.ui.service.cache.base import BaseCache
+from renku.ui.service.cache.config import REDIS_NAMESPACE
+
+EXPIRY_BATCH_SIZE = int(os.getenv("RENKU_SVC_CLEANUP_BATCH_SIZE", 100))
+EXPIRY_REINDEX_INTERVAL = 24 * 60 * 60
+
+# NOTE: KEYS: index. ARGV: max score, batch size. Removes and returns up to batch size members with a lower score.
+_POP_EXPIRED_SCRIPT = """
+local expired = redis.call('ZRANGEBYSCORE', KEYS[1], '-inf', ARGV[1], 'LIMIT', 0, ARGV[2])
+if #expired > 0 then
+    redis.call('ZREM', KEYS[1], unpack(expired))
+end
+return expired
+"""
+
+_EPOCH = datetime(1970, 1, 1)
+
+
+def get_timestamp(value: Optional[datetime]) -> float:
+    """Return seconds since epoch of a UTC datetime; records without a date sort first so that they expire."""
+    return (value - _EPOCH).total_seconds() if value else 0.0
+
+
+class ExpiryIndex:
+    """A sorted set of record ids scored by the time the records were last used."""
+
+    def __init__(self, name: str):
+        self.key = f"{REDIS_NAMESPACE}.expiry.{name}"
+
+    def add(self, record_id: str, last_used: Optional[datetime]):
+        """Add a record or update the time it was last used."""
+        BaseCache.cache.zadd(self.key, {record_id: get_timestamp(last_used)})
+
+    def remove(self, record_id: str):
+        """Remove a record."""
+        BaseCache.cache.zrem(self.key, record_id)
+
+    def used_since(self, since: datetime) -> List[str]:
+        """Return ids of records that were used at or after ``since``."""
+        return [
+            record_id.decode("utf-8")
+            for record_id in BaseCache.cache.zrangebyscore(self.key, get_timestamp(since), "+inf")
+        ]
+
+    def pop_expired(self, cutoff: float, batch_size: int = EXPIRY_BATCH_SIZE) -> List[str]:
+        """Remove and return ids of up to ``batch_size`` records that were last used before ``cutoff``."""
+        script = BaseCache.cache.register_script(_POP_EXPIRED_SCRIPT)
+        return [record_id.decode("utf-8") for record_id in script(keys=[self.key], args=[cutoff, batch_size])]
+
+    def expired(self, ttl: int, batch_size: int = EXPIRY_BATCH_SIZE) -> Iterator[str]:
+        """Pop ids of records that weren't used for ``ttl`` seconds batch by batch until none are left.
+
+        NOTE: Records that are kept must be added back with the current time or a later one, otherwise they are popped
+        again.
+        """
+        cutoff = get_timestamp(datetime.utcnow()) - ttl
+
+        while True:
+            batch = self.pop_expired(cutoff=cutoff, batch_size=batch_size)
+            if not batch:
+                return
+
+            yield from batch
+
+    def reindex(self, get_records: Callable[[], Iterable[Tuple[str, Optional[datetime]]]]) -> bool:
+        """Add all records to the index at most once per ``EXPIRY_REINDEX_INTERVAL``.
+
+        This indexes records that were cached before the index existed and records whose cleanup was interrupted.
+
+        Args:
+            get_records(Callable[[], Iterable[Tuple[str, Optional[datetime]]]]): Returns ids of all records and the
+                times they were last used.
+
+        Returns:
+            bool: Whether records were indexed.
+        """
+        if not BaseCache.cache.set(f"{self.key}.indexed", 1, nx=True, ex=EXPIRY_REINDEX_INTERVAL):
+            return False
+
+        with BaseCache.cache.pipeline(transaction=False) as pipeline:
+            for record_id, last_used in get_records():
+                pipeline.zadd(self.key, {record_id: get_timestamp(last_used)})
+            pipeline.execute()
+
+        return True
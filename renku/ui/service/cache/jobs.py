@@ -43,6 +43,7 @@ class JobManagementCache(BaseCache):
             job_obj.locked.add(project)
 
         job_obj.save()
+        job_obj.save_locks()
         return job_obj
 
     @staticmethod
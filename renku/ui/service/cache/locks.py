@@ -0,0 +1,245 @@
+# Copyright Swiss Data Science Center (SDSC). A partnership between
+# École Polytechnique Fédérale de Lausanne (EPFL) and
+# Eidgenössische Technische Hochschule Zürich (ETHZ).
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+"""Reader/writer locks for cached projects.
+
+Requests that need a project wait in a fair, Redis-backed queue: a writer gets the lock once all earlier requests are
+done, and readers share the lock unless a writer is holding it or waiting before them (writer preference). Holders
+renew a lease while they hold the lock and waiters renew their place in the queue while they wait, so locks and queue
+entries of dead processes are reaped once their lease expires.
+
+Waiters poll for their turn with an exponential backoff. Keys of a project's lock are refreshed by every waiter and
+holder and expire only after the longest wait of a writer, so arrival order survives idle periods.
+
+Once a request gets its turn it also takes a file lock on the project. The file lock enforces mutual exclusion if
+Redis is not available, in which case requests poll for the file lock until their timeout.
+"""
+import os
+import threading
+import time
+import uuid
+from contextlib import contextmanager
+from pathlib import Path
+
+import portalocker
+from prometheus_client import Counter, Histogram
+from redis import RedisError
+
+from renku.core import errors
+from renku.ui.service.cache.base import BaseCache
+from renku.ui.service.cache.config import REDIS_NAMESPACE
+from renku.ui.service.logger import service_log
+
+READ = "r"
+WRITE = "w"
+
+LOCK_LEASE = int(os.getenv("RENKU_SVC_LOCK_LEASE", 60))
+LOCK_WAITER_LEASE = 5
+LOCK_POLL_INTERVAL = 0.05
+LOCK_MAX_POLL_INTERVAL = 1.0
+# NOTE: Clones and fetches wait behind each other, so writers wait longer by default
+WRITE_LOCK_TIMEOUT = int(os.getenv("RENKU_SVC_PROJECT_WRITE_LOCK_TIMEOUT", 300))
+LOCK_KEY_TTL = WRITE_LOCK_TIMEOUT + LOCK_LEASE
+
+LOCK_WAIT_TIME = Histogram("renku_svc_project_lock_wait_seconds", "Time spent waiting for a project lock.", ["mode"])
+LOCK_HOLD_TIME = Histogram("renku_svc_project_lock_hold_seconds", "Time a project lock was held.", ["mode"])
+LOCK_TIMEOUTS = Counter("renku_svc_project_lock_timeouts", "Requests that timed out waiting for a lock.", ["mode"])
+
+# NOTE: Tickets are prefixed with their mode. KEYS: queue (ticket -> arrival), waiters (ticket -> lease expiry),
+# holders (ticket -> lease expiry), arrival sequence. ARGV: ticket, now, waiter lease expiry, holder lease expiry, max
+# readers, key TTL.
+# Returns 1 if the lock was acquired, 0 if the ticket must wait and -1 if the ticket was reaped.
+_ACQUIRE_SCRIPT = """
+local queue, waiters, holders = KEYS[1], KEYS[2], KEYS[3]
+local ticket, now = ARGV[1], tonumber(ARGV[2])
+local mode = string.sub(ticket, 1, 1)
+
+for _, stale in ipairs(redis.call('ZRANGEBYSCORE', waiters, '-inf', now)) do
+    redis.call('ZREM', queue, stale)
+    redis.call('ZREM', waiters, stale)
+end
+redis.call('ZREMRANGEBYSCORE', holders, '-inf', now)
+
+local rank = redis.call('ZRANK', queue, ticket)
+if not rank then
+    return -1
+end
+redis.call('ZADD', waiters, ARGV[3], ticket)
+for _, key in ipairs(KEYS) do
+    redis.call('EXPIRE', key, ARGV[6])
+end
+
+local readers = 0
+for _, holder in ipairs(redis.call('ZRANGE', holders, 0, -1)) do
+    if string.sub(holder, 1, 1) == 'w' then
+        return 0
+    end
+    readers = readers + 1
+end
+
+if mode == 'w' then
+    if readers > 0 or rank > 0 then
+        return 0
+    end
+else
+    if readers >= tonumber(ARGV[5]) then
+        return 0
+    end
+    if rank > 0 then
+        for _, waiting in ipairs(redis.call('ZRANGE', queue, 0, rank - 1)) do
+            if string.sub(waiting, 1, 1) == 'w' then
+                return 0
+            end
+        end
+    end
+end
+
+redis.call('ZREM', queue, ticket)
+redis.call('ZREM', waiters, ticket)
+redis.call('ZADD', holders, ARGV[4], ticket)
+redis.call('EXPIRE', holders, ARGV[6])
+return 1
+"""
+
+
+class ProjectLock:
+    """A reader/writer lock on a cached project."""
+
+    def __init__(self, path: Path, mode: str, timeout: float, max_readers: int):
+        self.path = path
+        self.mode = mode
+        self.timeout = timeout
+        self.max_readers = max_readers
+
+        key = f"{REDIS_NAMESPACE}.project.lock.{path}"
+        self._queue_key = f"{key}.queue"
+        self._waiters_key = f"{key}.waiters"
+        self._holders_key = f"{key}.holders"
+        self._sequence_key = f"{key}.sequence"
+
+    @contextmanager
+    def acquire(self):
+        """Wait for the lock and hold it while in context."""
+        started = time.monotonic()
+        ticket = f"{self.mode}:{uuid.uuid4().hex}"
+
+        queued = self._enqueue(ticket)
+        try:
+            if queued:
+                self._wait(ticket, deadline=started + self.timeout)
+            file_lock = self._acquire_file_lock(remaining=max(0.0, started + self.timeout - time.monotonic()))
+        except BaseException:
+            self._release(ticket)
+            raise
+
+        LOCK_WAIT_TIME.labels(mode=self.mode).observe(time.monotonic() - started)
+        acquired = time.monotonic()
+        stop_renewal = self._start_lease_renewal(ticket) if queued else None
+
+        try:
+            yield
+        finally:
+            if stop_renewal is not None:
+                stop_renewal.set()
+            file_lock.release()
+            self._release(ticket)
+            LOCK_HOLD_TIME.labels(mode=self.mode).observe(time.monotonic() - acquired)
+
+    def _enqueue(self, ticket: str) -> bool:
+        """Add a ticket to the project's queue; return False if Redis is not available."""
+        try:
+            arrival = BaseCache.cache.incr(self._sequence_key)
+            with BaseCache.cache.pipeline() as pipeline:
+                pipeline.zadd(self._waiters_key, {ticket: time.time() + LOCK_WAITER_LEASE})
+                pipeline.zadd(self._queue_key, {ticket: arrival})
+                for key in (self._sequence_key, self._waiters_key, self._queue_key):
+                    pipeline.expire(key, LOCK_KEY_TTL)
+                pipeline.execute()
+        except RedisError as e:
+            service_log.warning(f"Cannot queue for lock on {self.path}, falling back to file locks: {e}")
+            return False
+
+        return True
+
+    def _wait(self, ticket: str, deadline: float):
+        """Wait until a ticket can take the lock; polls are spaced by an exponential backoff."""
+        script = BaseCache.cache.register_script(_ACQUIRE_SCRIPT)
+        poll_interval = LOCK_POLL_INTERVAL
+
+        while True:
+            now = time.time()
+            result = script(
+                keys=[self._queue_key, self._waiters_key, self._holders_key, self._sequence_key],
+                args=[ticket, now, now + LOCK_WAITER_LEASE, now + LOCK_LEASE, self.max_readers, LOCK_KEY_TTL],
+            )
+            if result == 1:
+                return
+            elif result == -1:
+                raise errors.LockError(f"Lock request for {self.path} expired")
+            elif time.monotonic() >= deadline:
+                LOCK_TIMEOUTS.labels(mode=self.mode).inc()
+                raise errors.LockError(f"Timed out waiting for a lock on {self.path}")
+
+            time.sleep(min(poll_interval, max(0.0, deadline - time.monotonic())))
+            poll_interval = min(2 * poll_interval, LOCK_MAX_POLL_INTERVAL)
+
+    def _acquire_file_lock(self, remaining: float) -> portalocker.Lock:
+        """Take the file lock; if Redis queuing is unavailable, this is the only lock and requests poll for it."""
+        flags = portalocker.LOCK_EX if self.mode == WRITE else portalocker.LOCK_SH
+        file_lock = portalocker.Lock(
+            f"{self.path}.lock", flags=flags | portalocker.LOCK_NB, timeout=remaining, check_interval=LOCK_POLL_INTERVAL
+        )
+        try:
+            file_lock.acquire()
+        except (portalocker.LockException, portalocker.AlreadyLocked) as e:
+            LOCK_TIMEOUTS.labels(mode=self.mode).inc()
+            raise errors.LockError(f"Timed out waiting for a lock on {self.path}") from e
+
+        return file_lock
+
+    def _start_lease_renewal(self, ticket: str) -> threading.Event:
+        """Renew the lease of a held lock until the returned event is set."""
+        stop = threading.Event()
+
+        def renew():
+            while not stop.wait(LOCK_LEASE / 3):
+                try:
+                    with BaseCache.cache.pipeline() as pipeline:
+                        pipeline.zadd(self._holders_key, {ticket: time.time() + LOCK_LEASE}, xx=True)
+                        for key in (self._holders_key, self._sequence_key, self._queue_key, self._waiters_key):
+                            pipeline.expire(key, LOCK_KEY_TTL)
+                        pipeline.execute()
+                except RedisError:
+                    pass
+
+        threading.Thread(target=renew, daemon=True, name=f"renew-lock-{ticket}").start()
+
+        return stop
+
+    def _release(self, ticket: str):
+        """Remove a ticket from the project's queue and holders."""
+        try:
+            with BaseCache.cache.pipeline() as pipeline:
+                pipeline.zrem(self._queue_key, ticket)
+                pipeline.zrem(self._waiters_key, ticket)
+                pipeline.zrem(self._holders_key, ticket)
+                pipeline.execute()
+        except RedisError:
+            pass
+
+
+def project_lock(path: Path, mode: str, timeout: float, max_readers: int):
+    """Return a context manager that holds a reader (``READ``) or writer (``WRITE``) lock on a project path."""
+    return ProjectLock(path=path, mode=mode, timeout=timeout, max_readers=max_readers).acquire()
@@ -21,8 +21,18 @@ from datetime import datetime
 from walrus import BooleanField, DateTimeField, IntegerField, Model, TextField
 
 from renku.ui.service.cache.base import BaseCache
+from renku.ui.service.cache.expiry import ExpiryIndex
+from renku.ui.service.cache.models.job import Job
 from renku.ui.service.config import CACHE_UPLOADS_PATH
 
+FILES_EXPIRY = ExpiryIndex("files")
+CHUNKS_EXPIRY = ExpiryIndex("chunks")
+
+
+def get_files_ttl() -> int:
+    """Return the time to live of cached files and chunks in seconds."""
+    return int(os.getenv("RENKU_SVC_CLEANUP_TTL_FILES", 1800))
+
 
 class File(Model):
     """User file object."""
@@ -45,6 +55,17 @@ class File(Model):
     is_dir = BooleanField()
     unpack_archive = BooleanField()
 
+    def save(self, _is_create=False):
+        """Save the file and add it to the expiry index."""
+        super().save(_is_create=_is_create)
+        FILES_EXPIRY.add(self.file_id, self.created_at)
+
+    def delete(self, for_update=False):
+        """Delete the file and remove it from the expiry index."""
+        if not for_update:
+            FILES_EXPIRY.remove(self.file_id)
+        super().delete(for_update=for_update)
+
     @property
     def abs_path(self):
         """Full path of cached file."""
@@ -73,7 +94,7 @@ class File(Model):
             # we should mark it for deletion.
             return True
 
-        ttl = ttl or int(os.getenv("RENKU_SVC_CLEANUP_TTL_FILES", 1800))
+        ttl = ttl or get_files_ttl()
         return self.age >= ttl
 
     def purge(self):
@@ -86,9 +107,9 @@ class File(Model):
 
         self.delete()
 
-    def is_locked(self, jobs):
-        """Check if file locked by given jobs."""
-        return bool(next((job for job in jobs if self.file_id in job.locked), False))
+    def is_locked(self):
+        """Check if file is locked by an enqueued or running job."""
+        return Job.is_resource_locked(self.file_id)
 
 
 class FileChunk(Model):
@@ -106,6 +127,17 @@ class FileChunk(Model):
     file_name = TextField()
     relative_path = TextField()
 
+    def save(self, _is_create=False):
+        """Save the chunk and add it to the expiry index."""
+        super().save(_is_create=_is_create)
+        CHUNKS_EXPIRY.add(self.chunk_file_id, self.created_at)
+
+    def delete(self, for_update=False):
+        """Delete the chunk and remove it from the expiry index."""
+        if not for_update:
+            CHUNKS_EXPIRY.remove(self.chunk_file_id)
+        super().delete(for_update=for_update)
+
     @property
     def abs_path(self):
         """Full path of cached file."""
@@ -133,7 +165,7 @@ class FileChunk(Model):
             # we should mark it for deletion.
             return True
 
-        ttl = ttl or int(os.getenv("RENKU_SVC_CLEANUP_TTL_FILES", 1800))
+        ttl = ttl or get_files_ttl()
         return self.age >= ttl
 
     def purge(self):
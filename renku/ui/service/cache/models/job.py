@@ -14,6 +14,8 @@
 # See the License for the specific language governing permissions and
 # limitations under the License.
 """Renku service cache job related models."""
+import json
+
 from walrus import DateTimeField, JSONField, Model, SetField, TextField
 
 from renku.ui.service.cache.base import BaseCache
@@ -25,6 +27,11 @@ USER_JOB_STATE_COMPLETED = "COMPLETED"
 USER_JOB_STATE_FAILED = "FAILED"
 
 
+def get_lock_key(resource_id: str) -> str:
+    """Return the key of the set of jobs that lock a resource."""
+    return f"{BaseCache.namespace}.job.locks.{resource_id}"
+
+
 class Job(Model):
     """Job cache model."""
 
@@ -58,6 +65,7 @@ class Job(Model):
         """Mark job as completed."""
         self.state = USER_JOB_STATE_COMPLETED
         self.save()
+        self.release_locks()
 
     def fail_job(self, error):
         """Mark job as failed."""
@@ -68,6 +76,53 @@ class Job(Model):
 
         self.extras["error"] = error
         self.save()
+        self.release_locks()
+
+    def save_locks(self):
+        """Add the job to the lock sets of the resources that it locks."""
+        with self.__database__.pipeline(transaction=False) as pipeline:
+            for resource_id in self.locked.members():
+                pipeline.sadd(get_lock_key(resource_id.decode("utf-8")), self.job_id)
+            pipeline.execute()
+
+    def release_locks(self):
+        """Remove the job from the lock sets of the resources that it locks."""
+        with self.__database__.pipeline(transaction=False) as pipeline:
+            for resource_id in self.locked.members():
+                pipeline.srem(get_lock_key(resource_id.decode("utf-8")), self.job_id)
+            pipeline.execute()
+
+    @classmethod
+    def is_resource_locked(cls, resource_id: str) -> bool:
+        """Check if an enqueued or running job locks a resource.
+
+        Jobs that are finished or deleted but didn't release their locks (e.g. because a worker died) are removed from
+        the resource's lock set.
+        """
+        lock_key = get_lock_key(resource_id)
+        job_ids = list(cls.__database__.smembers(lock_key))
+        if not job_ids:
+            return False
+
+        with cls.__database__.pipeline(transaction=False) as pipeline:
+            for job_id in job_ids:
+                pipeline.hget(cls._query.get_primary_hash_key(job_id.decode("utf-8")), "state")
+            states = pipeline.execute()
+
+        active_states = {USER_JOB_STATE_ENQUEUED.encode("utf-8"), USER_JOB_STATE_IN_PROGRESS.encode("utf-8")}
+        released = [job_id for job_id, state in zip(job_ids, states) if state not in active_states]
+        if released:
+            cls.__database__.srem(lock_key, *released)
+
+        return len(released) < len(job_ids)
+
+    def save_extras(self):
+        """Store only the extras field.
+
+        This is much cheaper than ``save`` which re-writes all fields and indexes; use it for frequent updates like
+        progress reports.
+        """
+        self.__database__.hset(self.get_hash_id(), "extras", json.dumps(self.extras))
 
     def update_extras(self, key, value):
         """Update extras field."""
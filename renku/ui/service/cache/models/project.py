@@ -19,18 +19,28 @@ import os
 import shutil
 from datetime import datetime
 from pathlib import Path
-from typing import Optional
+from typing import Iterable, List, Optional
 
-import portalocker
 from walrus import BooleanField, DateTimeField, IntegerField, Model, TextField
 
 from renku.ui.service.cache.base import BaseCache
+from renku.ui.service.cache.expiry import ExpiryIndex
+from renku.ui.service.cache.locks import READ, WRITE, WRITE_LOCK_TIMEOUT, project_lock
+from renku.ui.service.cache.models.job import Job
 from renku.ui.service.config import CACHE_PROJECTS_PATH
 
 MAX_CONCURRENT_PROJECT_REQUESTS = 10
-LOCK_TIMEOUT = 15
+LOCK_TIMEOUT = int(os.getenv("RENKU_SVC_PROJECT_LOCK_TIMEOUT", 15))
 NO_BRANCH_FOLDER = "__default_branch__"
 DETACHED_HEAD_FOLDER_PREFIX = "__detached_head_"
+# NOTE: Maps the composite key of a user's project at a branch or commit to its ``project_id``
+PROJECT_LOOKUP_KEY = f"{BaseCache.namespace}.project.lookup"
+PROJECTS_EXPIRY = ExpiryIndex("projects")
+
+
+def get_projects_ttl() -> int:
+    """Return the time to live of cached projects since their last access in seconds."""
+    return int(os.getenv("RENKU_SVC_CLEANUP_TTL_PROJECTS", 1800))
 
 
 class Project(Model):
@@ -57,6 +67,125 @@ class Project(Model):
     owner = TextField()
     initialized = BooleanField()
 
+    @staticmethod
+    def get_lookup_key(
+        user_id: Optional[str], git_url: Optional[str], branch: Optional[str], commit_sha: Optional[str]
+    ) -> str:
+        """Return the composite key of a user's project at a branch or commit."""
+        # NOTE: walrus turns None into empty strings
+        return "\n".join((user_id or "", git_url or "", branch or "", commit_sha or ""))
+
+    @property
+    def lookup_key(self) -> str:
+        """Composite key of the project."""
+        return self.get_lookup_key(self.user_id, self.git_url, self.branch, self.commit_sha)
+
+    @classmethod
+    def find(cls, user_id: str, git_url: str, branch: Optional[str], commit_sha: Optional[str]) -> Optional["Project"]:
+        """Find a user's project at a branch or commit.
+
+        Projects are looked up by their composite key, which takes two round-trips to Redis instead of intersecting
+        the indexes of all four fields. The first miss indexes the composite keys of projects that were cached before.
+
+        Returns:
+            Optional[Project]: The project or ``None`` if it's not cached or if there are more than one matches.
+        """
+        lookup_key = cls.get_lookup_key(user_id, git_url, branch, commit_sha)
+        project_id = cls.__database__.hget(PROJECT_LOOKUP_KEY, lookup_key)
+        if project_id is not None:
+            projects = cls.load_many([project_id.decode("utf-8")])
+            if projects and projects[0].lookup_key == lookup_key:
+                return projects[0]
+        elif cls.reindex_lookup_keys():
+            return cls.find(user_id, git_url, branch, commit_sha)
+
+        return None
+
+    @classmethod
+    def reindex_lookup_keys(cls) -> bool:
+        """Add the composite keys of all projects once.
+
+        This indexes projects that were cached before the composite key existed.
+
+        Returns:
+            bool: Whether projects were indexed.
+        """
+        if not cls.__database__.set(f"{PROJECT_LOOKUP_KEY}.indexed", 1, nx=True):
+            return False
+
+        with cls.__database__.pipeline(transaction=False) as pipeline:
+            for project in cls.all():
+                pipeline.hset(PROJECT_LOOKUP_KEY, project.lookup_key, project.project_id)
+            pipeline.execute()
+
+        return True
+
+    @classmethod
+    def load_many(cls, primary_keys: Iterable, convert_key: bool = True) -> List["Project"]:
+        """Load projects in a single pipelined round-trip; projects that don't exist are skipped.
+
+        Args:
+            primary_keys(Iterable): Ids of the projects or their hash keys if ``convert_key`` is ``False``.
+            convert_key(bool): Whether to convert ids to hash keys (Default value = True).
+
+        Returns:
+            List[Project]: The projects that exist.
+        """
+        with cls.__database__.pipeline(transaction=False) as pipeline:
+            for primary_key in primary_keys:
+                pipeline.hgetall(cls._query.get_primary_hash_key(primary_key) if convert_key else primary_key)
+            results = pipeline.execute()
+
+        projects = []
+        for raw_data in results:
+            if not raw_data:
+                continue
+            raw_data = {key.decode("utf-8"): value for key, value in raw_data.items()}
+            data = {
+                name: field.python_value(raw_data[name]) if name in raw_data else None
+                for name, field in cls._fields.items()
+            }
+            projects.append(cls(**data))
+
+        return projects
+
+    def save(self, _is_create=False):
+        """Save the project and its composite key."""
+        super().save(_is_create=_is_create)
+        self.__database__.hset(PROJECT_LOOKUP_KEY, self.lookup_key, self.project_id)
+        PROJECTS_EXPIRY.add(self.project_id, self.accessed_at)
+
+    def save_fields(self, *names: str):
+        """Store only some fields of a saved project in one round-trip.
+
+        NOTE: ``save`` rewrites the whole project and all of its indexes; indexed fields can only be changed with it.
+        """
+        assert not any(self._fields[name]._index for name in names), f"Cannot store indexed fields {names}"
+        values = {name: getattr(self, name) for name in names}
+
+        with self.__database__.pipeline(transaction=False) as pipeline:
+            updated = {name: self._fields[name].db_value(value) for name, value in values.items() if value is not None}
+            if updated:
+                pipeline.hset(self.get_hash_id(), mapping=updated)
+            # NOTE: Fields that aren't stored are loaded as None
+            removed = [name for name, value in values.items() if value is None]
+            if removed:
+                pipeline.hdel(self.get_hash_id(), *removed)
+            pipeline.execute()
+
+        if "accessed_at" in names:
+            PROJECTS_EXPIRY.add(self.project_id, self.accessed_at)
+
+    def delete(self, for_update=False):
+        """Delete the project and its composite key."""
+        if not for_update:
+            project_id = self.__database__.hget(PROJECT_LOOKUP_KEY, self.lookup_key)
+            if project_id is not None and project_id.decode("utf-8") == self.project_id:
+                self.__database__.hdel(PROJECT_LOOKUP_KEY, self.lookup_key)
+            PROJECTS_EXPIRY.remove(self.project_id)
+
+        super().delete(for_update=for_update)
+
     @property
     def abs_path(self) -> Path:
         """Full path of cached project."""
@@ -70,26 +199,37 @@ class Project(Model):
                 folder_name = NO_BRANCH_FOLDER
         return CACHE_PROJECTS_PATH / self.user_id / self.owner / self.slug / folder_name
 
+    @property
+    def snapshots_path(self) -> Path:
+        """Folder of the project's commit-pinned snapshots."""
+        return self.abs_path.with_name(f"{self.abs_path.name}.snapshots")
+
     def read_lock(self, timeout: Optional[float] = None):
-        """Shared read lock on the project."""
-        timeout = timeout if timeout is not None else LOCK_TIMEOUT
-        return portalocker.Lock(
-            f"{self.abs_path}.lock", flags=portalocker.LOCK_SH | portalocker.LOCK_NB, timeout=timeout
-        )
+        """Shared read lock on the project.
 
-    def write_lock(self):
-        """Exclusive write lock on the project."""
-        return portalocker.Lock(f"{self.abs_path}.lock", flags=portalocker.LOCK_EX, timeout=LOCK_TIMEOUT)
+        Readers wait behind writers that requested the lock before them and at most
+        ``MAX_CONCURRENT_PROJECT_REQUESTS`` readers hold the lock at the same time.
+
+        Args:
+            timeout(Optional[float]): Seconds to wait for the lock before raising ``LockError`` (Default value = None).
+        """
+        timeout = timeout if timeout is not None else LOCK_TIMEOUT
+        return project_lock(self.abs_path, mode=READ, timeout=timeout, max_readers=MAX_CONCURRENT_PROJECT_REQUESTS)
 
-    def concurrency_lock(self):
-        """Lock to limit concurrent operations on a project.
+    def write_lock(self, blocking: bool = True, timeout: Optional[float] = None):
+        """Exclusive write lock on the project.
 
-        This serves as a "leaky bucket" type approach to prevent starvation with multiple
-        concurrent requests.
+        Args:
+            blocking(bool): Whether to wait for the lock; otherwise, raise ``LockError`` immediately if the project is
+                locked (Default value = True).
+            timeout(Optional[float]): Seconds to wait for the lock before raising ``LockError``; defaults to
+                ``WRITE_LOCK_TIMEOUT`` (Default value = None).
         """
-        return portalocker.BoundedSemaphore(
-            MAX_CONCURRENT_PROJECT_REQUESTS, name=f"{self.name}_bounded_semaphore", directory=str(self.abs_path.parent)
-        )
+        if not blocking:
+            timeout = 0
+        elif timeout is None:
+            timeout = WRITE_LOCK_TIMEOUT
+        return project_lock(self.abs_path, mode=WRITE, timeout=timeout, max_readers=MAX_CONCURRENT_PROJECT_REQUESTS)
 
     @property
     def age(self):
@@ -111,6 +251,20 @@ class Project(Model):
         """Returns project's fetch age in seconds."""
         return int((datetime.utcnow() - self.last_fetched_at).total_seconds())
 
+    def is_refresh_due(self, min_fetch_age: int, access_window: int) -> bool:
+        """Whether a project should be fetched in background.
+
+        Args:
+            min_fetch_age(int): Only projects that weren't fetched for this many seconds are refreshed.
+            access_window(int): Only projects accessed within this many seconds are refreshed.
+        """
+        if self.commit_sha or not self.last_fetched_at or not self.initialized:
+            return False
+        elif self.time_since_access is None or self.time_since_access > access_window:
+            return False
+
+        return self.fetch_age >= min_fetch_age
+
     @property
     def is_shallow(self) -> bool:
         """Returns whether the project is checked out shallow or not."""
@@ -129,15 +283,17 @@ class Project(Model):
             return True
 
         # NOTE: time to live measured in seconds
-        ttl = ttl or int(os.getenv("RENKU_SVC_CLEANUP_TTL_PROJECTS", 1800))
+        ttl = ttl or get_projects_ttl()
         return self.time_since_access >= ttl
 
     def purge(self):
         """Removes project from file system and cache."""
         if self.exists():
             shutil.rmtree(str(self.abs_path))
+        if self.snapshots_path.exists():
+            shutil.rmtree(str(self.snapshots_path))
         self.delete()
 
-    def is_locked(self, jobs):
-        """Check if file locked by given jobs."""
-        return bool(next((job for job in jobs if self.project_id in job.locked), False))
+    def is_locked(self):
+        """Check if project is locked by an enqueued or running job."""
+        return Job.is_resource_locked(self.project_id)
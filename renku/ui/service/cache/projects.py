@@ -17,6 +17,7 @@
 from typing import cast
 
 from marshmallow import RAISE
+from walrus.query import Executor
 
 from renku.ui.service.cache.base import BaseCache
 from renku.ui.service.cache.models.project import Project
@@ -58,7 +59,8 @@ class ProjectManagementCache(BaseCache):
     @staticmethod
     def get_projects(user):
         """Get all user cache projects."""
-        return Project.query(Project.user_id == user.user_id)
+        hash_keys = Executor(Project.__database__).execute(Project.user_id == user.user_id)
+        return Project.load_many(hash_keys, convert_key=False)
 
     @staticmethod
     def invalidate_project(user, project_id):
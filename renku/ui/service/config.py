@@ -50,6 +50,24 @@ CACHE_UPLOADS_PATH.mkdir(parents=True, exist_ok=True)
 CACHE_PROJECTS_PATH = Path(CACHE_DIR) / Path("projects")
 CACHE_PROJECTS_PATH.mkdir(parents=True, exist_ok=True)
 
+CACHE_SEEDS_PATH = Path(CACHE_DIR) / Path("seeds")
+
+# NOTE: Every ``PROJECT_REFRESH_INTERVAL`` seconds, projects accessed within ``PROJECT_REFRESH_ACCESS_WINDOW`` seconds
+# that weren't fetched for ``PROJECT_REFRESH_MIN_FETCH_AGE`` seconds are fetched in background. Projects of the warm-up
+# list are mirrored at worker start and are used as a reference when users clone them.
+PROJECT_REFRESH_INTERVAL = int(os.getenv("RENKU_SVC_PROJECT_REFRESH_INTERVAL", 60))
+PROJECT_REFRESH_MIN_FETCH_AGE = int(os.getenv("RENKU_SVC_PROJECT_REFRESH_MIN_FETCH_AGE", 300))
+PROJECT_REFRESH_ACCESS_WINDOW = int(os.getenv("RENKU_SVC_PROJECT_REFRESH_ACCESS_WINDOW", 600))
+PROJECT_SEED_FETCH_TIME = int(os.getenv("RENKU_SVC_PROJECT_SEED_FETCH_TIME", 600))
+PROJECT_WARMUP_LIST = [u.strip() for u in os.getenv("RENKU_SVC_PROJECT_WARMUP_LIST", "").split(",") if u.strip()]
+
+# NOTE: Read-only operations reuse open metadata databases of a project across requests of a worker
+DATABASE_POOL_SIZE = int(os.getenv("RENKU_SVC_DATABASE_POOL_SIZE", 16))
+DATABASE_POOL_MAX_BYTES = int(os.getenv("RENKU_SVC_DATABASE_POOL_MAX_BYTES", 256 * 1024 * 1024))
+
+# NOTE: Batch graph exports run up to ``GRAPH_EXPORT_BATCH_WORKERS`` project exports in parallel processes
+GRAPH_EXPORT_BATCH_WORKERS = int(os.getenv("RENKU_SVC_GRAPH_EXPORT_BATCH_WORKERS", 4))
+
 TAR_ARCHIVE_CONTENT_TYPE = "application/x-tar"
 ZIP_ARCHIVE_CONTENT_TYPE = "application/zip"
 GZ_ARCHIVE_CONTENT_TYPE = "application/x-gzip"
@@ -78,5 +96,23 @@ MESSAGE_PREFIX = os.environ.get("RENKU_DOMAIN", "service") + ":"
 SENTRY_ENABLED = os.getenv("SENTRY_ENABLED", "false").lower() == "true"
 SENTRY_SAMPLERATE = float(os.getenv("SENTRY_SAMPLE_RATE", 0.2))
 
+# ASGI serving mode: requests run in bounded thread pools, one for endpoints that may block on repository operations
+# and one for lightweight endpoints that only read the cache
+OFFLOAD_WORKERS = int(os.getenv("RENKU_SVC_OFFLOAD_WORKERS", 4))
+OFFLOAD_MAX_QUEUE = int(os.getenv("RENKU_SVC_OFFLOAD_MAX_QUEUE", 32))
+LIGHTWEIGHT_WORKERS = int(os.getenv("RENKU_SVC_LIGHTWEIGHT_WORKERS", 4))
+LIGHTWEIGHT_MAX_QUEUE = int(os.getenv("RENKU_SVC_LIGHTWEIGHT_MAX_QUEUE", 128))
+LIGHTWEIGHT_ENDPOINTS = {
+    "",
+    "apiversion",
+    "cache.files_list",
+    "health",
+    "jobs",
+    "project.lock_status",
+    "spec.json",
+    "version",
+    "versions",
+}
+
 # List of all available metadata versions
 METADATA_VERSIONS_LIST = os.getenv("METADATA_VERSIONS_LIST", "/svc/config/metadata-versions/metadata-versions.json")
@@ -28,7 +28,7 @@ from renku.core.util.contexts import renku_project_context
 from renku.infrastructure.repository import Repository
 from renku.ui.service.cache.config import REDIS_NAMESPACE
 from renku.ui.service.cache.models.job import Job
-from renku.ui.service.cache.models.project import Project
+from renku.ui.service.cache.models.project import LOCK_TIMEOUT, Project
 from renku.ui.service.cache.models.user import User
 from renku.ui.service.config import PROJECT_CLONE_DEPTH_DEFAULT
 from renku.ui.service.controllers.utils.remote_project import RemoteProject
@@ -70,6 +70,9 @@ class RenkuOperationMixin(metaclass=ABCMeta):
 
     JOB_RESPONSE_SERIALIZER = DelayedResponseRPC()
 
+    # NOTE: Operations of read-only controllers run on a commit-pinned snapshot of the project and don't block writers
+    READ_ONLY = False
+
     def __init__(
         self,
         cache,
@@ -184,7 +187,8 @@ class RenkuOperationMixin(metaclass=ABCMeta):
             error = Exception("local execution is disabled")
             raise ProgramRenkuError(error)
 
-        project = LocalRepositoryCache().get(
+        repository_cache = LocalRepositoryCache()
+        project = repository_cache.get(
             cache=self.cache,
             git_url=self.request_data["git_url"],
             branch=self.request_data.get("branch"),
@@ -195,24 +199,26 @@ class RenkuOperationMixin(metaclass=ABCMeta):
 
         self.context["project_id"] = project.project_id
 
+        # NOTE: Requests wait in the project's lock queue for a while before the client is asked to retry
         if self.skip_lock:
             lock = contextlib.suppress()
         elif self.is_write or self.migrate_project:
-            lock = project.write_lock()
+            lock = project.write_lock(timeout=LOCK_TIMEOUT)
+        elif self.READ_ONLY:
+            lock = repository_cache.snapshot(project, timeout=LOCK_TIMEOUT)
         else:
-            lock = project.read_lock()
+            lock = project.read_lock(timeout=LOCK_TIMEOUT)
         try:
-            with project.concurrency_lock():
-                with lock:
-                    # NOTE: Get up-to-date version of object
-                    current_project = Project.load(project.project_id)
-                    if self.migrate_project:
-                        self.ensure_migrated(current_project)
+            with lock as snapshot_path:
+                # NOTE: Get up-to-date version of object
+                current_project = Project.load(project.project_id)
+                if self.migrate_project:
+                    self.ensure_migrated(current_project)
 
-                    self.project_path = current_project.abs_path
+                self.project_path = snapshot_path or current_project.abs_path
 
-                    with renku_project_context(self.project_path):
-                        return self.renku_op()
+                with renku_project_context(self.project_path):
+                    return self.renku_op()
         except (portalocker.LockException, portalocker.AlreadyLocked, LockError) as e:
             raise IntermittentLockError() from e
 
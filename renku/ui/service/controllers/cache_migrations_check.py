@@ -36,6 +36,7 @@ class MigrationsCheckCtrl(ServiceCtrl, RenkuOperationMixin):
 
     REQUEST_SERIALIZER = ProjectMigrationCheckRequest()
     RESPONSE_SERIALIZER = ProjectMigrationCheckResponseRPC()
+    READ_ONLY = True
 
     def __init__(self, cache, user_data, request_data, git_api_provider: Type[IGitAPIProvider]):
         """Construct migration check controller."""
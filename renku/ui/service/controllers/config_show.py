@@ -27,6 +27,7 @@ class ShowConfigCtrl(ServiceCtrl, RenkuOperationMixin):
 
     REQUEST_SERIALIZER = ConfigShowRequest()
     RESPONSE_SERIALIZER = ConfigShowResponseRPC()
+    READ_ONLY = True
 
     def __init__(self, cache, user_data, request_data):
         """Construct controller."""
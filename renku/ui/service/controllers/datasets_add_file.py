@@ -20,7 +20,7 @@ from pathlib import Path
 
 from renku.command.dataset import add_to_dataset_command
 from renku.core.errors import RenkuException
-from renku.ui.service.cache.models.job import Job
+from renku.ui.service.cache.models.job import USER_JOB_STATE_ENQUEUED, Job
 from renku.ui.service.config import MESSAGE_PREFIX
 from renku.ui.service.controllers.api.abstract import ServiceCtrl
 from renku.ui.service.controllers.api.mixins import RenkuOpSyncMixin
@@ -52,39 +52,15 @@ class DatasetsAddFileCtrl(ServiceCtrl, RenkuOpSyncMixin):
     def prepare_paths(self):
         """Prepare local paths which can be added in same transaction."""
         local_paths, enqueued_paths = [], []
+        remote_files = []
+        # NOTE: Names of local files are appended to the commit message; remote files are committed separately
+        remote_commit_message = self.ctx["commit_message"]
 
         for _file in self.ctx["files"]:
             local_path = None
 
             if "file_url" in _file:
-                commit_message = self.ctx["commit_message"]
-
-                job = self.cache.make_job(
-                    self.user,
-                    # NOTE: To support operation to be executed on remote project, this behaviour should be updated.
-                    project=self.ctx["project_id"],
-                    job_data={"renku_op": "dataset_add_remote_file", "client_extras": self.ctx.get("client_extras")},
-                )
-                _file["job_id"] = job.job_id
-
-                with enqueue_retry(DATASETS_JOB_QUEUE) as queue:
-                    queue.enqueue(
-                        dataset_add_remote_file,
-                        self.user_data,
-                        job.job_id,
-                        # NOTE: To support operation to be executed on remote project, this behaviour should be updated.
-                        self.ctx["project_id"],
-                        self.ctx["create_dataset"],
-                        commit_message,
-                        self.ctx["slug"],
-                        _file["file_url"],
-                        job_timeout=int(os.getenv("WORKER_DATASET_JOBS_TIMEOUT", 1800)),
-                        result_ttl=int(os.getenv("WORKER_DATASET_JOBS_RESULT_TTL", 500)),
-                        ttl=int(os.getenv("WORKER_DATASET_JOBS_TIMEOUT", 1800)),
-                        failure_ttl=int(os.getenv("WORKER_DATASET_JOBS_RESULT_TTL", 500)),
-                    )
-                    enqueued_paths.append(_file["file_url"])
-
+                remote_files.append(_file)
                 continue
 
             if "file_id" in _file:
@@ -101,8 +77,46 @@ class DatasetsAddFileCtrl(ServiceCtrl, RenkuOpSyncMixin):
             self.ctx["commit_message"] += f" {local_path.name}"
             local_paths.append(str(local_path))
 
+        if remote_files:
+            enqueued_paths = self._enqueue_remote_files(remote_files, remote_commit_message)
+
         return local_paths, enqueued_paths
 
+    def _enqueue_remote_files(self, remote_files, commit_message):
+        """Enqueue a single job that adds all remote files to the dataset with one commit and one push."""
+        urls = [f["file_url"] for f in remote_files]
+
+        job = self.cache.make_job(
+            self.user,
+            # NOTE: To support operation to be executed on remote project, this behaviour should be updated.
+            project=self.ctx["project_id"],
+            job_data={"renku_op": "dataset_add_remote_file", "client_extras": self.ctx.get("client_extras")},
+        )
+        job.update_extras("files", {url: USER_JOB_STATE_ENQUEUED for url in urls})
+        job.save()
+
+        for _file in remote_files:
+            _file["job_id"] = job.job_id
+
+        with enqueue_retry(DATASETS_JOB_QUEUE) as queue:
+            queue.enqueue(
+                dataset_add_remote_file,
+                self.user_data,
+                job.job_id,
+                # NOTE: To support operation to be executed on remote project, this behaviour should be updated.
+                self.ctx["project_id"],
+                self.ctx["create_dataset"],
+                commit_message,
+                self.ctx["slug"],
+                urls,
+                job_timeout=int(os.getenv("WORKER_DATASET_JOBS_TIMEOUT", 1800)),
+                result_ttl=int(os.getenv("WORKER_DATASET_JOBS_RESULT_TTL", 500)),
+                ttl=int(os.getenv("WORKER_DATASET_JOBS_TIMEOUT", 1800)),
+                failure_ttl=int(os.getenv("WORKER_DATASET_JOBS_RESULT_TTL", 500)),
+            )
+
+        return urls
+
     def renku_op(self):
         """Renku operation for the controller."""
         local_paths, enqueued_paths = self.prepare_paths()
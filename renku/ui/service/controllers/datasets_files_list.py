@@ -27,6 +27,7 @@ class DatasetsFilesListCtrl(ServiceCtrl, RenkuOperationMixin):
 
     REQUEST_SERIALIZER = DatasetFilesListRequest()
     RESPONSE_SERIALIZER = DatasetFilesListResponseRPC()
+    READ_ONLY = True
 
     def __init__(self, cache, user_data, request_data):
         """Construct a datasets files list controller."""
@@ -27,6 +27,7 @@ class DatasetsListCtrl(ServiceCtrl, RenkuOperationMixin):
 
     REQUEST_SERIALIZER = DatasetListRequest()
     RESPONSE_SERIALIZER = DatasetListResponseRPC()
+    READ_ONLY = True
 
     def __init__(self, cache, user_data, request_data):
         """Construct a datasets list controller."""
@@ -39,6 +39,7 @@ class GraphExportCtrl(ServiceCtrl, RenkuOperationMixin):
 
     REQUEST_SERIALIZER = GraphExportRequest()
     RESPONSE_SERIALIZER = GraphExportResponseRPC()
+    READ_ONLY = True
 
     def __init__(self, cache, user_data, request_data):
         """Construct a datasets list controller."""
@@ -63,7 +64,11 @@ class GraphExportCtrl(ServiceCtrl, RenkuOperationMixin):
         }
 
         try:
-            result = export_graph_command().build().execute(revision_or_range=self.context["revision"])
+            result = (
+                export_graph_command()
+                .build()
+                .execute(revision_or_range=self.context["revision"], since=self.context.get("since"))
+            )
 
             format = self.context["format"]
 
@@ -0,0 +1,67 @@
+# Copyright Swiss Data Science Center (SDSC). A partnership between
+# École Polytechnique Fédérale de Lausanne (EPFL) and
+# Eidgenössische Technische Hochschule Zürich (ETHZ).
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+"""Renku graph batch export controller."""
+import os
+
+from renku.ui.service.controllers.api.abstract import ServiceCtrl
+from renku.ui.service.jobs.contexts import enqueue_retry
+from renku.ui.service.jobs.graph import graph_export_batch
+from renku.ui.service.jobs.queues import GRAPH_JOB_QUEUE
+from renku.ui.service.serializers.graph import GraphExportBatchRequest, GraphExportBatchResponseRPC
+from renku.ui.service.views import result_response
+
+
+class GraphExportBatchCtrl(ServiceCtrl):
+    """Controller for batch graph export endpoint."""
+
+    REQUEST_SERIALIZER = GraphExportBatchRequest()
+    RESPONSE_SERIALIZER = GraphExportBatchResponseRPC()
+
+    def __init__(self, cache, user_data, request_data):
+        """Construct a batch graph export controller."""
+        self.ctx = self.REQUEST_SERIALIZER.load(request_data)
+        self.cache = cache
+        self.user_data = user_data
+        self.user = cache.ensure_user(user_data)
+
+    @property
+    def context(self):
+        """Controller operation context."""
+        return self.ctx
+
+    def renku_op(self):
+        """Renku operation for the controller."""
+        job = self.cache.make_job(self.user, job_data={"renku_op": "graph_export_batch"})
+
+        with enqueue_retry(GRAPH_JOB_QUEUE) as queue:
+            queue.enqueue(
+                graph_export_batch,
+                self.user_data,
+                job.job_id,
+                self.ctx["projects"],
+                format=self.ctx["format"],
+                callback_url=self.ctx["callback_url"],
+                job_timeout=int(os.getenv("WORKER_GRAPH_JOBS_TIMEOUT", 86400)),
+                result_ttl=int(os.getenv("WORKER_GRAPH_JOBS_RESULT_TTL", 500)),
+                ttl=int(os.getenv("WORKER_GRAPH_JOBS_TIMEOUT", 86400)),
+                failure_ttl=int(os.getenv("WORKER_GRAPH_JOBS_RESULT_TTL", 500)),
+            )
+
+        return job
+
+    def to_response(self):
+        """Execute controller flow and serialize to service response."""
+        return result_response(self.RESPONSE_SERIALIZER, self.renku_op())
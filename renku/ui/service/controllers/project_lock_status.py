@@ -67,7 +67,7 @@ class ProjectLockStatusCtrl(ServiceCtrl, RenkuOperationMixin):
         try:
             with project.read_lock(timeout=self.ctx["timeout"]):
                 return False
-        except (portalocker.LockException, portalocker.AlreadyLocked):
+        except (portalocker.LockException, portalocker.AlreadyLocked, errors.LockError):
             return True
 
     def renku_op(self):
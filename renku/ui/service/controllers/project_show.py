@@ -26,6 +26,7 @@ class ProjectShowCtrl(ServiceCtrl, RenkuOperationMixin):
 
     REQUEST_SERIALIZER = ProjectShowRequest()
     RESPONSE_SERIALIZER = ProjectShowResponseRPC()
+    READ_ONLY = True
 
     def __init__(self, cache, user_data, request_data, migrate_project=False):
         """Construct a project edit controller."""
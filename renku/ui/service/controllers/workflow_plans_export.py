@@ -27,6 +27,7 @@ class WorkflowPlansExportCtrl(ServiceCtrl, RenkuOperationMixin):
 
     REQUEST_SERIALIZER = WorkflowPlansExportRequest()
     RESPONSE_SERIALIZER = WorkflowPlansExportResponseRPC()
+    READ_ONLY = True
 
     def __init__(self, cache, user_data, request_data):
         """Construct a workflow plan show controller."""
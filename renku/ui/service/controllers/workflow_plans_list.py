@@ -28,6 +28,7 @@ class WorkflowPlansListCtrl(ServiceCtrl, RenkuOperationMixin):
 
     REQUEST_SERIALIZER = WorkflowPlansListRequest()
     RESPONSE_SERIALIZER = WorkflowPlansListResponseRPC()
+    READ_ONLY = True
 
     def __init__(self, cache, user_data, request_data):
         """Construct a plans list controller."""
@@ -27,6 +27,7 @@ class WorkflowPlansShowCtrl(ServiceCtrl, RenkuOperationMixin):
 
     REQUEST_SERIALIZER = WorkflowPlansShowRequest()
     RESPONSE_SERIALIZER = WorkflowPlansShowResponseRPC()
+    READ_ONLY = True
 
     def __init__(self, cache, user_data, request_data):
         """Construct a workflow plan show controller."""
@@ -28,8 +28,17 @@ from sentry_sdk.integrations.redis import RedisIntegration
 from sentry_sdk.integrations.rq import RqIntegration
 
 from renku.core.util.util import is_test_session_running
+from renku.infrastructure.database_pool import database_pool
 from renku.ui.service.cache import cache
-from renku.ui.service.config import CACHE_DIR, MAX_CONTENT_LENGTH, SENTRY_ENABLED, SENTRY_SAMPLERATE, SERVICE_PREFIX
+from renku.ui.service.config import (
+    CACHE_DIR,
+    DATABASE_POOL_MAX_BYTES,
+    DATABASE_POOL_SIZE,
+    MAX_CONTENT_LENGTH,
+    SENTRY_ENABLED,
+    SENTRY_SAMPLERATE,
+    SERVICE_PREFIX,
+)
 from renku.ui.service.errors import (
     ProgramHttpMethodError,
     ProgramHttpMissingError,
@@ -76,6 +85,8 @@ def create_app(custom_exceptions=True):
 
     app.config["cache"] = cache
 
+    database_pool.configure(max_size=DATABASE_POOL_SIZE, max_bytes=DATABASE_POOL_MAX_BYTES)
+
     if not is_test_session_running():
         GunicornPrometheusMetrics(app)
 
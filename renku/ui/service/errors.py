@@ -839,3 +839,14 @@ class IntermittentCacheError(ServiceError):
 
     def __init__(self, exception=None):
         super().__init__(exception=exception)
+
+
+class IntermittentServiceBusyError(ServiceError):
+    """The service cannot accept more requests since all its workers are busy."""
+
+    code = SVC_ERROR_INTERMITTENT + 204
+    userMessage = "The servers are currently busy. Please try it again in a few seconds."
+    devMessage = "Too many requests are waiting for a worker. Check service saturation metrics."
+
+    def __init__(self, exception=None):
+        super().__init__(exception=exception)
@@ -17,8 +17,11 @@
 
 import os
 import shutil
+import time
 import uuid
+from contextlib import contextmanager
 from datetime import datetime
+from pathlib import Path
 from typing import Optional
 from urllib.parse import urlparse
 
@@ -32,9 +35,9 @@ from renku.core.util.os import normalize_to_ascii
 from renku.domain_model.git import GitURL
 from renku.infrastructure.repository import Repository
 from renku.ui.service.cache import ServiceCache
-from renku.ui.service.cache.models.project import Project
+from renku.ui.service.cache.models.project import LOCK_TIMEOUT, PROJECTS_EXPIRY, Project, get_projects_ttl
 from renku.ui.service.cache.models.user import User
-from renku.ui.service.config import PROJECT_CLONE_DEPTH_DEFAULT
+from renku.ui.service.config import CACHE_SEEDS_PATH, PROJECT_CLONE_DEPTH_DEFAULT, PROJECT_SEED_FETCH_TIME
 from renku.ui.service.errors import IntermittentCacheError, IntermittentLockError
 from renku.ui.service.interfaces.repository_cache import IRepositoryCache
 from renku.ui.service.logger import service_log
@@ -61,14 +64,8 @@ class LocalRepositoryCache(IRepositoryCache):
         commit_sha = commit_sha or ""
 
         git_url = normalize_git_url(git_url)
-        try:
-            project = Project.get(
-                (Project.user_id == user.user_id)
-                & (Project.git_url == git_url)
-                & (Project.branch == branch)
-                & (Project.commit_sha == commit_sha)
-            )
-        except ValueError:
+        project = Project.find(user.user_id, git_url, branch, commit_sha)
+        if project is None:
             # project not found in DB
             return self._clone_project(cache, git_url, branch, user, shallow, commit_sha)
 
@@ -99,17 +96,34 @@ class LocalRepositoryCache(IRepositoryCache):
             project.delete()
         except Exception as e:
             service_log.error(f"Couldn't purge project {project.project_id}:{project.name} from cache", exc_info=e)
+            # NOTE: Try again once the project expires another time
+            PROJECTS_EXPIRY.add(project.project_id, datetime.utcnow())
 
     def evict_expired(self):
-        """Evict expired projects from cache."""
-        for project in Project.all():
-            if project.ttl_expired():
+        """Evict expired projects from cache.
+
+        Only projects that are due according to the expiry index are loaded; projects that are locked by a job are
+        checked again after another time to live.
+        """
+        PROJECTS_EXPIRY.reindex(lambda: ((p.project_id, p.accessed_at) for p in Project.all()))
+
+        for project_id in PROJECTS_EXPIRY.expired(ttl=get_projects_ttl()):
+            try:
+                project = Project.load(project_id)
+            except KeyError:
+                continue
+
+            if project.is_locked():
+                PROJECTS_EXPIRY.add(project.project_id, datetime.utcnow())
+            elif project.ttl_expired():
                 self.evict(project)
+            else:
+                PROJECTS_EXPIRY.add(project.project_id, project.accessed_at)
 
     def _update_project_access_date(self, project: Project):
         """Update the access date of the project to current datetime."""
         project.accessed_at = datetime.utcnow()
-        project.save()
+        project.save_fields("accessed_at")
 
     def _clone_project(
         self,
@@ -155,19 +169,10 @@ class LocalRepositoryCache(IRepositoryCache):
 
         try:
             with project.write_lock(), renku_project_context(project.abs_path, check_git_path=False):
-                try:
-                    # NOTE: If two requests ran at the same time, by the time we acquire the lock a project might
-                    # already be cloned by an earlier request.
-                    found_project = Project.get(
-                        (Project.user_id == user.user_id)
-                        & (Project.git_url == git_url)
-                        & (Project.branch == branch)
-                        & (Project.commit_sha == commit_sha)
-                        & (Project.project_id != project.project_id)
-                    )
-                except ValueError:
-                    pass
-                else:
+                # NOTE: If two requests ran at the same time, by the time we acquire the lock a project might
+                # already be cloned by an earlier request.
+                found_project = Project.find(user.user_id, git_url, branch, commit_sha)
+                if found_project is not None and found_project.project_id != project.project_id:
                     if found_project.abs_path.exists():
                         service_log.debug(f"project already cloned, skipping clone: {git_url}")
                         self._update_project_access_date(found_project)
@@ -181,6 +186,12 @@ class LocalRepositoryCache(IRepositoryCache):
                     for d in dirs:
                         shutil.rmtree(os.path.join(root, d))
 
+                # NOTE: Borrow objects from a warmed-up mirror of the project if there is one
+                seed_path = get_seed_path(git_url)
+                clone_options = (
+                    [f"--reference-if-able={seed_path}", "--dissociate"] if (seed_path / "HEAD").exists() else None
+                )
+
                 repo, project.initialized = (
                     project_clone_command()
                     .build()
@@ -195,6 +206,7 @@ class LocalRepositoryCache(IRepositoryCache):
                             "pull.rebase": False,
                         },
                         checkout_revision=commit_sha or project.branch,
+                        clone_options=clone_options,
                     )
                 ).output
                 project.save()
@@ -224,10 +236,145 @@ class LocalRepositoryCache(IRepositoryCache):
 
                 repository.reset(f"origin/{repository.active_branch}", hard=True)
                 project.clone_depth = None
-                project.save()
+                project.save_fields("clone_depth")
         except (portalocker.LockException, portalocker.AlreadyLocked, errors.LockError) as e:
             raise IntermittentLockError() from e
 
+    def refresh(self, project: Project, blocking: bool = True, min_fetch_age: int = 0) -> bool:
+        """Fetch a project from its remote and reset it to the remote branch.
+
+        Args:
+            project(Project): The project to refresh.
+            blocking(bool): Whether to wait for the project's write lock; otherwise, raise ``LockError`` if the
+                project is locked (Default value = True).
+            min_fetch_age(int): Skip the fetch if the project was fetched less than this many seconds ago by the time
+                the lock is acquired (Default value = 0).
+
+        Returns:
+            Whether the project was fetched.
+        """
+        if project.commit_sha is not None and project.commit_sha != "":
+            # NOTE: A project in a detached head state at a specific commit SHA cannot be updated
+            return False
+
+        with project.write_lock(blocking=blocking), Repository(project.abs_path) as repository:
+            # NOTE: Another request or the background refresher might have fetched the project meanwhile
+            project = Project.load(project.project_id)
+            if project.fetch_age < min_fetch_age:
+                return False
+
+            try:
+                # NOTE: it rarely happens that origin is not reachable. Try again if it fails.
+                repository.fetch(
+                    "origin",
+                    repository.active_branch,
+                    depth=project.clone_depth if project.clone_depth is not None and project.clone_depth > 0 else None,
+                )
+                repository.reset(f"origin/{repository.active_branch}", hard=True)
+            except errors.GitCommandError as e:
+                project.purge()
+                raise IntermittentCacheError(e)
+
+            project.last_fetched_at = datetime.utcnow()
+            project.save_fields("last_fetched_at")
+
+            self._collect_snapshots(project, repository)
+
+        return True
+
+    @contextmanager
+    def snapshot(self, project: Project, timeout: Optional[float] = None):
+        """Hold an immutable checkout of a project's current commit while in context.
+
+        Snapshots are worktrees of the cached clone that are pinned to a commit: read-only operations on a snapshot
+        don't wait for writers of the project and writers don't wait for them. Each user of a snapshot holds a shared
+        lock on it that acts as a reference count; unused snapshots of older commits are removed when the project is
+        refreshed.
+
+        Args:
+            project(Project): The project to take a snapshot of.
+            timeout(Optional[float]): Seconds to wait for the project's read lock (Default value = None).
+
+        Returns:
+            Path of the snapshot.
+        """
+        with project.read_lock(timeout=timeout), Repository(project.abs_path) as repository:
+            commit_sha = repository.head.commit.hexsha
+            path = project.snapshots_path / commit_sha
+            project.snapshots_path.mkdir(parents=True, exist_ok=True)
+
+            creation_lock = portalocker.Lock(
+                f"{path}.lock", flags=portalocker.LOCK_EX | portalocker.LOCK_NB, timeout=LOCK_TIMEOUT
+            )
+            with creation_lock:
+                if not path.exists():
+                    # NOTE: Check out into a temporary folder, so a failed checkout is never used as a snapshot
+                    temporary_path = path.with_name(f"{path.name}.tmp")
+                    shutil.rmtree(temporary_path, ignore_errors=True)
+                    repository.run_git_command("worktree", "prune")
+                    repository.run_git_command(
+                        "worktree", "add", "--detach", temporary_path, commit_sha, env={"GIT_LFS_SKIP_SMUDGE": "1"}
+                    )
+                    repository.run_git_command("worktree", "move", temporary_path, path)
+
+            reference = portalocker.Lock(
+                f"{path}.lock", flags=portalocker.LOCK_SH | portalocker.LOCK_NB, timeout=LOCK_TIMEOUT
+            )
+            reference.acquire()
+
+        try:
+            yield path
+        finally:
+            reference.release()
+
+    @staticmethod
+    def _collect_snapshots(project: Project, repository: Repository):
+        """Remove unused snapshots that are not at the project's current commit.
+
+        NOTE: This must run under the project's write lock, since snapshots are only created and referenced under its
+        read lock.
+        """
+        if not project.snapshots_path.exists():
+            return
+
+        current = repository.head.commit.hexsha
+        for path in project.snapshots_path.iterdir():
+            if not path.is_dir() or path.name == current:
+                continue
+
+            try:
+                with portalocker.Lock(f"{path}.lock", flags=portalocker.LOCK_EX | portalocker.LOCK_NB, timeout=0):
+                    shutil.rmtree(path)
+                    os.unlink(f"{path}.lock")
+            except (portalocker.LockException, portalocker.AlreadyLocked):
+                # NOTE: The snapshot is still in use
+                continue
+
+        repository.run_git_command("worktree", "prune")
+
+    def warm_up(self, git_url: str):
+        """Mirror a project into the seeds cache or update its mirror if it's older than ``PROJECT_SEED_FETCH_TIME``.
+
+        Seeds are used as a reference when users clone a project, so that only objects that are missing from the seed
+        are downloaded.
+        """
+        path = get_seed_path(git_url)
+        path.parent.mkdir(parents=True, exist_ok=True)
+        last_fetch = path.with_name(f"{path.name}.fetched")
+
+        with portalocker.Lock(f"{path}.lock", flags=portalocker.LOCK_EX | portalocker.LOCK_NB, timeout=LOCK_TIMEOUT):
+            if (path / "HEAD").exists():
+                if last_fetch.exists() and time.time() - last_fetch.stat().st_mtime < PROJECT_SEED_FETCH_TIME:
+                    return
+                Repository(path).run_git_command("fetch", "--prune", "origin")
+            else:
+                shutil.rmtree(path, ignore_errors=True)
+                seed = Repository.clone_from(normalize_git_url(git_url), path, clone_options=["--mirror"])
+                # NOTE: Seeds are never garbage-collected since concurrent clones might be reading their objects
+                seed.run_git_command("config", "gc.auto", "0")
+
+            last_fetch.touch()
+
     def _maybe_update_cache(self, project: Project, user: User):
         """Update the cache from the remote if it's out of date."""
         from renku.ui.service.controllers.api.mixins import PROJECT_FETCH_TIME
@@ -235,32 +382,18 @@ class LocalRepositoryCache(IRepositoryCache):
         if project.fetch_age < PROJECT_FETCH_TIME:
             return
 
-        if project.commit_sha is not None and project.commit_sha != "":
-            # NOTE: A project in a detached head state at a specific commit SHA cannot be updated
-            return
-
         try:
-            with project.write_lock(), Repository(project.abs_path) as repository:
-                try:
-                    # NOTE: it rarely happens that origin is not reachable. Try again if it fails.
-                    repository.fetch(
-                        "origin",
-                        repository.active_branch,
-                        depth=project.clone_depth
-                        if project.clone_depth is not None and project.clone_depth > 0
-                        else None,
-                    )
-                    repository.reset(f"origin/{repository.active_branch}", hard=True)
-                except errors.GitCommandError as e:
-                    project.purge()
-                    raise IntermittentCacheError(e)
-
-                project.last_fetched_at = datetime.utcnow()
-                project.save()
+            self.refresh(project, min_fetch_age=PROJECT_FETCH_TIME)
         except (portalocker.LockException, portalocker.AlreadyLocked, errors.LockError) as e:
             raise IntermittentLockError() from e
 
 
+def get_seed_path(git_url: str) -> Path:
+    """Return path of a project's mirror in the seeds cache."""
+    parsed_git_url = GitURL.parse(normalize_git_url(git_url))
+    return CACHE_SEEDS_PATH / (parsed_git_url.hostname or "") / parsed_git_url.path.strip("/")
+
+
 def git_url_with_auth(project: Project, user: User):
     """Format url with auth."""
     git_url = urlparse(normalize_git_url(project.git_url))
@@ -15,47 +15,57 @@
 # limitations under the License.
 """Cleanup jobs."""
 import shutil
+from datetime import datetime
 
-from renku.ui.service.cache import ServiceCache
-from renku.ui.service.cache.models.job import USER_JOB_STATE_ENQUEUED, USER_JOB_STATE_IN_PROGRESS
+from renku.ui.service.cache.models.file import CHUNKS_EXPIRY, FILES_EXPIRY, File, FileChunk, get_files_ttl
 from renku.ui.service.logger import worker_log
 
 
 def cache_files_cleanup():
-    """Cache files a cleanup job."""
-    cache = ServiceCache()
+    """Cache files a cleanup job.
+
+    Only files and chunks that are due according to their expiry indexes are loaded; files that are locked by a job
+    are checked again after another time to live.
+    """
     worker_log.debug("executing cache files cleanup")
 
-    for user, files in cache.user_files():
-        jobs = [
-            job for job in cache.get_jobs(user) if job.state in [USER_JOB_STATE_ENQUEUED, USER_JOB_STATE_IN_PROGRESS]
-        ]
-
-        for file in files:
-            if file.is_locked(jobs):
-                continue
-
-            if file.exists() and file.ttl_expired():
-                worker_log.debug(f"purging file {file.file_id}:{file.file_name}")
-                file.purge()
-            elif not file.exists():
-                file.delete()
-
-    for user, chunks in cache.user_chunks():
-        jobs = [
-            job for job in cache.get_jobs(user) if job.state in [USER_JOB_STATE_ENQUEUED, USER_JOB_STATE_IN_PROGRESS]
-        ]
-
-        chunk_folders = set()
-
-        for chunk in chunks:
-            if chunk.exists() and chunk.ttl_expired():
-                worker_log.debug(f"purging chunk {chunk.chunk_file_id}:{chunk.file_name}")
-                chunk.purge()
-                chunk_folders.add(chunk.abs_path.parent)
-            elif not chunk.exists():
-                chunk.delete()
-                chunk_folders.add(chunk.abs_path.parent)
-
-        for chunk_folder in chunk_folders:
-            shutil.rmtree(chunk_folder, ignore_errors=True)
+    FILES_EXPIRY.reindex(lambda: ((f.file_id, f.created_at) for f in File.all()))
+    CHUNKS_EXPIRY.reindex(lambda: ((c.chunk_file_id, c.created_at) for c in FileChunk.all()))
+    ttl = get_files_ttl()
+
+    for file_id in FILES_EXPIRY.expired(ttl=ttl):
+        try:
+            file = File.load(file_id)
+        except KeyError:
+            continue
+
+        if file.is_locked():
+            FILES_EXPIRY.add(file.file_id, datetime.utcnow())
+        elif file.exists() and file.ttl_expired():
+            worker_log.debug(f"purging file {file.file_id}:{file.file_name}")
+            file.purge()
+        elif not file.exists():
+            file.delete()
+        else:
+            FILES_EXPIRY.add(file.file_id, file.created_at)
+
+    chunk_folders = set()
+
+    for chunk_file_id in CHUNKS_EXPIRY.expired(ttl=ttl):
+        try:
+            chunk = FileChunk.load(chunk_file_id)
+        except KeyError:
+            continue
+
+        if chunk.exists() and chunk.ttl_expired():
+            worker_log.debug(f"purging chunk {chunk.chunk_file_id}:{chunk.file_name}")
+            chunk.purge()
+            chunk_folders.add(chunk.abs_path.parent)
+        elif not chunk.exists():
+            chunk.delete()
+            chunk_folders.add(chunk.abs_path.parent)
+        else:
+            CHUNKS_EXPIRY.add(chunk.chunk_file_id, chunk.created_at)
+
+    for chunk_folder in chunk_folders:
+        shutil.rmtree(chunk_folder, ignore_errors=True)
@@ -16,6 +16,7 @@
 """Dataset jobs."""
 import os
 import urllib
+from typing import Dict
 
 from urllib3.exceptions import HTTPError
 
@@ -25,6 +26,11 @@ from renku.core.util.contexts import renku_project_context
 from renku.core.util.git import push_changes
 from renku.domain_model.git import GitURL
 from renku.infrastructure.repository import Repository
+from renku.ui.service.cache.models.job import (
+    USER_JOB_STATE_COMPLETED,
+    USER_JOB_STATE_FAILED,
+    USER_JOB_STATE_IN_PROGRESS,
+)
 from renku.ui.service.logger import worker_log
 from renku.ui.service.utils.callback import ServiceCallback
 from renku.ui.service.views.decorators import requires_cache
@@ -99,23 +105,44 @@ def _is_safe_to_pass_gitlab_token(project_git_url, dataset_uri):
 
 @requires_cache
 def dataset_add_remote_file(cache, user, user_job_id, project_id, create_dataset, commit_message, slug, url):
-    """Add a remote file to a specified dataset."""
+    """Add remote files to a specified dataset.
+
+    All files that can be retrieved are added with a single commit and push; the state of each file is tracked in
+    job's ``files`` extras and errors of files that failed are stored in job's ``file_errors`` extras.
+    """
     user = cache.ensure_user(user)
     worker_log.debug(f"executing dataset add remote file job for {user.user_id}:{user.fullname}")
 
     user_job = cache.get_job(user, user_job_id)
     user_job.in_progress()
 
+    urls = url if isinstance(url, list) else [url]
+    files_state = {u: USER_JOB_STATE_IN_PROGRESS for u in urls}
+    failed_urls: Dict[str, str] = {}
+
+    def update_files_state():
+        for failed_url in failed_urls:
+            files_state[failed_url] = USER_JOB_STATE_FAILED
+
+        user_job.update_extras("files", files_state)
+        if failed_urls:
+            user_job.update_extras("file_errors", failed_urls)
+
     try:
+        update_files_state()
+        user_job.save_extras()
+
         worker_log.debug(f"checking metadata for project {project_id}")
         project = cache.get_project(user, project_id)
 
         with renku_project_context(project.abs_path):
-            urls = url if isinstance(url, list) else [url]
-
             worker_log.debug(f"adding files {urls} to dataset {slug}")
             command = add_to_dataset_command().with_commit_message(commit_message).build()
-            result = command.execute(dataset_slug=slug, urls=urls, create=create_dataset)
+            result = command.execute(dataset_slug=slug, urls=list(urls), create=create_dataset, failed_urls=failed_urls)
+
+            if len(failed_urls) == len(urls):
+                errors_message = "\n".join(f"{u}: {e}" for u, e in failed_urls.items())
+                raise errors.OperationError(f"Cannot add any of the files:\n{errors_message}")
             if result.error:
                 raise result.error
 
@@ -123,9 +150,14 @@ def dataset_add_remote_file(cache, user, user_job_id, project_id, create_dataset
             remote_branch = push_changes(Repository(project.abs_path), remote="origin")
             user_job.update_extras("remote_branch", remote_branch)
 
+            files_state.update({u: USER_JOB_STATE_COMPLETED for u in urls if u not in failed_urls})
+            update_files_state()
+
             user_job.complete()
             worker_log.debug("job completed")
     except (HTTPError, BaseException, errors.GitCommandError, errors.RenkuException) as exp:
+        files_state.update({u: USER_JOB_STATE_FAILED for u, s in files_state.items() if s != USER_JOB_STATE_COMPLETED})
+        update_files_state()
         user_job.fail_job(str(exp))
 
         # Reraise exception, so we see trace in job metadata
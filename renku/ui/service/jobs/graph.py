@@ -0,0 +1,110 @@
+# Copyright Swiss Data Science Center (SDSC). A partnership between
+# École Polytechnique Fédérale de Lausanne (EPFL) and
+# Eidgenössische Technische Hochschule Zürich (ETHZ).
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+"""Graph export jobs."""
+import multiprocessing
+import time
+from concurrent.futures import ProcessPoolExecutor, as_completed
+from typing import Any, Dict, List
+
+from renku.ui.service.cache.models.job import USER_JOB_STATE_COMPLETED, USER_JOB_STATE_ENQUEUED, USER_JOB_STATE_FAILED
+from renku.ui.service.config import GRAPH_EXPORT_BATCH_WORKERS
+from renku.ui.service.logger import worker_log
+from renku.ui.service.views.decorators import requires_cache
+
+
+@requires_cache
+def graph_export_batch(cache, user_data, user_job_id, projects, callback_url, format="json-ld"):
+    """Export graphs of many projects in parallel processes.
+
+    Each project is exported like in the ``graph.export`` endpoint, using the repository cache. Graphs are sent to the
+    callback URL as soon as they are exported; the service doesn't store them. The state, duration and error of each
+    project are tracked in job's ``projects`` extras.
+    """
+    user = cache.ensure_user(user_data)
+    worker_log.debug(f"executing graph export batch job for {user.user_id}:{user.fullname}")
+
+    user_job = cache.get_job(user, user_job_id)
+    user_job.in_progress()
+
+    projects_state: List[Dict[str, Any]] = [
+        {"git_url": p["git_url"], "branch": p.get("branch"), "state": USER_JOB_STATE_ENQUEUED} for p in projects
+    ]
+    user_job.update_extras("projects", projects_state)
+    user_job.save_extras()
+
+    # NOTE: Forked processes inherit the service configuration, e.g. the cache directory
+    executor = ProcessPoolExecutor(
+        max_workers=max(1, min(GRAPH_EXPORT_BATCH_WORKERS, len(projects))),
+        mp_context=multiprocessing.get_context("fork"),
+    )
+
+    try:
+        with executor:
+            futures = {
+                executor.submit(_export_project, user_data, project, format, callback_url): index
+                for index, project in enumerate(projects)
+            }
+
+            for future in as_completed(futures):
+                index = futures[future]
+                try:
+                    projects_state[index].update(future.result())
+                except Exception as e:
+                    # NOTE: A worker process died
+                    projects_state[index].update({"state": USER_JOB_STATE_FAILED, "error": str(e)})
+
+                user_job.save_extras()
+
+        failed = [p["git_url"] for p in projects_state if p["state"] == USER_JOB_STATE_FAILED]
+        if failed:
+            worker_log.warning(f"graph export failed for {len(failed)} of {len(projects)} projects: {failed}")
+
+        user_job.complete()
+        worker_log.debug("job completed")
+    except BaseException as exp:
+        user_job.fail_job(str(exp))
+
+        # Reraise exception, so we see trace in job metadata
+        # and in metrics as failed job.
+        raise exp
+
+
+def _export_project(
+    user_data: Dict[str, Any], project: Dict[str, Any], format: str, callback_url: str
+) -> Dict[str, Any]:
+    """Export the graph of a project in a worker process and return its state in the batch job."""
+    from renku.ui.service.cache import cache
+    from renku.ui.service.controllers.graph_export import GraphExportCtrl
+
+    started = time.monotonic()
+    request_data = {
+        "git_url": project["git_url"],
+        "branch": project.get("branch"),
+        "revision": project.get("revision"),
+        "format": format,
+        "callback_url": callback_url,
+    }
+
+    try:
+        GraphExportCtrl(cache, user_data, request_data).execute_op()
+        result: Dict[str, Any] = {"state": USER_JOB_STATE_COMPLETED}
+    except Exception as e:
+        worker_log.warning(f"Cannot export graph of {project['git_url']}", exc_info=e)
+        result = {"state": USER_JOB_STATE_FAILED, "error": str(e)}
+
+    result["duration"] = round(time.monotonic() - started, 3)
+
+    return result
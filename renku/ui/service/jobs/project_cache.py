@@ -0,0 +1,112 @@
+# Copyright Swiss Data Science Center (SDSC). A partnership between
+# École Polytechnique Fédérale de Lausanne (EPFL) and
+# Eidgenössische Technische Hochschule Zürich (ETHZ).
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+"""Project cache refresh and warm-up jobs."""
+from datetime import datetime, timedelta
+
+import portalocker
+
+from renku.core import errors
+from renku.ui.service.cache.config import REDIS_NAMESPACE
+from renku.ui.service.cache.models.project import PROJECTS_EXPIRY, Project
+from renku.ui.service.config import (
+    PROJECT_REFRESH_ACCESS_WINDOW,
+    PROJECT_REFRESH_INTERVAL,
+    PROJECT_REFRESH_MIN_FETCH_AGE,
+    PROJECT_WARMUP_LIST,
+)
+from renku.ui.service.jobs.contexts import enqueue_retry
+from renku.ui.service.jobs.queues import CLEANUP_QUEUE_PROJECTS
+from renku.ui.service.logger import worker_log
+
+PROJECT_REFRESH_SCHEDULED_KEY = f"{REDIS_NAMESPACE}.cache.projects.refresh.scheduled"
+
+
+def cache_projects_refresh():
+    """Fetch recently accessed projects that weren't fetched for a while and schedule the next refresh.
+
+    Recently accessed projects are taken from the projects' expiry index, which is scored by access time.
+    """
+    from renku.ui.service.gateways.repository_cache import LocalRepositoryCache
+
+    repository_cache = LocalRepositoryCache()
+
+    try:
+        accessed_since = datetime.utcnow() - timedelta(seconds=PROJECT_REFRESH_ACCESS_WINDOW)
+        for project in Project.load_many(PROJECTS_EXPIRY.used_since(accessed_since)):
+            if not project.is_refresh_due(
+                min_fetch_age=PROJECT_REFRESH_MIN_FETCH_AGE, access_window=PROJECT_REFRESH_ACCESS_WINDOW
+            ):
+                continue
+
+            try:
+                if repository_cache.refresh(project, blocking=False, min_fetch_age=PROJECT_REFRESH_MIN_FETCH_AGE):
+                    worker_log.debug(f"refreshed project {project.project_id}:{project.name}")
+            except (portalocker.LockException, portalocker.AlreadyLocked, errors.LockError):
+                # NOTE: The project is being used; it's refreshed in the next run or by a request
+                continue
+            except Exception as e:
+                worker_log.warning(f"Cannot refresh project {project.project_id}:{project.name}", exc_info=e)
+
+        for git_url in PROJECT_WARMUP_LIST:
+            _warm_up(repository_cache, git_url)
+    finally:
+        schedule_projects_refresh(delay=PROJECT_REFRESH_INTERVAL, force=True)
+
+
+def cache_projects_warmup():
+    """Mirror projects of the warm-up list into the seeds cache."""
+    from renku.ui.service.gateways.repository_cache import LocalRepositoryCache
+
+    repository_cache = LocalRepositoryCache()
+
+    for git_url in PROJECT_WARMUP_LIST:
+        _warm_up(repository_cache, git_url)
+
+
+def schedule_projects_refresh(delay: int = 0, force: bool = False):
+    """Schedule the background refresh of cached projects unless it's already scheduled.
+
+    Args:
+        delay(int): Seconds to wait before running the refresh (Default value = 0).
+        force(bool): Whether to schedule the refresh even if one is already scheduled; used by the refresh job to
+            schedule its next run (Default value = False).
+    """
+    with enqueue_retry(CLEANUP_QUEUE_PROJECTS) as queue:
+        # NOTE: The key outlives the scheduled run, so only a dead refresh chain is restarted
+        expiry = max(3 * PROJECT_REFRESH_INTERVAL, delay + 60)
+        if not queue.connection.set(PROJECT_REFRESH_SCHEDULED_KEY, 1, ex=expiry, nx=not force):
+            return
+
+        queue.enqueue_in(timedelta(seconds=delay), cache_projects_refresh)
+
+
+def schedule_project_cache_jobs():
+    """Schedule project cache warm-up and refresh jobs when a worker starts."""
+    if PROJECT_WARMUP_LIST:
+        with enqueue_retry(CLEANUP_QUEUE_PROJECTS) as queue:
+            queue.enqueue(cache_projects_warmup)
+
+    schedule_projects_refresh(delay=PROJECT_REFRESH_INTERVAL)
+
+
+def _warm_up(repository_cache, git_url: str):
+    """Warm up a project and log errors."""
+    try:
+        repository_cache.warm_up(git_url)
+    except (portalocker.LockException, portalocker.AlreadyLocked):
+        pass
+    except Exception as e:
+        worker_log.warning(f"Cannot warm up project {git_url}", exc_info=e)
@@ -16,7 +16,13 @@
 """Renku graph serializers."""
 from marshmallow import Schema, fields, validate
 
-from renku.ui.service.serializers.common import AsyncSchema, GitCommitSHA, MigrateSchema, RemoteRepositorySchema
+from renku.ui.service.serializers.common import (
+    AsyncSchema,
+    DelayedResponseRPC,
+    GitCommitSHA,
+    MigrateSchema,
+    RemoteRepositorySchema,
+)
 from renku.ui.service.serializers.rpc import JsonRPCResponse
 
 
@@ -25,11 +31,36 @@ class GraphExportRequest(AsyncSchema, RemoteRepositorySchema, MigrateSchema, Git
 
     callback_url = fields.URL()
     revision = fields.String(load_default="HEAD", allow_none=True)
+    since = fields.String(
+        load_default=None,
+        allow_none=True,
+        metadata={"description": "Only export changes made after this commit. Overrides 'revision'."},
+    )
     format = fields.String(
         load_default="json-ld", validate=validate.OneOf(["json-ld", "nt", "rdf", "dot", "dot-landscape"])
     )
 
 
+class GraphExportBatchProject(RemoteRepositorySchema):
+    """Schema for a project of a batch graph export."""
+
+    revision = fields.String(load_default="HEAD", allow_none=True)
+
+
+class GraphExportBatchRequest(Schema):
+    """Request schema for batch graph export."""
+
+    projects = fields.List(fields.Nested(GraphExportBatchProject), required=True, validate=validate.Length(min=1))
+    callback_url = fields.URL(required=True, metadata={"description": "URL that each graph is sent to."})
+    format = fields.String(
+        load_default="json-ld", validate=validate.OneOf(["json-ld", "nt", "rdf", "dot", "dot-landscape"])
+    )
+
+
+class GraphExportBatchResponseRPC(DelayedResponseRPC):
+    """RPC response schema for batch graph export."""
+
+
 class GraphExportResponse(Schema):
     """Response schema for dataset list view."""
 
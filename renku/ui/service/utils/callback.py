@@ -15,8 +15,47 @@
 # limitations under the License.
 """Communicator class for service communication."""
 
+import time
+from typing import Dict, Optional
+
 from renku.core.util.communication import CommunicationCallback
 
+PROGRESS_UPDATE_INTERVAL = 1.0
+"""Minimum number of seconds between two progress reports of a job."""
+
+PROGRESS_UPDATE_PERCENTAGE = 10.0
+"""Report progress of a job before ``PROGRESS_UPDATE_INTERVAL`` if it advanced at least this much."""
+
+
+class _Progress:
+    """Accumulated state of a progress tracker."""
+
+    def __init__(self, total: Optional[int]):
+        self.total = total
+        self.size = 0
+        self.started_at = time.monotonic()
+        self.reported_at = self.started_at
+        self.reported_size = 0
+
+    def should_report(self) -> bool:
+        """Whether enough time or progress passed since the last report."""
+        if time.monotonic() - self.reported_at >= PROGRESS_UPDATE_INTERVAL:
+            return True
+
+        return bool(self.total) and (self.size - self.reported_size) * 100 / self.total >= PROGRESS_UPDATE_PERCENTAGE
+
+    def report(self) -> Dict[str, Optional[float]]:
+        """Return progress fields for a job and mark them as reported."""
+        now = time.monotonic()
+        elapsed = now - self.started_at
+        throughput = self.size / elapsed if elapsed > 0 else None
+        eta = (self.total - self.size) / throughput if self.total and throughput else None
+
+        self.reported_at = now
+        self.reported_size = self.size
+
+        return {"progress_size": self.size, "throughput": throughput, "eta": eta}
+
 
 class ServiceCallback(CommunicationCallback):
     """CommunicationCallback implementation for service messages."""
@@ -29,6 +68,7 @@ class ServiceCallback(CommunicationCallback):
         self.warnings = []
         self.errors = []
         self._user_job = user_job
+        self._progresses: Dict[str, _Progress] = {}
 
     def echo(self, msg, end="\n"):
         """Write a message."""
@@ -52,16 +92,40 @@ class ServiceCallback(CommunicationCallback):
 
     def start_progress(self, name, total, **kwargs):
         """Start job tracking."""
+        self._progresses[name] = _Progress(total=total)
+        # NOTE: Keep extras that aren't about progress (e.g. state of each file of a job)
         self._user_job.extras = {
+            **(self._user_job.extras or {}),
             "description": name,
             "total_size": total,
+            "progress_size": 0,
         }
 
     def update_progress(self, name, amount):
-        """Update job status."""
-        self._user_job.extras["progress_size"] = amount
-        self._user_job.save()
+        """Update job status.
+
+        Updates are accumulated and written only every ``PROGRESS_UPDATE_INTERVAL`` seconds or when progress advanced
+        by ``PROGRESS_UPDATE_PERCENTAGE`` since callers report progress in small increments (e.g. for each downloaded
+        chunk).
+        """
+        progress = self._progresses.get(name)
+        if progress is None:
+            progress = self._progresses[name] = _Progress(total=None)
+
+        progress.size += amount
+
+        if progress.should_report():
+            self._user_job.extras.update(progress.report())
+            self._user_job.save_extras()
 
     def finalize_progress(self, name):
-        """End job tracking."""
-        self._user_job.complete()
+        """End job tracking.
+
+        NOTE: This only stores the final progress; a job may track progress of several operations (e.g. one for each
+        downloaded file) and it's up to the job to mark itself as completed.
+        """
+        progress = self._progresses.pop(name, None)
+        if progress is not None:
+            self._user_job.extras.update(progress.report())
+            self._user_job.extras["eta"] = 0
+            self._user_job.save_extras()
@@ -25,6 +25,7 @@ from renku.ui.service.controllers.cache_migrate_project import MigrateProjectCtr
 from renku.ui.service.controllers.cache_migrations_check import MigrationsCheckCtrl
 from renku.ui.service.gateways.repository_cache import LocalRepositoryCache
 from renku.ui.service.jobs.cleanup import cache_files_cleanup
+from renku.ui.service.jobs.project_cache import schedule_projects_refresh
 from renku.ui.service.views.api_versions import (
     ALL_VERSIONS,
     VERSIONS_FROM_V1_1,
@@ -212,6 +213,8 @@ def cache_cleanup(user_data, cache):
     """
     LocalRepositoryCache().evict_expired()
     cache_files_cleanup()
+    # NOTE: Restart the background refresh of projects in case its chain of scheduled jobs was interrupted
+    schedule_projects_refresh()
     return jsonify({"result": "ok"})
 
 
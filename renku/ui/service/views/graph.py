@@ -18,8 +18,9 @@ from flask import request
 
 from renku.ui.service.config import SERVICE_PREFIX
 from renku.ui.service.controllers.graph_export import GraphExportCtrl
-from renku.ui.service.views.api_versions import ALL_VERSIONS, VersionedBlueprint
-from renku.ui.service.views.decorators import accepts_json, optional_identity, requires_cache
+from renku.ui.service.controllers.graph_export_batch import GraphExportBatchCtrl
+from renku.ui.service.views.api_versions import ALL_VERSIONS, VERSIONS_FROM_V2_2, VersionedBlueprint
+from renku.ui.service.views.decorators import accepts_json, optional_identity, requires_cache, requires_identity
 from renku.ui.service.views.error_handlers import handle_common_except, handle_graph_errors
 
 GRAPH_BLUEPRINT_TAG = "graph"
@@ -53,3 +54,33 @@ def graph_build_view(user_data, cache):
         - graph
     """
     return GraphExportCtrl(cache, user_data, dict(request.json)).to_response()  # type: ignore
+
+
+@graph_blueprint.route(
+    "/graph.export_batch", methods=["POST"], provide_automatic_options=False, versions=VERSIONS_FROM_V2_2
+)
+@handle_common_except
+@accepts_json
+@requires_cache
+@requires_identity
+def graph_export_batch_view(user_data, cache):
+    """
+    Batch graph export view.
+
+    ---
+    post:
+      description: Export graphs of many projects in a background job.
+      requestBody:
+        content:
+          application/json:
+            schema: GraphExportBatchRequest
+      responses:
+        200:
+          description: Details of the dispatched batch graph export job.
+          content:
+            application/json:
+              schema: GraphExportBatchResponseRPC
+      tags:
+        - graph
+    """
+    return GraphExportBatchCtrl(cache, user_data, dict(request.json)).to_response()  # type: ignore
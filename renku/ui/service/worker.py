@@ -24,7 +24,8 @@ from sentry_sdk.integrations.rq import RqIntegration
 from renku.core.errors import ConfigurationError, UsageError
 from renku.ui.service.cache.config import REDIS_NAMESPACE
 from renku.ui.service.config import SENTRY_ENABLED, SENTRY_SAMPLERATE
-from renku.ui.service.jobs.queues import QUEUES, WorkerQueues
+from renku.ui.service.jobs.project_cache import schedule_project_cache_jobs
+from renku.ui.service.jobs.queues import CLEANUP_QUEUE_PROJECTS, QUEUES, WorkerQueues
 from renku.ui.service.logger import DEPLOYMENT_LOG_LEVEL, worker_log
 
 if SENTRY_ENABLED:
@@ -69,8 +70,12 @@ def start_worker(queue_list):
     worker_log.info(f"working on queues: {q}")
 
     with worker(q) as rq_worker:
+        if CLEANUP_QUEUE_PROJECTS in q:
+            schedule_project_cache_jobs()
+
         worker_log.info("running worker")
-        rq_worker.work(logging_level=DEPLOYMENT_LOG_LEVEL)
+        # NOTE: The scheduler runs jobs that are enqueued with a delay, e.g. the background refresh of projects
+        rq_worker.work(logging_level=DEPLOYMENT_LOG_LEVEL, with_scheduler=True)
 
 
 if __name__ == "__main__":
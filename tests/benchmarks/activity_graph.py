@@ -0,0 +1,74 @@
+# Copyright Swiss Data Science Center (SDSC). A partnership between
+# École Polytechnique Fédérale de Lausanne (EPFL) and
+# Eidgenössische Technische Hochschule Zürich (ETHZ).
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+"""Benchmark ``sort_activities`` on a synthetic parameter-sweep history.
+
+Every activity re-generates one of a few shared outputs, so all generators of a shared output must be ordered.
+
+Run it from the repository's root directory::
+
+    python -m tests.benchmarks.activity_graph --activities 50000
+"""
+
+import argparse
+import time
+from datetime import datetime, timedelta
+
+from renku.core.workflow.activity import sort_activities
+from renku.domain_model.workflow.plan import Plan
+from tests.utils import create_dummy_activity
+
+
+def create_activities(n_activities: int, n_plans: int, n_shared_outputs: int):
+    """Create activities where each one re-generates one of ``n_shared_outputs`` outputs."""
+    start = datetime(2022, 1, 1).astimezone()
+    plans = [Plan(id=Plan.generate_id(), name=f"plan-{i}", command="command") for i in range(n_plans)]
+    activities = []
+
+    for i in range(n_activities):
+        timestamp = start + timedelta(seconds=i)
+        activities.append(
+            create_dummy_activity(
+                plan=plans[i % n_plans],
+                usages=[f"input-{i % n_shared_outputs}"],
+                generations=[f"output-{i % n_shared_outputs}", f"log-{i}"],
+                started_at_time=timestamp,
+                ended_at_time=timestamp,
+            )
+        )
+
+    return activities
+
+
+def main():
+    """Run the benchmark."""
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--activities", type=int, default=2000, help="Number of activities.")
+    parser.add_argument("--plans", type=int, default=50, help="Number of plans.")
+    parser.add_argument("--shared-outputs", type=int, default=10, help="Number of outputs that activities share.")
+    args = parser.parse_args()
+
+    activities = create_activities(args.activities, args.plans, args.shared_outputs)
+
+    start = time.perf_counter()
+    sorted_activities = sort_activities(activities)
+    duration = time.perf_counter() - start
+
+    removed = len(activities) - len(sorted_activities)
+    print(f"Sorted {len(activities)} activities in {duration:.2f}s; {removed} overridden activities were removed")
+
+
+if __name__ == "__main__":
+    main()
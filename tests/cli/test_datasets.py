@@ -2693,7 +2693,7 @@ def test_dataset_update_web_file(runner, project, mocker):
     mocker.patch("renku.core.util.requests.get_redirect_url", lambda _: uri)
     mocker.patch(
         "renku.core.util.requests.download_file",
-        lambda base_directory, url, filename, extract: (cache, [Path(new_file)]),
+        lambda base_directory, url, filename, extract, **_: (cache, [Path(new_file)]),
     )
 
     result = runner.invoke(cli, ["dataset", "create", "local-data"])
@@ -2733,7 +2733,7 @@ def test_dataset_update_web_file(runner, project, mocker):
     assert dataset.files[0].entity.checksum == "1bc6411450b62581e5cea1174c15269c249dd4ea"
 
     # check deletion doesn't happen without --delete
-    def _fake_raise(base_directory, url, filename, extract):
+    def _fake_raise(base_directory, url, filename, extract, **_):
         raise errors.RequestError
 
     mocker.patch("renku.core.util.requests.download_file", _fake_raise)
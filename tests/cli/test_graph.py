@@ -138,3 +138,22 @@ def test_graph_export_dataset_mutability(runner, project_with_datasets, with_inj
 
     assert 1 == result.exit_code
     assert "Both prov:wasDerivedFrom and schema:sameAs are set." in result.output
+
+
+def test_graph_compact_journal(runner, project):
+    """Test compacting the journal of metadata changes."""
+    assert 0 == runner.invoke(cli, ["dataset", "create", "my-data"]).exit_code
+    since = project.repository.head.commit.hexsha
+    assert 0 == runner.invoke(cli, ["dataset", "create", "other-data"]).exit_code
+
+    result = runner.invoke(cli, ["graph", "compact-journal"])
+
+    assert 0 == result.exit_code, format_result_exception(result)
+    assert not list(project.path.glob(".renku/metadata-journal/*.json"))
+    assert not project.repository.is_dirty()
+
+    result = runner.invoke(cli, ["graph", "export", "--since", since])
+
+    assert 0 == result.exit_code, format_result_exception(result)
+    assert "other-data" in result.output
+    assert "my-data" not in result.output
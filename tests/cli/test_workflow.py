@@ -1304,6 +1304,26 @@ def test_workflow_execute_docker_toil(runner, project, run_shell):
     # assert "executing with Docker" in Path(log_file).read_text()
 
 
+def test_workflow_execute_toil_in_place(runner, project, run_shell):
+    """Test workflow execute with the toil provider running jobs in the project's working tree."""
+    write_and_commit_file(project.repository, "input", "first line\nsecond line")
+    output = project.path / "output"
+
+    run_shell("renku run --name run-1 -- tail -n 1 input > intermediate")
+    run_shell("renku run --name run-2 -- wc -l intermediate > output")
+    run_shell("renku workflow compose composite run-1 run-2")
+
+    write_and_commit_file(project.repository, "toil.yaml", "in_place: true")
+    (project.path / "intermediate").unlink()
+    output.unlink()
+
+    result = runner.invoke(cli, ["workflow", "execute", "-p", "toil", "-c", "toil.yaml", "composite"])
+
+    assert 0 == result.exit_code, format_result_exception(result)
+    assert "second line" == (project.path / "intermediate").read_text().strip()
+    assert "1 intermediate" == output.read_text().strip()
+
+
 def test_workflow_execute_docker_toil_stderr(runner, project, run_shell):
     """Test workflow execute using docker with the toil provider and stderr redirection."""
     write_and_commit_file(project.repository, "input", "first line\nsecond line")
@@ -208,3 +208,13 @@ def test_doctor_fix_activity_catalog(runner, project, with_injection):
 
     assert 0 == result.exit_code, format_result_exception(result)
     assert "Workflow metadata was rebuilt" in result.output
+
+
+def test_doctor_verbose_shows_check_durations(runner, project):
+    """Test renku doctor reports how long each check took with --verbose."""
+    result = runner.invoke(cli, ["doctor", "--verbose"])
+
+    assert 0 == result.exit_code, format_result_exception(result)
+    assert "Check durations:" in result.output
+    assert "check_missing_files" in result.output
+    assert "Everything seems to be ok." in result.output
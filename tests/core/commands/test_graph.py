@@ -15,7 +15,9 @@
 # limitations under the License.
 """Graph building tests."""
 
+import json
 from datetime import datetime
+from pathlib import Path
 from unittest.mock import MagicMock
 
 import pytest
@@ -24,7 +26,13 @@ from deepdiff import DeepDiff
 from rdflib import Graph
 from zc.relation.catalog import Catalog
 
-from renku.command.graph import get_graph_for_all_objects, get_graph_for_revision, update_nested_node_host
+from renku.command.graph import (
+    TOMBSTONE_TYPE,
+    get_graph_for_all_objects,
+    get_graph_for_changes_since,
+    get_graph_for_revision,
+    update_nested_node_host,
+)
 from renku.command.view_model.graph import GraphViewModel
 from renku.core.interface.activity_gateway import IActivityGateway
 from renku.core.interface.database_gateway import IDatabaseGateway
@@ -34,11 +42,16 @@ from renku.core.interface.project_gateway import IProjectGateway
 from renku.domain_model.dataset import Dataset, DatasetFile, DatasetTag, Url
 from renku.domain_model.entity import Entity
 from renku.domain_model.project import Project
-from renku.domain_model.provenance.activity import Activity, Association
+from renku.domain_model.project_context import project_context
+from renku.domain_model.provenance.activity import Activity, Association, Generation, Usage
 from renku.domain_model.provenance.agent import Person
+from renku.domain_model.provenance.parameter import ParameterValue
 from renku.domain_model.workflow.composite_plan import CompositePlan
 from renku.domain_model.workflow.plan import Plan
 from renku.infrastructure.database import Index
+from renku.infrastructure.gateway.activity_gateway import ActivityGateway
+from renku.infrastructure.gateway.database_gateway import DatabaseGateway
+from tests.utils import create_dummy_activity, create_dummy_plan
 
 
 @pytest.fixture()
@@ -251,6 +264,87 @@ def test_get_graph_for_revision(input_objects, expected_output):
     assert not DeepDiff(result, expected_output, ignore_order=True, exclude_regex_paths=r"root.*\['@id'\]")
 
 
+def test_get_graph_for_changes_since(project_with_injection):
+    """Test exporting changes since a commit from the change journal, including tombstones for removed entities."""
+    repository = project_with_injection.repository
+    activity_gateway = ActivityGateway()
+
+    removed = create_dummy_activity("removed-plan", generations=["removed"])
+    unchanged = create_dummy_activity("unchanged-plan", generations=["unchanged"])
+    activity_gateway.add(removed)
+    activity_gateway.add(unchanged)
+    project_context.database.commit()
+    repository.add(all=True)
+    watermark = repository.commit("add activities").hexsha
+
+    added = create_dummy_activity("added-plan", generations=["added"])
+    activity_gateway.add(added)
+    activity_gateway.remove(removed, keep_reference=False, force=True)
+    project_context.database.commit()
+    repository.add(all=True)
+    repository.commit("change activities")
+
+    graph = get_graph_for_changes_since(revision=watermark)
+    ids = {node["@id"] for node in graph}
+
+    assert added.id in ids
+    assert added.association.plan.id in ids
+    assert unchanged.id not in ids
+    assert {"@id": removed.id, "@type": [TOMBSTONE_TYPE]} in graph
+    assert not [node for node in get_graph_for_changes_since(revision="HEAD") if node["@id"] == added.id]
+
+
+def test_get_changes_since_orders_journal_by_commit(project_with_injection):
+    """Test journal files are applied in commit order, regardless of the clock that named them."""
+    repository = project_with_injection.repository
+    journal_path = project_context.database_journal_path
+    activity_gateway = ActivityGateway()
+    watermark = repository.head.commit.hexsha
+
+    activity = create_dummy_activity("plan", generations=["output"])
+    activity_gateway.add(activity)
+    project_context.database.commit()
+    repository.add(all=True)
+    repository.commit("add activity")
+
+    journal_files = set(journal_path.glob("*.json"))
+    activity_gateway.remove(activity, keep_reference=False, force=True)
+    project_context.database.commit()
+    # NOTE: Simulate a clock that is behind the one that wrote the previous journal file
+    (removal_file,) = set(journal_path.glob("*.json")) - journal_files
+    removal_file.rename(journal_path / f"{0:020d}-{removal_file.name.split('-', 1)[1]}")
+    repository.add(all=True)
+    repository.commit("remove activity")
+
+    modified, removed = DatabaseGateway().get_changes_since(revision=watermark)
+
+    assert activity.id in removed
+    assert activity not in modified
+
+
+def test_get_changes_since_compacted_journal(project_with_injection):
+    """Test changes since a commit before a journal compaction aren't read from the journal."""
+    repository = project_with_injection.repository
+    journal_path = project_context.database_journal_path
+    activity_gateway = ActivityGateway()
+    database_gateway = DatabaseGateway()
+    watermark = repository.head.commit.hexsha
+
+    activity_gateway.add(create_dummy_activity("plan", generations=["output"]))
+    project_context.database.commit()
+    repository.add(all=True)
+    repository.commit("add activity")
+
+    assert database_gateway.compact_journal() > 0
+    assert not list(journal_path.glob("*.json"))
+
+    repository.add(all=True)
+    repository.commit("compact journal")
+
+    assert database_gateway.get_changes_since(revision=watermark) is None
+    assert database_gateway.get_changes_since(revision="HEAD") == ([], [])
+
+
 def test_graph_export_full():
     """Test getting full graph."""
 
@@ -602,3 +696,107 @@ def test_graph_view_model():
     result = model.as_rdflib_graph()
     assert isinstance(result, Graph)
     assert len(result.all_nodes()) == 12
+
+
+def test_graph_export_golden_file():
+    """Test exported JSON-LD of a project's entities doesn't change."""
+    date = datetime.fromisoformat("2022-07-12T16:29:14+02:00")
+    creator = Person(email="john.doe@example.com", name="John Doe", affiliation="SDSC")
+
+    project = Project(
+        agent_version="2.0.0",
+        creator=creator,
+        date_created=date,
+        description="A project",
+        id="/projects/john.doe/my-project",
+        keywords=["golden", "file"],
+        name="my-project",
+        version="10",
+    )
+    dataset = Dataset(
+        creators=[creator],
+        dataset_files=[
+            DatasetFile(
+                date_added=date,
+                entity=Entity(
+                    checksum="1234567890", id="/entities/1234567890/data/my-dataset/file", path="data/my-dataset/file"
+                ),
+                id="/dataset-files/abcdefg123456789",
+                size=42,
+            )
+        ],
+        date_created=date,
+        date_modified=date,
+        description="A dataset",
+        id="/datasets/abcdefg12345",
+        identifier="abcdefg12345",
+        initial_identifier="abcdefg12345",
+        keywords=["data"],
+        name="My Dataset",
+        slug="my-dataset",
+    )
+    tag = DatasetTag(dataset_id=Url(url_id=dataset.id), date_created=date, id="/dataset-tags/v1", name="v1")
+
+    plan = create_dummy_plan(
+        "script",
+        command="python script.py",
+        date_created=date,
+        index=1,
+        inputs=["data/my-dataset/file"],
+        keywords=["workflow"],
+        outputs=["result.csv"],
+        parameters=[("n_iterations", 10, "--n=")],
+    )
+    plan.date_modified = date
+    composite_plan = CompositePlan(
+        date_created=date,
+        date_modified=date,
+        id="/plans/composite",
+        name="pipeline",
+        plans=[plan],
+        project_id=plan.project_id,
+    )
+    activity = create_dummy_activity(
+        plan,
+        ended_at_time=datetime.fromisoformat("2022-07-12T16:29:15+02:00"),
+        generations=[
+            Generation(
+                entity=Entity(checksum="abcdef", id="/entities/abcdef/result.csv", path="result.csv"),
+                id="/activities/1/generations/1",
+            )
+        ],
+        index=1,
+        started_at_time=date,
+        usages=[
+            Usage(
+                entity=Entity(
+                    checksum="1234567890", id="/entities/1234567890/data/my-dataset/file", path="data/my-dataset/file"
+                ),
+                id="/activities/1/usages/1",
+            )
+        ],
+    )
+    activity.parameters = [
+        ParameterValue(id="/activities/1/parameter-value/1", parameter_id=plan.parameters[0].id, value=20)
+    ]
+
+    project_gateway = MagicMock(spec=IProjectGateway)
+    project_gateway.get_project.return_value = project
+    dataset_gateway = MagicMock(spec=IDatasetGateway)
+    dataset_gateway.get_provenance_tails.return_value = [dataset]
+    dataset_gateway.get_all_tags.return_value = [tag]
+    activity_gateway = MagicMock(spec=IActivityGateway)
+    activity_gateway.get_all_activities.return_value = [activity]
+    activity_gateway.get_all_activity_collections.return_value = []
+    plan_gateway = MagicMock(spec=IPlanGateway)
+    plan_gateway.get_all_plans.return_value = [composite_plan, plan]
+
+    result = get_graph_for_all_objects(
+        project_gateway=project_gateway,
+        dataset_gateway=dataset_gateway,
+        activity_gateway=activity_gateway,
+        plan_gateway=plan_gateway,
+    )
+
+    golden_file = Path(__file__).parent / ".." / ".." / "data" / "graph-export.json"
+    assert golden_file.read_text() == json.dumps(result, indent=2) + "\n"
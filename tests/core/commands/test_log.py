@@ -76,7 +76,7 @@ def test_log_activities(mocker):
     )
 
     activity_gateway = mocker.MagicMock(spec=IActivityGateway)
-    activity_gateway.get_all_activities.return_value = [previous, intermediate, following]
+    activity_gateway.get_activities_by_date.return_value = iter([following, intermediate, previous])
     full_agents = [a.full_identity for a in agents]
     result = _log(
         activity_gateway=activity_gateway,
@@ -86,15 +86,15 @@ def test_log_activities(mocker):
     )
     assert 3 == len(result)
     assert all(log.type == LogType.ACTIVITY for log in result)
-    assert result[0].date == previous.ended_at_time
+    assert result[0].date == following.ended_at_time
     assert result[1].date == intermediate.ended_at_time
-    assert result[2].date == following.ended_at_time
+    assert result[2].date == previous.ended_at_time
     assert result[0].agents == full_agents
     assert result[1].agents == full_agents
     assert result[2].agents == full_agents
-    assert result[0].description == "touch A"
+    assert result[0].description == "cp B C"
     assert result[1].description == "cp A B"
-    assert result[2].description == "cp B C"
+    assert result[2].description == "touch A"
 
 
 def test_log_dataset_create_simple(mocker):
@@ -113,7 +113,7 @@ def test_log_dataset_create_simple(mocker):
     new_dataset.is_derivation.return_value = False
 
     dataset_gateway = mocker.MagicMock(spec=IDatasetGateway)
-    dataset_gateway.get_provenance_tails.return_value = [new_dataset]
+    dataset_gateway.get_datasets_by_date.return_value = iter([new_dataset])
 
     inject.configure(lambda binder: binder.bind(IDatasetGateway, dataset_gateway), bind_in_runtime=False)
 
@@ -169,7 +169,7 @@ def test_log_dataset_create_complex(mocker):
     new_dataset.is_derivation.return_value = False
 
     dataset_gateway = mocker.MagicMock(spec=IDatasetGateway)
-    dataset_gateway.get_provenance_tails.return_value = [new_dataset]
+    dataset_gateway.get_datasets_by_date.return_value = iter([new_dataset])
 
     inject.configure(lambda binder: binder.bind(IDatasetGateway, dataset_gateway), bind_in_runtime=False)
 
@@ -227,7 +227,7 @@ def test_log_dataset_add_create(mocker):
     new_dataset.is_derivation.return_value = False
 
     dataset_gateway = mocker.MagicMock(spec=IDatasetGateway)
-    dataset_gateway.get_provenance_tails.return_value = [new_dataset]
+    dataset_gateway.get_datasets_by_date.return_value = iter([new_dataset])
 
     inject.configure(lambda binder: binder.bind(IDatasetGateway, dataset_gateway), bind_in_runtime=False)
 
@@ -284,7 +284,7 @@ def test_log_dataset_import(mocker):
     new_dataset.is_derivation.return_value = False
 
     dataset_gateway = mocker.MagicMock(spec=IDatasetGateway)
-    dataset_gateway.get_provenance_tails.return_value = [new_dataset]
+    dataset_gateway.get_datasets_by_date.return_value = iter([new_dataset])
 
     inject.configure(lambda binder: binder.bind(IDatasetGateway, dataset_gateway), bind_in_runtime=False)
 
@@ -346,7 +346,7 @@ def test_log_dataset_deleted(mocker):
     new_dataset.is_derivation.return_value = True
 
     dataset_gateway = mocker.MagicMock(spec=IDatasetGateway)
-    dataset_gateway.get_provenance_tails.return_value = [new_dataset]
+    dataset_gateway.get_datasets_by_date.return_value = iter([new_dataset, old_dataset])
 
     def _mock_get_by_id(id):
         if id == "new":
@@ -424,7 +424,7 @@ def test_log_dataset_files_removed(mocker):
     new_dataset.is_derivation.return_value = True
 
     dataset_gateway = mocker.MagicMock(spec=IDatasetGateway)
-    dataset_gateway.get_provenance_tails.return_value = [new_dataset]
+    dataset_gateway.get_datasets_by_date.return_value = iter([new_dataset, old_dataset])
 
     def _mock_get_by_id(id):
         if id == "new":
@@ -506,7 +506,7 @@ def test_log_dataset_metadata_modified(mocker):
     new_dataset.is_derivation.return_value = True
 
     dataset_gateway = mocker.MagicMock(spec=IDatasetGateway)
-    dataset_gateway.get_provenance_tails.return_value = [new_dataset]
+    dataset_gateway.get_datasets_by_date.return_value = iter([new_dataset, old_dataset])
 
     def _mock_get_by_id(id):
         if id == "new":
@@ -554,3 +554,51 @@ def test_log_dataset_metadata_modified(mocker):
     assert not entry.details.migrated
     assert entry.details.modified
     assert not entry.details.deleted
+
+
+def test_log_limit(mocker):
+    """Test activities and datasets are merged from newest to oldest and only the most recent ones are returned."""
+    agent = SoftwareAgent(
+        name="renku 99.1.1", id="<https://github.com/swissdatasciencecenter/renku-python/tree/v0.16.1>"
+    )
+    plan = mocker.MagicMock()
+    plan.to_argv.return_value = ["touch", "A"]
+    plan.copy.return_value = plan
+
+    def create_activity(hours):
+        id = Activity.generate_id()
+        return Activity(
+            id=id,
+            started_at_time=datetime.utcnow() - timedelta(hours=hours, seconds=5),
+            ended_at_time=datetime.utcnow() - timedelta(hours=hours),
+            association=Association(id=Association.generate_id(id), plan=plan, agent=agent),
+            agents=[agent],
+        )
+
+    dataset = mocker.MagicMock()
+    dataset.id = "new"
+    dataset.slug = "ds"
+    dataset.name = None
+    dataset.description = None
+    dataset.derived_from = None
+    dataset.same_as = None
+    dataset.dataset_files = []
+    dataset.date_removed = None
+    dataset.date_modified = datetime.utcnow() - timedelta(hours=2)
+    dataset.is_derivation.return_value = False
+
+    activities = [create_activity(hours=1), create_activity(hours=3)]
+    activity_gateway = mocker.MagicMock(spec=IActivityGateway)
+    activity_gateway.get_activities_by_date.return_value = iter(activities)
+    dataset_gateway = mocker.MagicMock(spec=IDatasetGateway)
+    dataset_gateway.get_datasets_by_date.return_value = iter([dataset])
+
+    inject.configure(lambda binder: binder.bind(IDatasetGateway, dataset_gateway), bind_in_runtime=False)
+
+    try:
+        result = _log(activity_gateway=activity_gateway, dataset_gateway=dataset_gateway, limit=2)
+    finally:
+        remove_injector()
+
+    assert [LogType.ACTIVITY, LogType.DATASET] == [e.type for e in result]
+    assert activities[0].ended_at_time == result[0].date
@@ -91,3 +91,40 @@ def test_no_callback(capsys):
     command.build().execute()
 
     assert "Hello world!" not in capsys.readouterr().out
+
+
+def test_service_callback_throttles_progress(mocker):
+    """Test ServiceCallback coalesces progress updates before writing them to a job."""
+    now = 0.0
+    time = mocker.patch("renku.ui.service.utils.callback.time")
+    time.monotonic.side_effect = lambda: now
+    user_job = mocker.MagicMock()
+    user_job.extras = {"files": {"https://example.com/file": "IN_PROGRESS"}}
+    communicator = ServiceCallback(user_job=user_job)
+
+    communicator.start_progress("file", total=1000)
+    assert {"https://example.com/file": "IN_PROGRESS"} == user_job.extras["files"]
+    for _ in range(99):
+        communicator.update_progress("file", 1)
+
+    assert 0 == user_job.save_extras.call_count
+
+    communicator.update_progress("file", 1)
+
+    assert 1 == user_job.save_extras.call_count
+    assert 100 == user_job.extras["progress_size"]
+
+    now = 2.0
+    communicator.update_progress("file", 1)
+
+    assert 2 == user_job.save_extras.call_count
+    assert 101 == user_job.extras["progress_size"]
+    assert 50.5 == user_job.extras["throughput"]
+    assert (1000 - 101) / 50.5 == user_job.extras["eta"]
+
+    communicator.finalize_progress("file")
+
+    assert 0 == user_job.extras["eta"]
+    assert 3 == user_job.save_extras.call_count
+    # NOTE: Jobs mark themselves as completed since they may track progress of several operations
+    user_job.complete.assert_not_called()
@@ -19,7 +19,14 @@ import re
 
 import pytest
 
-from renku.core.lfs import get_lfs_migrate_filters, track_paths_in_storage
+from renku.core.lfs import (
+    _get_lfs_oids,
+    get_lfs_migrate_filters,
+    get_lfs_pointer,
+    get_lfs_pointer_size,
+    pull_paths_from_storage,
+    track_paths_in_storage,
+)
 from renku.domain_model.project_context import project_context
 
 
@@ -51,3 +58,48 @@ def test_renku_in_lfs_migrate_exclude_filter(project):
 
     assert ",.renku," in excludes[1]
     assert ",.renku/**," in excludes[1]
+
+
+def test_get_lfs_pointer_size(tmp_path):
+    """Test detecting LFS pointer files without calling git lfs."""
+    pointer = tmp_path / "pointer"
+    pointer.write_text(get_lfs_pointer(oid="a" * 64, size=4242))
+    regular = tmp_path / "regular"
+    regular.write_text("some content")
+    large = tmp_path / "large"
+    large.write_text(get_lfs_pointer(oid="a" * 64, size=4242) + "x" * 2048)
+
+    assert 4242 == get_lfs_pointer_size(pointer)
+    assert get_lfs_pointer_size(regular) is None
+    assert get_lfs_pointer_size(large) is None
+    assert get_lfs_pointer_size(tmp_path / "non-existing") is None
+
+
+def test_get_lfs_oids(project):
+    """Test getting LFS object ids of multiple pointer files at once."""
+    (project.path / "pointer 1").write_text(get_lfs_pointer(oid="1" * 64, size=42))
+    (project.path / "pointer-2").write_text(get_lfs_pointer(oid="2" * 64, size=42))
+    (project.path / "regular").write_text("some content")
+    project.repository.add("pointer 1", "pointer-2", "regular")
+    project.repository.commit("Add pointers", no_verify=True)
+
+    oids = _get_lfs_oids(project.repository, ["pointer 1", "regular", "missing", "pointer-2"])
+
+    assert {"pointer 1": "1" * 64, "regular": None, "missing": None, "pointer-2": "2" * 64} == oids
+
+
+def test_pull_only_lfs_pointers(project, with_injection, mocker):
+    """Test only LFS pointer files are pulled and only once per command."""
+    (project.path / "small").write_text(get_lfs_pointer(oid="1" * 64, size=10))
+    (project.path / "large").write_text(get_lfs_pointer(oid="2" * 64, size=1000))
+    (project.path / "pulled").write_text("some content")
+
+    mocker.patch("renku.core.lfs.check_external_storage", return_value=True)
+    run_command = mocker.patch("renku.core.lfs.run_command", return_value=None)
+
+    with with_injection():
+        pull_paths_from_storage(project.repository, "small", "large", "pulled")
+        pull_paths_from_storage(project.repository, "small", "large", "pulled")
+
+    run_command.assert_called_once()
+    assert {"large", "small"} == set(run_command.call_args[0][1:])
@@ -19,8 +19,10 @@ from datetime import timedelta
 import pytest
 
 from renku.core import errors
+from renku.core.util.datetime8601 import local_now
+from renku.domain_model.project_context import project_context
 from renku.domain_model.workflow.plan import Plan
-from renku.infrastructure.gateway.activity_gateway import ActivityGateway
+from renku.infrastructure.gateway.activity_gateway import ActivityGateway, reindex_catalog
 from tests.utils import create_dummy_activity
 
 
@@ -52,6 +54,34 @@ def test_get_by_id_non_existing(project_with_injection):
     assert activity is None
 
 
+def test_get_activities_by_date(project_with_injection):
+    """Test activities are returned from newest to oldest and filtered by their end time."""
+    plan = Plan(id=Plan.generate_id(), name="plan", command="")
+    now = local_now()
+
+    activities = [
+        create_dummy_activity(plan=plan, ended_at_time=now - timedelta(hours=hours), index=hours) for hours in range(4)
+    ]
+    activity_gateway = ActivityGateway()
+
+    for activity in reversed(activities):
+        activity_gateway.add(activity)
+
+    assert activities == list(activity_gateway.get_activities_by_date())
+    assert activities[1:3] == list(
+        activity_gateway.get_activities_by_date(since=now - timedelta(hours=2), until=now - timedelta(hours=1))
+    )
+
+    activities[0].delete()
+    project_context.database.remove_root_object("activities-by-date")
+
+    assert activities[1:] == list(activity_gateway.get_activities_by_date())
+
+    reindex_catalog(project_context.database)
+
+    assert activities[1:] == list(activity_gateway.get_activities_by_date())
+
+
 def test_activity_gateway_downstream_activities(project_with_injection):
     """Test getting downstream activities work."""
     plan = Plan(id=Plan.generate_id(), name="plan", command="")
@@ -240,3 +270,73 @@ def test_remove_activity(project_with_injection):
 
     # Activity won't be in the list of activities if we don't keep its reference
     assert downstream not in activity_gateway.get_all_activities()
+
+
+def test_activity_gateway_downstream_cache_invalidation(project_with_injection):
+    """Test cached up/downstream activities are updated when activities are added or removed."""
+    r1 = create_dummy_activity(plan="r1", usages=["a"], generations=["b"])
+    r2 = create_dummy_activity(plan="r2", usages=["b"], generations=["c"])
+    r3 = create_dummy_activity(plan="r3", usages=["c"], generations=["d"])
+
+    activity_gateway = ActivityGateway()
+
+    activity_gateway.add(r1)
+    activity_gateway.add(r2)
+
+    assert {r2} == activity_gateway.get_downstream_activities(r1)
+
+    activity_gateway.add(r3)
+
+    assert {r2, r3} == activity_gateway.get_downstream_activities(r1)
+    assert {r2} == activity_gateway.get_downstream_activities(r1, max_depth=1)
+    assert {r1, r2} == activity_gateway.get_upstream_activities(r3)
+    assert {r2} == activity_gateway.get_upstream_activities(r3, max_depth=1)
+
+    activity_gateway.remove(r2, force=True)
+
+    assert set() == activity_gateway.get_downstream_activities(r1)
+    assert set() == activity_gateway.get_upstream_activities(r3)
+
+    # NOTE: A new gateway (i.e. a new command) sees the changes
+    assert set() == ActivityGateway().get_downstream_activities(r1)
+
+
+def test_activity_gateway_cache_invalidation_on_reindex(project_with_injection):
+    """Test cached activity graph is rebuilt when the catalog is re-indexed even if its size doesn't change."""
+    r1 = create_dummy_activity(plan="r1", usages=["a"], generations=["b"])
+    r2 = create_dummy_activity(plan="r2", usages=["b"], generations=["c"])
+
+    activity_gateway = ActivityGateway()
+    activity_gateway.add(r1)
+    activity_gateway.add(r2)
+
+    activity_catalog = project_context.database["activity-catalog"]
+    relation = next(iter(activity_catalog.findRelations(activity_catalog.tokenizeQuery(upstream=r1))))
+
+    # NOTE: Corrupt the catalog without changing its size
+    activity_catalog.unindex(relation)
+    activity_catalog.index(type(relation)(downstream=r1, upstream=r2))
+
+    assert {r2} == activity_gateway.get_upstream_activities(r1)
+
+    reindex_catalog(project_context.database)
+
+    assert {r2} == activity_gateway.get_downstream_activities(r1)
+    assert set() == activity_gateway.get_upstream_activities(r1)
+
+
+def test_activity_gateway_downstream_activity_chains_diamond(project_with_injection):
+    """Test chains through shared activities are all returned."""
+    r1 = create_dummy_activity(plan="r1", usages=["a"], generations=["b", "c"])
+    r2 = create_dummy_activity(plan="r2", usages=["b"], generations=["d"])
+    r3 = create_dummy_activity(plan="r3", usages=["c"], generations=["e"])
+    r4 = create_dummy_activity(plan="r4", usages=["d", "e"], generations=["f"])
+
+    activity_gateway = ActivityGateway()
+    for activity in (r1, r2, r3, r4):
+        activity_gateway.add(activity)
+
+    assert {(r2.id,), (r2.id, r4.id), (r3.id,), (r3.id, r4.id)} == {
+        tuple(a.id for a in chain) for chain in activity_gateway.get_downstream_activity_chains(r1)
+    }
+    assert {(r4.id,)} == {tuple(a.id for a in chain) for chain in activity_gateway.get_downstream_activity_chains(r2)}
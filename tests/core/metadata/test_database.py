@@ -438,3 +438,48 @@ def test_database_corrupt_metadata(tmpdir, content, error_message):
 
     with pytest.raises(expected_exception=errors.MetadataCorruptError, match=error_message):
         storage.load("file")
+
+
+def test_database_pool_reuses_read_only_databases(project, monkeypatch):
+    """Test read-only commands reuse a pooled database until the project changes."""
+    from renku.command.dataset import create_dataset_command, list_datasets_command
+    from renku.infrastructure.database_pool import DatabasePool
+
+    pool = DatabasePool(max_size=2, max_bytes=0)
+    monkeypatch.setattr("renku.command.command_builder.database.database_pool", pool)
+
+    assert [] == list_datasets_command().build().execute().output
+    assert [] == list_datasets_command().build().execute().output
+
+    assert (1, 1) == (pool.hits, pool.misses)
+    assert pool.size_bytes > 0
+
+    create_dataset_command().build().execute("my-dataset", name="", description="", creators=[])
+
+    assert ["my-dataset"] == [d.name for d in list_datasets_command().build().execute().output]
+    assert (1, 2) == (pool.hits, pool.misses)
+
+
+def test_database_pool_limits(tmp_path):
+    """Test the pool evicts least recently used databases and doesn't keep databases with uncommitted changes."""
+    from renku.infrastructure.database_pool import DatabasePool
+
+    pool = DatabasePool(max_size=1, max_bytes=0)
+    keys = []
+    for name in ("first", "second"):
+        database_path = tmp_path / name / "metadata"
+        database = Database.from_path(database_path)
+        database.commit()
+        key, database = pool.acquire(tmp_path / name, database_path, commit_sha=name)
+        pool.release(key, database, database_path)
+        keys.append((key, database_path))
+
+    assert [keys[1][0]] == [key for key, _ in pool._idle]
+
+    key, database = pool.acquire(tmp_path / "second", keys[1][1], commit_sha="second")
+
+    assert 1 == pool.hits
+    database.add_index(name="plans", object_type=Plan, attribute="name")
+    pool.release(key, database, keys[1][1])
+
+    assert [] == pool._idle
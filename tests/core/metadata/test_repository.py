@@ -328,6 +328,29 @@ def test_ignored_paths(paths, ignored, project):
     assert project_context.repository.get_ignored_paths(*paths) == ignored
 
 
+def test_add_and_remove_many_paths(project):
+    """Test staging and un-staging a large number of paths in bulk."""
+    repository = project.repository
+    paths = [f"bulk/file {i}" for i in range(250)] + ["bulk/-dash"]
+
+    (project.path / "bulk").mkdir()
+    for path in paths:
+        (project.path / path).write_text(path)
+
+    repository.add(*paths)
+
+    assert set(paths) == {d.a_path for d in repository.staged_changes}
+
+    repository.commit("Add many files")
+    for path in paths[:100]:
+        (project.path / path).unlink()
+
+    repository.remove(*paths[:100], index=True)
+
+    assert set(paths[:100]) == {d.a_path for d in repository.staged_changes}
+    assert set(paths[100:]) == {p for p in repository.files if p.startswith("bulk/")}
+
+
 def test_remote(git_repository):
     """Test get remote of a repository."""
     assert 1 == len(git_repository.remotes)
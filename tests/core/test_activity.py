@@ -19,7 +19,15 @@ from datetime import datetime, timedelta
 from pathlib import Path
 from typing import Optional
 
-from renku.core.workflow.activity import revert_activity
+import pytest
+
+from renku.core import errors
+from renku.core.workflow.activity import (
+    create_activity_graph,
+    get_downstream_generating_activities,
+    revert_activity,
+    sort_activities,
+)
 from renku.infrastructure.gateway.activity_gateway import ActivityGateway
 from renku.infrastructure.gateway.plan_gateway import PlanGateway
 from renku.infrastructure.repository import Repository
@@ -121,3 +129,81 @@ def test_revert_and_delete_plan(project_with_injection):
 
     # Plan is deleted because no other active activity is using it
     assert plan_gateway.get_by_name("to-be-deleted-plan").deleted is True
+
+
+def test_get_downstream_generating_activities(project_with_injection):
+    """Test getting downstream activities that generate some paths."""
+    r1 = create_dummy_activity(plan="r1", usages=["a"], generations=["b"])
+    r2 = create_dummy_activity(plan="r2", usages=["b"], generations=["c"])
+    r3 = create_dummy_activity(plan="r3", usages=["b"], generations=["d"])
+    r4 = create_dummy_activity(plan="r4", usages=["c", "d"], generations=["e"])
+    r5 = create_dummy_activity(plan="r5", usages=["e"], generations=["f"])
+
+    activity_gateway = ActivityGateway()
+    for activity in (r1, r2, r3, r4, r5):
+        activity_gateway.add(activity)
+
+    def get_activities(paths):
+        return set(
+            get_downstream_generating_activities(
+                starting_activities={r1},
+                paths=paths,
+                ignore_deleted=False,
+                project_path=project_with_injection.path,
+                activity_gateway=activity_gateway,
+            )
+        )
+
+    assert {r1, r2, r3, r4, r5} == get_activities([])
+    assert {r1, r3} == get_activities(["d"])
+    assert {r1, r2, r3, r4} == get_activities(["e"])
+    assert set() == get_activities(["a"])
+
+    r3.association.plan.delete()
+
+    # NOTE: Activities after a deleted plan are included only if they are reachable through valid activities
+    assert {r1, r2, r4, r5} == get_activities([])
+    assert {r1} == get_activities(["d"])
+
+
+def test_sort_activities_that_generate_the_same_path():
+    """Test activities that regenerate a path are sorted chronologically and overridden ones are removed."""
+    start_date = datetime(2022, 1, 1, 12, 0, 0).astimezone()
+
+    upstream = create_dummy_activity(
+        plan="upstream", generations=["input"], started_at_time=start_date, ended_at_time=start_date
+    )
+    sweep = [
+        create_dummy_activity(
+            plan=f"sweep-{i}",
+            usages=["input"],
+            generations=["output", f"log-{i}"],
+            started_at_time=start_date,
+            ended_at_time=start_date + timedelta(seconds=i + 1),
+        )
+        for i in range(5)
+    ]
+    overridden = create_dummy_activity(
+        plan="overridden",
+        usages=["input"],
+        generations=["output"],
+        started_at_time=start_date,
+        ended_at_time=start_date + timedelta(seconds=2.5),
+    )
+
+    activities = sort_activities([overridden, *reversed(sweep), upstream], remove_overridden_parents=False)
+
+    assert [upstream, *sweep] == activities
+
+
+def test_create_activity_graph_with_cycles():
+    """Test cycles are reported without enumerating all of them."""
+    activities = [
+        create_dummy_activity(plan=f"r{i}", usages=[f"{i}", f"{i + 1}"], generations=[f"{i + 1}", f"{i}"])
+        for i in range(20)
+    ]
+
+    with pytest.raises(errors.GraphCycleError) as e:
+        create_activity_graph(activities)
+
+    assert "Cycles detected in execution graph" in str(e.value)
@@ -21,8 +21,9 @@ import pytest
 
 from renku.core import errors
 from renku.core.config import get_value
-from renku.core.dataset.dataset_add import get_dataset_file_path_within_dataset
+from renku.core.dataset.dataset_add import _get_hash_types, get_dataset_file_path_within_dataset, get_files_metadata
 from renku.core.dataset.providers.s3 import S3Credentials, S3Provider, parse_s3_uri
+from renku.core.util.util import parallel_execute as parallel_execute_
 from renku.domain_model.dataset import Dataset
 from renku.domain_model.enums import ConfigFilter
 
@@ -99,3 +100,57 @@ def test_get_within_dataset_path(entity_path, within_dataset_path):
     path = get_dataset_file_path_within_dataset(dataset=dataset, entity_path=entity_path)
 
     assert within_dataset_path == str(path)
+
+
+def test_get_files_metadata_downloads_web_urls_together(project, mocker):
+    """Test multiple web URLs are downloaded in one batch and other URLs are processed one by one."""
+    get_metadata = mocker.patch(
+        "renku.core.dataset.providers.web.WebProvider.get_metadata", side_effect=lambda uri, **_: [uri]
+    )
+    parallel_execute = mocker.patch("renku.core.dataset.dataset_add.parallel_execute", wraps=parallel_execute_)
+    urls = ["https://example.com/file-1", "https://example.com/file-2", "https://example.com/file-3"]
+
+    files = get_files_metadata(
+        urls=urls, dataset=Dataset(name="dataset"), destination=project.path, extract=False, revision=None, sources=[]
+    )
+
+    assert set(urls) == set(files)
+    assert 3 == get_metadata.call_count
+    assert 1 == parallel_execute.call_count
+    assert urls == parallel_execute.call_args[0][1]
+
+
+def test_get_files_metadata_records_failed_urls(project, mocker):
+    """Test URLs that cannot be retrieved are recorded instead of failing all URLs when requested."""
+
+    def get_metadata(uri, **_):
+        if uri.endswith("missing"):
+            raise errors.OperationError(f"Cannot download {uri}")
+        return [uri]
+
+    mocker.patch("renku.core.dataset.providers.web.WebProvider.get_metadata", side_effect=get_metadata)
+    urls = ["https://example.com/file-1", "https://example.com/missing", "https://example.com/file-2"]
+    kwargs = dict(dataset=Dataset(name="dataset"), destination=project.path, extract=False, revision=None, sources=[])
+
+    with pytest.raises(errors.OperationError):
+        get_files_metadata(urls=urls, **kwargs)
+
+    failed_urls = {}
+    files = get_files_metadata(urls=urls, failed_urls=failed_urls, **kwargs)
+
+    assert {"https://example.com/file-1", "https://example.com/file-2"} == set(files)
+    assert {"https://example.com/missing"} == failed_urls.keys()
+    assert "Cannot download" in failed_urls["https://example.com/missing"]
+
+
+def test_copy_file_hashes_sha256_only_for_lfs_files(tmp_path):
+    """Test SHA-256 is only calculated for files that will be tracked in LFS."""
+    small = tmp_path / "small"
+    small.write_bytes(b"1" * 10)
+    large = tmp_path / "large"
+    large.write_bytes(b"1" * 100)
+
+    assert ["git"] == _get_hash_types(small, storage=None, lfs_threshold=50)
+    assert ["git", "sha256"] == _get_hash_types(large, storage=None, lfs_threshold=50)
+    assert ["git"] == _get_hash_types(large, storage=None, lfs_threshold=None)
+    assert ["md5"] == _get_hash_types(large, storage=object(), lfs_threshold=50)  # type: ignore
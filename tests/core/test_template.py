@@ -35,7 +35,8 @@ from renku.core.template.usecase import (
 )
 from renku.core.util.metadata import replace_renku_version_in_dockerfile
 from renku.domain_model.project_context import project_context
-from renku.domain_model.template import TEMPLATE_MANIFEST
+from renku.domain_model.template import TEMPLATE_MANIFEST, TemplatesManifest
+from renku.infrastructure.repository import Repository
 from tests.utils import write_and_commit_file
 
 TEMPLATES_URL = "https://github.com/SwissDataScienceCenter/renku-project-template"
@@ -60,6 +61,53 @@ def test_template_fetch_invalid_git_url():
         fetch_templates_source(source="invalid-url", reference=None)
 
 
+@pytest.fixture
+def cached_templates_repository(monkeypatch, fake_home, tmp_path, templates_source_root, source_template):
+    """A local template repository that is fetched through the templates cache."""
+    monkeypatch.setenv("RENKU_TEMPLATES_CACHE_DIR", str(tmp_path / "cache"))
+    (templates_source_root / TEMPLATE_MANIFEST).write_text(
+        "- id: dummy\n  name: Dummy Template\n  description: A dummy template\n"
+    )
+
+    repository = Repository.initialize(templates_source_root)
+    repository.add(all=True)
+    repository.commit("dummy template", no_verify=True)
+    repository.tags.add("1.0.0")
+
+    yield f"file://{templates_source_root}", repository
+
+
+def test_template_fetch_uses_cache(cached_templates_repository, mocker):
+    """Test template repositories are cloned once and checked out from the cache."""
+    source, repository = cached_templates_repository
+    clone_from = mocker.spy(Repository, "clone_from")
+    from_path = mocker.spy(TemplatesManifest, "from_path")
+
+    first = fetch_templates_source(source=source, reference=None)
+    second = fetch_templates_source(source=source, reference="1.0.0")
+
+    assert 1 == clone_from.call_count
+    assert 1 == from_path.call_count
+    assert first.path != second.path
+    assert repository.head.commit.hexsha == first.version == second.version
+    assert ["dummy"] == [t.id for t in second.templates]
+    assert second.templates[0].templates_source is second
+
+    # NOTE: References that were created after the last fetch are fetched
+    write_and_commit_file(repository, "dummy/new-file", "new")
+    repository.tags.add("2.0.0")
+
+    third = fetch_templates_source(source=source, reference="2.0.0")
+
+    assert 1 == clone_from.call_count
+    assert repository.head.commit.hexsha == third.version
+    assert (third.path / "dummy" / "new-file").exists()
+    assert ["1.0.0", "2.0.0"] == third.get_all_references("dummy")
+
+    with pytest.raises(errors.TemplateMissingReferenceError):
+        fetch_templates_source(source=source, reference="invalid-ref")
+
+
 @pytest.mark.integration
 @pytest.mark.vcr
 def test_template_fetch_invalid_git_reference():
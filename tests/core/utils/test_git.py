@@ -109,3 +109,39 @@ def test_push_to_diverged_branch(protected_git_repository, mocker):
     branch = protected_git_repository.branches[new_pushed_branch]
     assert commit_sha_after == branch.commit.hexsha
     assert f"origin/{branch.name}" == branch.remote_branch.name
+
+
+def test_get_entity_from_revision_directory(fake_home, tmp_path, mocker):
+    """Test directory entities are built from batched git calls and have the same checksums as single lookups."""
+    from renku.core.util.git import get_entity_from_revision
+    from renku.infrastructure.repository import Repository
+
+    repository = Repository.initialize(tmp_path / "repository")
+    (repository.path / "data" / "sub").mkdir(parents=True)
+    (repository.path / "data" / "unchanged").write_text("unchanged")
+    (repository.path / "data" / "modified").write_text("old")
+    (repository.path / "data" / "sub" / "nested").write_text("nested")
+    (repository.path / "data" / "link").symlink_to("unchanged")
+    repository.add(all=True)
+    old_commit = repository.commit("initial", no_verify=True)
+    (repository.path / "data" / "modified").write_text("new")
+    (repository.path / "data" / "untracked").write_text("untracked")
+
+    def get_checksums(entity):
+        checksums = {str(entity.path): entity.checksum}
+        for member in getattr(entity, "members", []):
+            checksums.update(get_checksums(member))
+        return checksums
+
+    paths = ["data", "data/unchanged", "data/modified", "data/sub", "data/sub/nested", "data/link", "data/untracked"]
+    expected = {path: repository.get_object_hash(path=path) for path in paths}
+    expected_at_revision = {path: repository.get_object_hash(path=path, revision=old_commit.hexsha) for path in paths}
+    expected_at_revision["data/untracked"] = old_commit.hexsha
+    get_object_hash = mocker.spy(repository, "get_object_hash")
+
+    assert expected == get_checksums(get_entity_from_revision(repository, "data", bypass_cache=True))
+    assert expected_at_revision == get_checksums(
+        get_entity_from_revision(repository, "data", revision=old_commit.hexsha, bypass_cache=True)
+    )
+    # NOTE: Only the top-level directory is looked up on its own
+    assert 2 == get_object_hash.call_count
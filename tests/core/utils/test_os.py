@@ -15,9 +15,12 @@
 # limitations under the License.
 """Test os utilities."""
 
+import hashlib
+
 import pytest
 
-from renku.core.util.os import matches
+from renku.core.util.os import copy_file_with_hashes, hash_file_multiple, matches
+from renku.infrastructure.repository import Repository
 
 
 @pytest.mark.parametrize(
@@ -45,3 +48,30 @@ from renku.core.util.os import matches
 def test_path_match(path, pattern, should_match):
     """Test ``matches`` utility function that checks if a path matches a given pattern."""
     assert matches(path=path, pattern=pattern) is should_match
+
+
+@pytest.mark.parametrize("size", [0, 42, 3 * 1024 * 1024 + 7])
+def test_copy_file_with_hashes(tmp_path, size):
+    """Test files are copied and hashed in the same pass."""
+    content = bytes(i % 251 for i in range(size))
+    source = tmp_path / "source"
+    source.write_bytes(content)
+    destination = tmp_path / "destination"
+
+    hashes = copy_file_with_hashes(source, destination, ["md5", "sha256", "git"])
+
+    assert content == destination.read_bytes()
+    assert hashlib.md5(content).hexdigest() == hashes["md5"]
+    assert hashlib.sha256(content).hexdigest() == hashes["sha256"]
+    assert Repository.hash_object(source) == hashes["git"]
+    assert hashes == hash_file_multiple(destination, ["md5", "sha256", "git"])
+
+
+def test_copy_file_without_hashes(tmp_path):
+    """Test files are copied when no hash is requested."""
+    source = tmp_path / "source"
+    source.write_text("some content")
+    destination = tmp_path / "destination"
+
+    assert {} == copy_file_with_hashes(source, destination, [])
+    assert "some content" == destination.read_text()
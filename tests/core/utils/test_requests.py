@@ -0,0 +1,265 @@
+# Copyright Swiss Data Science Center (SDSC). A partnership between
+# École Polytechnique Fédérale de Lausanne (EPFL) and
+# Eidgenössische Technische Hochschule Zürich (ETHZ).
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+"""Test HTTP request utilities."""
+
+import hashlib
+import os
+import re
+import threading
+import time
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+import pytest
+
+from renku.core import errors
+from renku.core.util import requests
+
+
+@pytest.fixture
+def http_server():
+    """A local HTTP/1.1 server that counts opened connections."""
+    connections = []
+
+    class Handler(BaseHTTPRequestHandler):
+        protocol_version = "HTTP/1.1"
+
+        def setup(self):
+            super().setup()
+            connections.append(self.client_address)
+
+        def do_GET(self):
+            body = b"content"
+            self.send_response(200)
+            self.send_header("Content-Length", str(len(body)))
+            self.send_header("Set-Cookie", "session=secret")
+            self.end_headers()
+            self.wfile.write(body)
+
+        def log_message(self, *args):
+            pass
+
+    server = ThreadingHTTPServer(("127.0.0.1", 0), Handler)
+    thread = threading.Thread(target=server.serve_forever, daemon=True)
+    thread.start()
+
+    yield f"http://127.0.0.1:{server.server_address[1]}", connections
+
+    server.shutdown()
+    server.server_close()
+
+
+def test_requests_reuse_connections(http_server):
+    """Test consecutive requests to the same host reuse a pooled connection."""
+    url, connections = http_server
+
+    for _ in range(5):
+        response = requests.get(f"{url}/file")
+        assert b"content" == response.content
+
+    assert 1 == len(connections)
+    assert 0 == len(requests.get_session().cookies)
+
+
+def test_sessions_are_per_thread():
+    """Test each thread gets its own session but all sessions share the connection pools."""
+    sessions = {}
+
+    def get_session(index):
+        sessions[index] = requests.get_session()
+
+    threads = [threading.Thread(target=get_session, args=(i,)) for i in range(3)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+
+    assert 3 == len({id(s) for s in sessions.values()})
+    assert 1 == len({id(s.get_adapter("https://")) for s in sessions.values()})
+    assert requests.get_session() is requests.get_session()
+
+
+CONTENT = bytes(range(256)) * 1024
+
+
+@pytest.fixture
+def range_server():
+    """A local HTTP server that supports range requests and records requested ranges.
+
+    ``state["etags"]`` holds ETags of consecutive versions of the file; each request moves to the next version.
+    ``state["drop_after"]`` makes the server drop the connection after sending that many bytes once.
+    ``state["range_start"]`` makes the server send ranges from that position instead of the requested one.
+    """
+    ranges = []
+    state = {"etags": ['"v1"'], "drop_after": None, "range_start": None}
+
+    class Handler(BaseHTTPRequestHandler):
+        protocol_version = "HTTP/1.1"
+
+        def do_GET(self):
+            etag = state["etags"].pop(0) if len(state["etags"]) > 1 else state["etags"][0]
+            start, end = 0, len(CONTENT) - 1
+            range_header = self.headers.get("Range")
+            ranges.append(range_header)
+
+            match = re.match(r"bytes=(\d+)-(\d*)", range_header or "")
+            if match and self.headers.get("If-Range", etag) == etag:
+                start = int(match.group(1)) if state["range_start"] is None else state["range_start"]
+                end = int(match.group(2)) if match.group(2) else end
+                self.send_response(206)
+                self.send_header("Content-Range", f"bytes {start}-{end}/{len(CONTENT)}")
+            else:
+                self.send_response(200)
+
+            body = CONTENT[start : end + 1]
+            self.send_header("Content-Length", str(len(body)))
+            self.send_header("Accept-Ranges", "bytes")
+            self.send_header("ETag", etag)
+            self.end_headers()
+
+            if state["drop_after"] is not None:
+                self.wfile.write(body[: state["drop_after"]])
+                self.wfile.flush()
+                state["drop_after"] = None
+                self.close_connection = True
+                return
+
+            self.wfile.write(body)
+
+        def log_message(self, *args):
+            pass
+
+    server = ThreadingHTTPServer(("127.0.0.1", 0), Handler)
+    thread = threading.Thread(target=server.serve_forever, daemon=True)
+    thread.start()
+
+    yield f"http://127.0.0.1:{server.server_address[1]}/data.bin", ranges, state
+
+    server.shutdown()
+    server.server_close()
+
+
+def test_download_file_resumes_partial_download(range_server, tmp_path):
+    """Test a partially downloaded file is continued with a range request."""
+    url, ranges, _ = range_server
+
+    with requests._PartialDownload(base_directory=tmp_path, url=url) as partial_file:
+        partial_file.path.write_bytes(CONTENT[:1000])
+        partial_file._validator_path.write_text('"v1"')
+
+    _, paths = requests.download_file(base_directory=tmp_path, url=url, filename=None, extract=False)
+
+    assert ["bytes=1000-"] == ranges
+    assert "data.bin" == paths[0].name
+    assert CONTENT == paths[0].read_bytes()
+    assert not list(tmp_path.glob("*.part*"))
+
+
+def test_download_file_restarts_if_range_does_not_continue_partial_download(range_server, tmp_path):
+    """Test a partial download isn't continued with a range that starts somewhere else."""
+    url, ranges, state = range_server
+    state["range_start"] = 0
+
+    with requests._PartialDownload(base_directory=tmp_path, url=url) as partial_file:
+        partial_file.path.write_bytes(CONTENT[:1000])
+        partial_file._validator_path.write_text('"v1"')
+
+    _, paths = requests.download_file(base_directory=tmp_path, url=url, filename="file", extract=False)
+
+    assert ["bytes=1000-", None] == ranges
+    assert CONTENT == paths[0].read_bytes()
+    assert not list(tmp_path.glob("*.part*"))
+
+
+def test_download_file_verifies_checksum(range_server, tmp_path):
+    """Test downloaded file is checked against a provided checksum."""
+    url, _, _ = range_server
+    md5 = hashlib.md5(CONTENT).hexdigest()
+
+    _, paths = requests.download_file(
+        base_directory=tmp_path, url=url, filename="file", extract=False, checksum=f"md5:{md5}"
+    )
+
+    assert CONTENT == paths[0].read_bytes()
+
+    with pytest.raises(errors.RequestError, match="Checksum"):
+        requests.download_file(base_directory=tmp_path, url=url, filename="file", extract=False, checksum="md5:1234")
+
+    assert not list(tmp_path.glob("*.part*"))
+
+
+def test_download_file_in_segments(range_server, tmp_path, monkeypatch):
+    """Test large files are downloaded with concurrent range requests."""
+    url, ranges, _ = range_server
+    monkeypatch.setattr(requests, "_SEGMENTED_DOWNLOAD_MIN_SIZE", 1024)
+
+    _, paths = requests.download_file(base_directory=tmp_path, url=url, filename="file", extract=False, segments=4)
+
+    assert CONTENT == paths[0].read_bytes()
+    assert {None, "bytes=0-65535", "bytes=65536-131071", "bytes=131072-196607", "bytes=196608-262143"} == set(ranges)
+
+
+def test_download_file_segments_fail_if_file_changes(range_server, tmp_path, monkeypatch):
+    """Test segments of different versions of a file are never stitched together."""
+    url, _, state = range_server
+    monkeypatch.setattr(requests, "_SEGMENTED_DOWNLOAD_MIN_SIZE", 1024)
+    state["etags"] = ['"v1"', '"v2"']
+
+    with pytest.raises(errors.RequestError, match="changed"):
+        requests.download_file(base_directory=tmp_path, url=url, filename="file", extract=False, segments=4)
+
+    assert not list(tmp_path.glob("*.part*"))
+
+
+def test_download_file_reports_progress_once_when_resuming(range_server, tmp_path, mocker):
+    """Test a download that is resumed after a dropped connection starts and finalizes progress only once."""
+    url, ranges, state = range_server
+    state["drop_after"] = 1000
+    communication = mocker.patch("renku.core.util.communication")
+    hash_existing_content = mocker.spy(requests._PartialDownload, "_hash_existing_content")
+    md5 = hashlib.md5(CONTENT).hexdigest()
+
+    _, paths = requests.download_file(
+        base_directory=tmp_path, url=url, filename="file", extract=False, checksum=f"md5:{md5}"
+    )
+
+    assert CONTENT == paths[0].read_bytes()
+    assert [None, "bytes=1000-"] == ranges
+    communication.start_progress.assert_called_once_with(name="file", total=len(CONTENT))
+    communication.finalize_progress.assert_called_once_with(name="file")
+    assert len(CONTENT) == sum(c.kwargs["amount"] for c in communication.update_progress.call_args_list)
+    # NOTE: The file is hashed while it's downloaded, including the resumed part
+    hash_existing_content.assert_not_called()
+
+
+def test_download_file_removes_stale_partial_downloads(range_server, tmp_path):
+    """Test partial downloads that weren't touched for a long time are removed."""
+    url, _, _ = range_server
+    stale = tmp_path / "stale.part"
+    stale.write_bytes(b"stale")
+    stale_validator = tmp_path / "stale.part.validator"
+    stale_validator.write_text('"v0"')
+    recent = tmp_path / "recent.part"
+    recent.write_bytes(b"recent")
+
+    old = time.time() - requests._RENKU_PARTIAL_DOWNLOAD_MAX_AGE - 60
+    os.utime(stale, (old, old))
+    os.utime(stale_validator, (old, old))
+
+    requests.download_file(base_directory=tmp_path, url=url, filename="file", extract=False)
+
+    assert not stale.exists()
+    assert not stale_validator.exists()
+    assert recent.exists()
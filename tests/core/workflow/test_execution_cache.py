@@ -0,0 +1,58 @@
+# Copyright Swiss Data Science Center (SDSC). A partnership between
+# École Polytechnique Fédérale de Lausanne (EPFL) and
+# Eidgenössische Technische Hochschule Zürich (ETHZ).
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+"""Tests for the workflow execution cache."""
+
+import networkx as nx
+
+from renku.core.util.datetime8601 import local_now
+from renku.core.workflow.execution_cache import find_cached_activity, restore_cached_steps
+from renku.domain_model.project_context import project_context
+from renku.domain_model.provenance.activity import Activity
+from renku.infrastructure.gateway.activity_gateway import ActivityGateway
+from renku.infrastructure.gateway.plan_gateway import PlanGateway
+from tests.utils import create_dummy_plan, write_and_commit_file
+
+
+def test_restore_cached_step(project_with_injection):
+    """Test outputs of a step are restored only if its plan, parameter values and inputs are unchanged."""
+    repository = project_with_injection.repository
+    write_and_commit_file(repository, "input.txt", "input")
+    write_and_commit_file(repository, "output.txt", "output")
+
+    plan = create_dummy_plan("copy", command="cp", inputs=["input.txt"], outputs=["output.txt"])
+    PlanGateway().add(plan)
+    activity = Activity.from_plan(
+        plan=plan, repository=repository, started_at_time=local_now(), ended_at_time=local_now()
+    )
+    ActivityGateway().add(activity)
+
+    (project_context.path / "output.txt").unlink()
+    dag = nx.DiGraph()
+    dag.add_node(plan)
+
+    assert {plan: activity} == restore_cached_steps(dag)
+    assert "output.txt" in repository.files
+    assert "output" == (project_context.path / "output.txt").read_text()
+    assert not repository.is_dirty()
+
+    (project_context.path / "input.txt").write_text("changed input")
+
+    assert find_cached_activity(plan) is None
+
+    (project_context.path / "input.txt").write_text("input")
+    plan.outputs[0].actual_value = "other-output.txt"
+
+    assert find_cached_activity(plan) is None
@@ -0,0 +1,71 @@
+# Copyright Swiss Data Science Center (SDSC). A partnership between
+# École Polytechnique Fédérale de Lausanne (EPFL) and
+# Eidgenössische Technische Hochschule Zürich (ETHZ).
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+"""Renku service cache expiry index tests."""
+from datetime import datetime, timedelta
+
+from renku.ui.service.cache.base import BaseCache
+from renku.ui.service.cache.expiry import ExpiryIndex, get_timestamp
+from renku.ui.service.cache.models.file import FILES_EXPIRY, File
+from renku.ui.service.cache.projects import User
+from renku.ui.service.cache.serializers.job import JobSchema
+from renku.ui.service.jobs.cleanup import cache_files_cleanup
+
+
+def test_expiry_index_pops_expired_records_in_batches(mock_redis):
+    """Test only expired records are popped and that kept records are not popped again."""
+    index = ExpiryIndex("test")
+    now = datetime.utcnow()
+    for i in range(5):
+        index.add(f"expired-{i}", now - timedelta(hours=1))
+    index.add("recent", now)
+
+    assert 2 == len(index.pop_expired(cutoff=get_timestamp(now - timedelta(minutes=30)), batch_size=2))
+
+    expired = []
+    for record_id in index.expired(ttl=1800, batch_size=2):
+        expired.append(record_id)
+        # NOTE: Records that are kept are added back with the current time
+        index.add(record_id, datetime.utcnow())
+
+    assert {"expired-2", "expired-3", "expired-4"} == set(expired)
+
+
+def test_cache_files_cleanup_skips_locked_files(mock_redis, tmp_path, monkeypatch):
+    """Test cleanup purges expired files unless a running job locks them."""
+    monkeypatch.setenv("RENKU_SVC_CLEANUP_TTL_FILES", "1")
+    created_at = datetime.utcnow() - timedelta(minutes=1)
+    user = User(user_id="user")
+    files = []
+    for name in ("locked", "unlocked"):
+        path = tmp_path / name
+        path.write_text(name)
+        file = File(file_id=name, user_id=user.user_id, file_name=name, relative_path=str(path), created_at=created_at)
+        file.save()
+        files.append(file)
+
+    job = JobSchema().load({"user_id": user.user_id})
+    job.locked.add("locked")
+    job.save()
+    job.save_locks()
+
+    cache_files_cleanup()
+
+    assert files[0].abs_path.exists()
+    assert not files[1].abs_path.exists()
+    assert [b"locked"] == BaseCache.cache.zrange(FILES_EXPIRY.key, 0, -1)
+
+    job.complete()
+    assert not File.load("locked").is_locked()
@@ -0,0 +1,111 @@
+# Copyright Swiss Data Science Center (SDSC). A partnership between
+# École Polytechnique Fédérale de Lausanne (EPFL) and
+# Eidgenössische Technische Hochschule Zürich (ETHZ).
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+"""Renku service project lock tests."""
+import threading
+import time
+
+import pytest
+from redis import ConnectionError
+
+from renku.core import errors
+from renku.ui.service.cache.base import BaseCache
+from renku.ui.service.cache.locks import LOCK_KEY_TTL, READ, WRITE, WRITE_LOCK_TIMEOUT, ProjectLock, project_lock
+
+
+@pytest.fixture
+def lock_path(tmp_path):
+    """Path of a project to lock."""
+    return tmp_path / "project"
+
+
+def test_readers_share_lock_and_writer_times_out(mock_redis, lock_path):
+    """Test readers hold the lock together while a writer waits until its timeout."""
+    with project_lock(lock_path, READ, timeout=1, max_readers=2):
+        with project_lock(lock_path, READ, timeout=1, max_readers=2):
+            with pytest.raises(errors.LockError):
+                with project_lock(lock_path, WRITE, timeout=0.2, max_readers=2):
+                    pass
+
+            with pytest.raises(errors.LockError):
+                with project_lock(lock_path, READ, timeout=0.2, max_readers=2):
+                    pass
+
+    with project_lock(lock_path, WRITE, timeout=0, max_readers=2):
+        pass
+
+
+def test_writer_preference(mock_redis, lock_path):
+    """Test readers don't overtake a writer that waits for the lock."""
+    events = []
+    writer_queued = threading.Event()
+
+    def write():
+        writer_queued.set()
+        with project_lock(lock_path, WRITE, timeout=5, max_readers=10):
+            events.append("writer")
+
+    with project_lock(lock_path, READ, timeout=1, max_readers=10):
+        thread = threading.Thread(target=write)
+        thread.start()
+        writer_queued.wait()
+        time.sleep(0.2)
+
+        with pytest.raises(errors.LockError):
+            with project_lock(lock_path, READ, timeout=0.2, max_readers=10):
+                pass
+
+        events.append("reader")
+
+    thread.join()
+    with project_lock(lock_path, READ, timeout=1, max_readers=10):
+        events.append("late reader")
+
+    assert ["reader", "writer", "late reader"] == events
+
+
+def test_lock_keys_outlive_waiting_writers(mock_redis, lock_path):
+    """Test the arrival sequence isn't reset while a writer may still be waiting."""
+    lock = ProjectLock(lock_path, WRITE, timeout=0, max_readers=10)
+
+    with lock.acquire():
+        assert WRITE_LOCK_TIMEOUT < BaseCache.cache.ttl(lock._sequence_key) <= LOCK_KEY_TTL
+        assert WRITE_LOCK_TIMEOUT < BaseCache.cache.ttl(lock._holders_key) <= LOCK_KEY_TTL
+
+
+def test_expired_holders_are_reaped(mock_redis, lock_path):
+    """Test locks of dead holders are released once their lease expires."""
+    lock = ProjectLock(lock_path, WRITE, timeout=0, max_readers=10)
+    BaseCache.cache.zadd(lock._holders_key, {"w:dead": time.time() - 1})
+
+    with lock.acquire():
+        assert b"w:dead" not in BaseCache.cache.zrange(lock._holders_key, 0, -1)
+
+
+def test_lock_falls_back_to_file_lock(mock_redis, lock_path, monkeypatch):
+    """Test file locks provide mutual exclusion when Redis is not available."""
+
+    def fail(*_, **__):
+        raise ConnectionError("Redis is down")
+
+    monkeypatch.setattr(BaseCache.cache, "incr", fail)
+
+    with project_lock(lock_path, WRITE, timeout=1, max_readers=10):
+        with pytest.raises(errors.LockError):
+            with project_lock(lock_path, READ, timeout=0.2, max_readers=10):
+                pass
+
+    with project_lock(lock_path, READ, timeout=0, max_readers=10):
+        pass
@@ -1,6 +1,7 @@
 import pytest
 from marshmallow.exceptions import ValidationError
 
+from renku.ui.service.cache.models.project import Project
 from renku.ui.service.cache.projects import ProjectManagementCache, User
 
 
@@ -39,3 +40,38 @@ def test_make_project(mock_redis, commit_sha, branch, exception):
             assert projects[0].branch == ""
         else:
             assert projects[0].branch == branch
+
+
+def test_project_snapshot(mock_redis, fake_home, tmp_path, mocker):
+    """Test read-only snapshots are pinned to a commit and don't block writers."""
+    from renku.infrastructure.repository import Repository
+    from renku.ui.service.cache.models import project as project_model
+    from renku.ui.service.gateways.repository_cache import LocalRepositoryCache
+
+    mocker.patch.object(project_model, "CACHE_PROJECTS_PATH", tmp_path)
+    project = Project(
+        project_id="project-id", name="name", slug="slug", owner="owner", user_id="user_id", branch="master"
+    )
+    repository = Repository.initialize(project.abs_path)
+    (project.abs_path / "file").write_text("old")
+    repository.add(all=True)
+    old_commit = repository.commit("old", no_verify=True)
+
+    repository_cache = LocalRepositoryCache()
+    with repository_cache.snapshot(project, timeout=1) as snapshot_path:
+        assert old_commit.hexsha == snapshot_path.name
+        assert "old" == (snapshot_path / "file").read_text()
+
+        with project.write_lock(timeout=0):
+            (project.abs_path / "file").write_text("new")
+            repository.add(all=True)
+            repository.commit("new", no_verify=True)
+            repository_cache._collect_snapshots(project, repository)
+
+        assert "old" == (snapshot_path / "file").read_text()
+
+    with project.write_lock(timeout=0):
+        repository_cache._collect_snapshots(project, repository)
+
+    assert not snapshot_path.exists()
+    assert 1 == len(repository.run_git_command("worktree", "list").splitlines())
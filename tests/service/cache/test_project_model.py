@@ -1,6 +1,11 @@
 import pytest
 
-from renku.ui.service.cache.models.project import DETACHED_HEAD_FOLDER_PREFIX, NO_BRANCH_FOLDER, Project
+from renku.ui.service.cache.models.project import (
+    DETACHED_HEAD_FOLDER_PREFIX,
+    NO_BRANCH_FOLDER,
+    PROJECT_LOOKUP_KEY,
+    Project,
+)
 
 
 @pytest.mark.parametrize(
@@ -15,3 +20,45 @@ from renku.ui.service.cache.models.project import DETACHED_HEAD_FOLDER_PREFIX, N
 def test_project_model_path(commit_sha, branch, expected_folder):
     project = Project(name="name", slug="slug", commit_sha=commit_sha, user_id="user_id", owner="owner", branch=branch)
     assert project.abs_path.stem == expected_folder
+
+
+def test_project_find(mock_redis):
+    """Test projects are found by their composite key and that legacy projects are indexed once."""
+    project = Project(project_id="1", name="name", slug="slug", user_id="user", owner="owner", git_url="url")
+    project.save()
+    other = Project(project_id="2", name="name", slug="slug", user_id="user", owner="owner", git_url="url", branch="b")
+    other.save()
+
+    # NOTE: Projects that were cached before the lookup key existed are indexed on the first miss
+    Project.__database__.delete(PROJECT_LOOKUP_KEY)
+    assert "1" == Project.find("user", "url", "", "").project_id
+    assert b"2" == Project.__database__.hget(PROJECT_LOOKUP_KEY, other.lookup_key)
+
+    assert "1" == Project.find("user", "url", None, None).project_id
+    assert "2" == Project.find("user", "url", "b", "").project_id
+    assert Project.find("another-user", "url", None, None) is None
+    assert not Project.reindex_lookup_keys()
+
+    project.delete()
+
+    assert Project.find("user", "url", None, None) is None
+    assert Project.__database__.hget(PROJECT_LOOKUP_KEY, project.lookup_key) is None
+
+
+def test_project_save_fields(mock_redis):
+    """Test saving some fields of a project."""
+    project = Project(project_id="1", name="name", slug="slug", user_id="user", owner="owner", clone_depth=1)
+    project.save()
+
+    project.clone_depth = None
+    project.name = "new-name"
+    project.save_fields("clone_depth")
+
+    loaded = Project.load_many(["1", "missing"])
+
+    assert 1 == len(loaded)
+    assert loaded[0].clone_depth is None
+    assert "name" == loaded[0].name
+
+    with pytest.raises(AssertionError):
+        project.save_fields("user_id")
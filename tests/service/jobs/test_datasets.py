@@ -303,6 +303,70 @@ def test_dataset_add_remote_file(url, svc_client_with_repo):
     assert commit_message.splitlines()[0] == new_commit.message.splitlines()[0]
 
 
+@pytest.mark.integration
+@pytest.mark.service
+@retry_failed
+def test_dataset_add_multiple_remote_files(svc_client_with_repo):
+    """Test adding several remote files uses one job and one commit and tracks the state of each file."""
+    svc_client, headers, project_id, url_components = svc_client_with_repo
+
+    user_id = encode_b64(secure_filename("9ab2fc80-3a5c-426d-ae78-56de01d214df"))
+    user = {"user_id": user_id}
+    urls = [
+        "https://gist.github.com/jsam/d957f306ed0fe4ff018e902df6a1c8e3",
+        "https://tinyurl.com/y6gne4ct",
+        "https://renku-python-test.invalid/missing-file",
+    ]
+
+    payload = {
+        "git_url": url_components.href,
+        "slug": uuid.uuid4().hex,
+        "create_dataset": True,
+        "files": [{"file_url": url} for url in urls],
+    }
+    response = svc_client.post("/datasets.add", data=json.dumps(payload), headers=headers)
+
+    assert_rpc_response(response)
+    job_ids = {f["job_id"] for f in response.json["result"]["files"]}
+    assert 1 == len(job_ids)
+    job_id = job_ids.pop()
+
+    response = svc_client.get(f"/jobs/{job_id}", headers=headers)
+    assert {url: "ENQUEUED" for url in urls} == response.json["result"]["extras"]["files"]
+
+    dest = make_project_path(
+        user,
+        {
+            "owner": url_components.owner,
+            "name": url_components.name,
+            "slug": url_components.slug,
+            "project_id": project_id,
+        },
+    )
+    old_commit = Repository(dest).head.commit
+
+    dataset_add_remote_file(
+        user=user,
+        user_job_id=job_id,
+        project_id=project_id,
+        create_dataset=True,
+        commit_message="service: dataset add remote files",
+        slug=payload["slug"],
+        url=urls,
+    )
+
+    new_commit = Repository(dest).head.commit
+    assert old_commit.hexsha == new_commit.parents[0].hexsha
+
+    response = svc_client.get(f"/jobs/{job_id}", headers=headers)
+    assert_rpc_response(response)
+    assert "COMPLETED" == response.json["result"]["state"]
+
+    extras = response.json["result"]["extras"]
+    assert {urls[0]: "COMPLETED", urls[1]: "COMPLETED", urls[2]: "FAILED"} == extras["files"]
+    assert {urls[2]} == extras["file_errors"].keys()
+
+
 @pytest.mark.service
 @pytest.mark.integration
 @retry_failed
@@ -0,0 +1,61 @@
+# Copyright Swiss Data Science Center (SDSC). A partnership between
+# École Polytechnique Fédérale de Lausanne (EPFL) and
+# Eidgenössische Technische Hochschule Zürich (ETHZ).
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+"""Renku service graph job tests."""
+import pytest
+from marshmallow import ValidationError
+
+from renku.core import errors
+from renku.ui.service.cache.models.job import USER_JOB_STATE_COMPLETED, USER_JOB_STATE_FAILED
+from renku.ui.service.controllers.graph_export import GraphExportCtrl
+from renku.ui.service.jobs.graph import graph_export_batch
+from renku.ui.service.serializers.graph import GraphExportBatchRequest
+
+
+@pytest.mark.service
+@pytest.mark.jobs
+def test_graph_export_batch(svc_client_cache, view_user_data, monkeypatch):
+    """Test batch graph export sends graphs of projects to the callback and reports failures and timing per project."""
+    _, _, cache = svc_client_cache
+
+    def execute_op(self):
+        if self.context["git_url"].endswith("broken"):
+            raise errors.RenkuException("Cannot export graph")
+        assert "https://example.com/callback" == self.context["callback_url"]
+        return f"graph of {self.context['git_url']}"
+
+    monkeypatch.setattr(GraphExportCtrl, "execute_op", execute_op)
+
+    user = cache.ensure_user(view_user_data)
+    job = cache.make_job(user, job_data={"renku_op": "graph_export_batch"})
+    projects = [{"git_url": "https://example.com/renku/project"}, {"git_url": "https://example.com/renku/broken"}]
+    context = GraphExportBatchRequest().load({"projects": projects, "callback_url": "https://example.com/callback"})
+
+    graph_export_batch(view_user_data, job.job_id, context["projects"], context["callback_url"])
+
+    job = cache.get_job(user, job.job_id)
+    assert USER_JOB_STATE_COMPLETED == job.state
+
+    exported, broken = job.extras["projects"]
+    assert USER_JOB_STATE_COMPLETED == exported["state"]
+    assert USER_JOB_STATE_FAILED == broken["state"]
+    assert "Cannot export graph" == broken["error"]
+    assert exported["duration"] >= 0 and broken["duration"] >= 0
+
+
+def test_graph_export_batch_requires_callback_url():
+    """Test batch graph exports need a callback URL since the service doesn't store exported graphs."""
+    with pytest.raises(ValidationError):
+        GraphExportBatchRequest().load({"projects": [{"git_url": "https://example.com/renku/project"}]})
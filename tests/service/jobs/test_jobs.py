@@ -17,6 +17,7 @@
 import io
 import os
 import uuid
+from datetime import datetime, timedelta
 
 import pytest
 
@@ -123,3 +124,63 @@ def test_job_constructor_lock(svc_client_with_user, service_job):
     assert project.project_id == job.project_id
     assert user.user_id == job.user_id
     assert project.project_id in {_id.decode("utf-8") for _id in job.locked.members()}
+
+
+@pytest.mark.service
+@pytest.mark.jobs
+def test_cache_projects_refresh(mock_redis, mocker):
+    """Test recently accessed projects that weren't fetched for a while are refreshed."""
+    from renku.ui.service.cache.models.project import Project
+    from renku.ui.service.gateways.repository_cache import LocalRepositoryCache
+    from renku.ui.service.jobs import project_cache
+
+    now = datetime.utcnow()
+
+    def make_project(name, fetched, accessed, commit_sha=""):
+        Project(
+            project_id=name,
+            user_id="user",
+            git_url=name,
+            name=name,
+            commit_sha=commit_sha,
+            initialized=True,
+            last_fetched_at=now - timedelta(seconds=fetched),
+            accessed_at=now - timedelta(seconds=accessed),
+        ).save()
+
+    make_project("due", fetched=project_cache.PROJECT_REFRESH_MIN_FETCH_AGE + 5, accessed=5)
+    make_project("fresh", fetched=1, accessed=5)
+    make_project("not-accessed", fetched=project_cache.PROJECT_REFRESH_MIN_FETCH_AGE + 5, accessed=3600)
+    make_project("detached", fetched=project_cache.PROJECT_REFRESH_MIN_FETCH_AGE + 5, accessed=5, commit_sha="abc")
+    all_projects = mocker.spy(Project, "all")
+    refresh = mocker.patch.object(LocalRepositoryCache, "refresh", return_value=True)
+    schedule = mocker.patch.object(project_cache, "schedule_projects_refresh")
+
+    project_cache.cache_projects_refresh()
+
+    assert ["due"] == [c.args[0].project_id for c in refresh.call_args_list]
+    assert refresh.call_args.kwargs["blocking"] is False
+    assert refresh.call_args.kwargs["min_fetch_age"] == project_cache.PROJECT_REFRESH_MIN_FETCH_AGE
+    all_projects.assert_not_called()
+    schedule.assert_called_once_with(delay=project_cache.PROJECT_REFRESH_INTERVAL, force=True)
+
+
+@pytest.mark.service
+@pytest.mark.jobs
+def test_warm_up_project(fake_home, mocker, tmp_path):
+    """Test projects of the warm-up list are mirrored into the seeds cache."""
+    from renku.infrastructure.repository import Repository
+    from renku.ui.service.gateways import repository_cache
+
+    source = Repository.initialize(tmp_path / "owner" / "project")
+    (tmp_path / "owner" / "project" / "file").write_text("content")
+    source.add(all=True)
+    source.commit("initial", no_verify=True)
+    mocker.patch.object(repository_cache, "CACHE_SEEDS_PATH", tmp_path / "seeds")
+    git_url = f"file://{tmp_path}/owner/project"
+
+    repository_cache.LocalRepositoryCache().warm_up(git_url)
+
+    seed_path = repository_cache.get_seed_path(git_url)
+    assert (seed_path / "HEAD").exists()
+    assert source.head.commit.hexsha == Repository(seed_path).get_commit("HEAD").hexsha
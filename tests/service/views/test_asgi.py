@@ -0,0 +1,126 @@
+# Copyright Swiss Data Science Center (SDSC). A partnership between
+# École Polytechnique Fédérale de Lausanne (EPFL) and
+# Eidgenössische Technische Hochschule Zürich (ETHZ).
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+"""Renku service ASGI adapter tests."""
+import asyncio
+import json
+import threading
+
+import pytest
+from flask import Flask, jsonify, request
+
+from renku.ui.service.asgi import RequestPool, ServiceASGIApp
+from renku.ui.service.errors import IntermittentServiceBusyError
+
+
+async def call(app, method, path, body=b""):
+    """Send a request to an ASGI app and return response's status and body."""
+    messages = [{"type": "http.request", "body": body, "more_body": False}]
+    sent = []
+
+    async def receive():
+        return messages.pop(0) if messages else {"type": "http.disconnect"}
+
+    async def send(message):
+        sent.append(message)
+
+    scope = {
+        "type": "http",
+        "method": method,
+        "path": path,
+        "query_string": b"a=1",
+        "headers": [(b"content-type", b"application/json"), (b"x-custom", b"value")],
+    }
+    await app(scope, receive, send)
+
+    return sent[0]["status"], b"".join(m.get("body", b"") for m in sent[1:])
+
+
+@pytest.fixture
+def asgi_app():
+    """An ASGI app with a slow and a lightweight endpoint."""
+    release = threading.Event()
+    flask_app = Flask(__name__)
+
+    @flask_app.route("/datasets.list")
+    def slow():
+        release.wait(timeout=10)
+        return jsonify({"result": "slow"})
+
+    @flask_app.route("/1.0/jobs", methods=["POST"])
+    def jobs():
+        return jsonify({"body": request.get_json(), "args": request.args, "header": request.headers.get("X-Custom")})
+
+    app = ServiceASGIApp(
+        flask_app,
+        offload_pool=RequestPool("test-offload", max_workers=1, max_queue=1),
+        lightweight_pool=RequestPool("test-lightweight", max_workers=1, max_queue=1),
+    )
+
+    yield app, release
+
+    release.set()
+
+
+def test_asgi_lightweight_requests_do_not_wait_for_offload_pool(asgi_app):
+    """Test lightweight requests are served while repository operations block the offload pool."""
+    app, release = asgi_app
+
+    async def run():
+        running = asyncio.ensure_future(call(app, "GET", "/datasets.list"))
+        queued = asyncio.ensure_future(call(app, "GET", "/datasets.list"))
+        await asyncio.sleep(0.1)
+
+        assert 1 == app.offload_pool.in_flight
+        assert 1 == app.offload_pool.queue_depth
+
+        status, body = await call(app, "POST", "/1.0/jobs", body=b'{"key": "value"}')
+
+        assert 200 == status
+        assert {"body": {"key": "value"}, "args": {"a": "1"}, "header": "value"} == json.loads(body)
+        assert not running.done() and not queued.done()
+
+        status, body = await call(app, "GET", "/datasets.list")
+
+        assert 503 == status
+        assert IntermittentServiceBusyError.code == json.loads(body)["error"]["code"]
+
+        release.set()
+
+        return await asyncio.gather(running, queued)
+
+    results = asyncio.run(run())
+
+    assert [(200, b'{"result":"slow"}\n')] * 2 == results
+    assert 0 == app.offload_pool.in_flight
+    assert 0 == app.offload_pool.queue_depth
+
+
+@pytest.mark.parametrize(
+    "path, pool",
+    [
+        ("/cache.files_list", "lightweight"),
+        ("/2.2/jobs/1234", "lightweight"),
+        ("/health", "lightweight"),
+        ("/", "lightweight"),
+        ("/cache.project_clone", "offload"),
+        ("/2.2/templates.read_manifest", "offload"),
+    ],
+)
+def test_asgi_pool_selection(path, pool):
+    """Test requests are dispatched to the expected pool."""
+    app = ServiceASGIApp(Flask(__name__))
+
+    assert pool == app.get_pool(path).name